@@ -0,0 +1,27 @@
+"""Засев водяного знака бенчмарков на текущий максимум снапшотов.
+
+Крон refresh_new_snapshots обрабатывает снапшоты с id выше
+`estate_kit.benchmark_snapshot_id`. Без засева первый запуск после
+обновления прошёл бы по всей истории снапшотов; уже существующие строки
+учтены в бенчмарках при создании и повторной обработки не требуют.
+"""
+
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+def migrate(cr, version):
+    if not version:
+        return
+
+    cr.execute(
+        """
+        INSERT INTO ir_config_parameter (key, value, create_uid, create_date, write_uid, write_date)
+        SELECT 'estate_kit.benchmark_snapshot_id', COALESCE(max(id), 0)::text,
+               1, now() at time zone 'UTC', 1, now() at time zone 'UTC'
+        FROM estate_market_snapshot
+        ON CONFLICT (key) DO NOTHING
+        """
+    )
+    _logger.info("Водяной знак бенчмарков засеян: %s", "да" if cr.rowcount else "уже задан")
@@ -54,6 +54,39 @@ class ResConfigSettings(models.TransientModel):
         string="Модель Anthropic",
         config_parameter="estate_kit.anthropic_model",
     )
+    estate_kit_anthropic_requests_per_minute = fields.Integer(
+        string="Лимит запросов в минуту",
+        config_parameter="estate_kit.anthropic_requests_per_minute",
+        default=50,
+        help="Сколько запросов к Anthropic API можно отправлять в минуту. "
+             "При ответах с заголовками rate-limit клиент дополнительно притормаживает.",
+    )
+    estate_kit_scoring_parallelism = fields.Integer(
+        string="Потоков AI-скоринга",
+        config_parameter="estate_kit.scoring_parallelism",
+        default=1,
+        help="Сколько объектов пересчитывается параллельно при обновлении устаревшего скоринга. "
+             "По умолчанию 1 — последовательный расчёт; больше 1 включает параллельные потоки.",
+    )
+    estate_kit_scoring_use_batch_api = fields.Boolean(
+        string="Пакетный AI-скоринг",
+        config_parameter="estate_kit.scoring_use_batch_api",
+        help="Устаревший скоринг пула отправляется одним пакетом через Message Batches API. "
+             "Результаты применяются фоновой задачей по мере готовности пакета.",
+    )
+    estate_kit_scoring_cache_ttl_days = fields.Integer(
+        string="Срок жизни кэша AI-скоринга (дней)",
+        config_parameter="estate_kit.scoring_cache_ttl_days",
+        default=30,
+        help="Если данные объекта не изменились с прошлого скоринга, оценка берётся из кэша "
+             "без запроса к API. 0 — кэш отключён.",
+    )
+    estate_kit_scoring_cache_max_entries = fields.Integer(
+        string="Размер кэша AI-скоринга",
+        config_parameter="estate_kit.scoring_cache_max_entries",
+        default=5000,
+        help="Максимум записей в кэше. Сверх лимита удаляются давно не использованные.",
+    )
     estate_kit_is_registered = fields.Boolean(
         string="Зарегистрирован",
         compute="_compute_is_registered",
@@ -0,0 +1 @@
+from . import market_trend
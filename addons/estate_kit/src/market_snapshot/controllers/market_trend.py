@@ -0,0 +1,59 @@
+from odoo import http
+from odoo.http import Response, request
+
+from ..services.market_trend import Factory as MarketTrendFactory
+
+
+class MarketTrendController(http.Controller):
+    @http.route("/estate_kit/market/trend", type="jsonrpc", auth="user")
+    def market_trend(self, city_id, district_id=None, property_type="apartment", rooms=None,
+                     granularity="month", periods=12):
+        service = MarketTrendFactory.create(request.env)
+        try:
+            points = service.series(city_id, district_id, property_type, rooms, granularity, periods)
+        except ValueError as e:
+            return {"error": str(e)}
+        return {"granularity": granularity, "points": [point.as_dict() for point in points]}
+
+    @http.route("/estate_kit/market/trend/batch", type="jsonrpc", auth="user")
+    def market_trend_batch(self, slices, granularity="month", periods=12):
+        service = MarketTrendFactory.create(request.env)
+        keys = [
+            service.normalize_slice(
+                item["city_id"],
+                item.get("district_id"),
+                item.get("property_type", "apartment"),
+                item.get("rooms"),
+            )
+            for item in slices
+        ]
+        try:
+            series = service.series_many(keys, granularity, periods)
+        except ValueError as e:
+            return {"error": str(e)}
+        return {
+            "granularity": granularity,
+            "series": [
+                {
+                    "city_id": key[0],
+                    "district_id": key[1],
+                    "property_type": key[2],
+                    "rooms": key[3],
+                    "points": [point.as_dict() for point in series[key]],
+                }
+                for key in keys
+            ],
+        }
+
+    @http.route("/estate_kit/market/trend/export.csv", type="http", auth="user", methods=["GET"])
+    def market_trend_export(self, granularity="month", periods="12"):
+        service = MarketTrendFactory.create(request.env)
+        try:
+            body = service.export_csv(granularity, int(periods))
+        except ValueError:
+            raise request.not_found()
+        return Response(
+            body,
+            content_type="text/csv; charset=utf-8",
+            headers=[("Content-Disposition", 'attachment; filename="market_trend_%s.csv"' % granularity)],
+        )
@@ -1 +1,6 @@
-from . import estate_market_snapshot, estate_market_snapshot_config
+from . import (
+    estate_market_benchmark,
+    estate_market_snapshot,
+    estate_market_snapshot_config,
+    estate_market_snapshot_monthly,
+)
@@ -0,0 +1,73 @@
+from odoo import api, fields, models
+
+from ..services.benchmark_resolver import Factory as BenchmarkResolverFactory
+from ..services.benchmark_resolver.benchmark_cache import invalidate_benchmark_cache
+
+
+class EstateMarketBenchmark(models.Model):
+    _name = "estate.market.benchmark"
+    _description = "Агрегированный бенчмарк рынка"
+    _order = "city_id, district_id, property_type, rooms"
+
+    city_id = fields.Many2one(
+        "estate.city",
+        string="Город",
+        required=True,
+        ondelete="cascade",
+    )
+    district_id = fields.Many2one(
+        "estate.district",
+        string="Район",
+        ondelete="cascade",
+        help="Пусто — срез по всему городу",
+    )
+    property_type = fields.Selection(
+        [
+            ("apartment", "Квартира"),
+            ("house", "Дом"),
+            ("townhouse", "Таунхаус"),
+            ("commercial", "Коммерция"),
+            ("land", "Земля"),
+        ],
+        string="Тип объекта",
+        required=True,
+    )
+    rooms = fields.Integer(string="Комнат", help="0 — все комнаты")
+    window_days = fields.Integer(string="Окно (дней)", required=True)
+
+    sample_size = fields.Integer(
+        string="Размер выборки",
+        help="0 — выборки недостаточно для агрегата",
+    )
+    median_price_per_sqm = fields.Float(string="Медиана цены за м²", digits=(16, 2))
+    p25_price_per_sqm = fields.Float(string="P25 цены за м²", digits=(16, 2))
+    p75_price_per_sqm = fields.Float(string="P75 цены за м²", digits=(16, 2))
+    latest_snapshot_id = fields.Many2one(
+        "estate.market.snapshot",
+        string="Последний снапшот",
+        ondelete="cascade",
+    )
+    valid_until = fields.Datetime(
+        string="Актуален до",
+        help="Когда старейший снапшот выборки выйдет из окна; пусто — до нового снапшота",
+    )
+    computed_at = fields.Datetime(string="Рассчитан", required=True)
+
+    def init(self):
+        self.env.cr.execute(
+            """
+            CREATE UNIQUE INDEX IF NOT EXISTS estate_market_benchmark_slice_uniq
+            ON estate_market_benchmark
+                (city_id, (COALESCE(district_id, 0)), property_type, rooms)
+            """
+        )
+
+    @api.model
+    def _cron_refresh_benchmarks(self):
+        refreshed = BenchmarkResolverFactory.create_materializer(self.env).refresh_new_snapshots()
+        if not refreshed:
+            return
+        invalidate_benchmark_cache(self.env)
+        cron = self.env.ref("estate_kit.cron_refresh_price_scores", raise_if_not_found=False)
+        if cron:
+            cron.sudo()._trigger()
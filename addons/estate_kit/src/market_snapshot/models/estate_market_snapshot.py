@@ -1,4 +1,8 @@
-from odoo import fields, models
+from odoo import api, fields, models
+
+from ..services.benchmark_resolver import Factory as BenchmarkResolverFactory
+from ..services.benchmark_resolver.benchmark_cache import invalidate_benchmark_cache
+from ..services.market_trend import invalidate_trend_cache
 
 
 class EstateMarketSnapshot(models.Model):
@@ -71,6 +75,26 @@ class EstateMarketSnapshot(models.Model):
         ),
     ]
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        # samples_per_sqm/samples_sketch — колонки без ORM-полей (создаются в init):
+        # сэмплы чистятся от выбросов и сжимаются в скетч, статистика пересчитывается
+        samples = [vals.pop("samples_per_sqm", None) for vals in vals_list]
+        records = super().create(vals_list)
+        records.flush_recordset()
+        sample_writer = BenchmarkResolverFactory.create_sample_writer(self.env)
+        for record, record_samples in zip(records, samples):
+            if record_samples:
+                sample_writer.write(record.id, list(record_samples))
+        BenchmarkResolverFactory.create_materializer(self.env).refresh_for_snapshots(records)
+        invalidate_benchmark_cache(self.env)
+        dbname = self.env.cr.dbname
+        self.env.cr.postcommit.add(lambda: invalidate_trend_cache(dbname))
+        cron = self.env.ref("estate_kit.cron_refresh_price_scores", raise_if_not_found=False)
+        if cron:
+            cron.sudo()._trigger()
+        return records
+
     def init(self):
         self.env.cr.execute(
             """
@@ -78,6 +102,12 @@ class EstateMarketSnapshot(models.Model):
             ADD COLUMN IF NOT EXISTS samples_per_sqm double precision[]
             """
         )
+        self.env.cr.execute(
+            """
+            ALTER TABLE estate_market_snapshot
+            ADD COLUMN IF NOT EXISTS samples_sketch double precision[]
+            """
+        )
         self.env.cr.execute(
             """
             CREATE INDEX IF NOT EXISTS estate_market_snapshot_lookup_idx
@@ -1,4 +1,6 @@
-from odoo import fields, models
+from odoo import api, fields, models
+
+from ..services.snapshot_collector import Factory as SnapshotCollectorFactory
 
 
 class EstateMarketSnapshotConfig(models.Model):
@@ -50,3 +52,7 @@ class EstateMarketSnapshotConfig(models.Model):
             "Количество страниц должно быть положительным.",
         ),
     ]
+
+    @api.model
+    def _cron_collect_snapshots(self):
+        SnapshotCollectorFactory.create(self.env).collect()
@@ -0,0 +1,60 @@
+from odoo import api, fields, models
+
+from ..services.snapshot_retention import Factory as SnapshotRetentionFactory
+
+
+class EstateMarketSnapshotMonthly(models.Model):
+    _name = "estate.market.snapshot.monthly"
+    _description = "Месячный агрегат снапшотов рынка"
+    _order = "month desc, city_id, district_id, property_type, rooms"
+
+    city_id = fields.Many2one(
+        "estate.city",
+        string="Город",
+        required=True,
+        ondelete="cascade",
+    )
+    district_id = fields.Many2one(
+        "estate.district",
+        string="Район",
+        ondelete="cascade",
+        help="Пусто — срез по всему городу",
+    )
+    property_type = fields.Selection(
+        [
+            ("apartment", "Квартира"),
+            ("house", "Дом"),
+            ("townhouse", "Таунхаус"),
+            ("commercial", "Коммерция"),
+            ("land", "Земля"),
+        ],
+        string="Тип объекта",
+        required=True,
+    )
+    rooms = fields.Integer(string="Комнат", help="0 — агрегат по всем комнатам")
+    month = fields.Date(string="Месяц", required=True, help="Первое число месяца")
+
+    snapshot_count = fields.Integer(string="Снапшотов свёрнуто")
+    sample_size = fields.Integer(string="Размер выборки")
+    median_price_per_sqm = fields.Float(string="Медиана цены за м²", digits=(16, 2))
+    p25_price_per_sqm = fields.Float(string="P25 цены за м²", digits=(16, 2))
+    p75_price_per_sqm = fields.Float(string="P75 цены за м²", digits=(16, 2))
+
+    def init(self):
+        self.env.cr.execute(
+            """
+            ALTER TABLE estate_market_snapshot_monthly
+            ADD COLUMN IF NOT EXISTS samples_sketch double precision[]
+            """
+        )
+        self.env.cr.execute(
+            """
+            CREATE UNIQUE INDEX IF NOT EXISTS estate_market_snapshot_monthly_slice_uniq
+            ON estate_market_snapshot_monthly
+                (city_id, (COALESCE(district_id, 0)), property_type, rooms, month)
+            """
+        )
+
+    @api.model
+    def _cron_rollup_snapshots(self):
+        SnapshotRetentionFactory.create(self.env).rollup()
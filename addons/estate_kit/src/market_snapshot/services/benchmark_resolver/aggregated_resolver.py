@@ -1,17 +1,16 @@
-from .protocols import ISampleAggregator, ISnapshotLookup
+from .market_slice import MarketSlice
+from .protocols import IBenchmarkMaterializer, IBenchmarkStore
 from .protocols.i_aggregated_resolver import AggregatedResult
 
 
 class AggregatedResolver:
     def __init__(
         self,
-        lookup: ISnapshotLookup,
-        aggregator: ISampleAggregator,
-        snapshots_limit: int,
+        store: IBenchmarkStore,
+        materializer: IBenchmarkMaterializer,
     ) -> None:
-        self._lookup = lookup
-        self._aggregator = aggregator
-        self._snapshots_limit = snapshots_limit
+        self._store = store
+        self._materializer = materializer
 
     def resolve(
         self,
@@ -21,17 +20,20 @@ class AggregatedResolver:
         rooms: int | None,
         max_age_days: int,
     ) -> AggregatedResult | None:
-        groups = self._lookup.find_recent_samples(
-            city_id=city_id,
-            district_id=district_id,
-            property_type=property_type,
-            rooms=rooms,
-            max_age_days=max_age_days,
-            limit=self._snapshots_limit,
-        )
-        if not groups:
-            return None
-        stats = self._aggregator.aggregate([samples for _, samples in groups])
-        if stats is None:
-            return None
-        return AggregatedResult(stats=stats, latest_snapshot_id=groups[0][0])
+        stored = self._store.fetch(city_id, district_id, property_type, rooms, max_age_days)
+        if stored is not None:
+            return stored.result
+        return self._materializer.materialize(city_id, district_id, property_type, rooms)
+
+    def resolve_many(
+        self,
+        slices: list[MarketSlice],
+        max_age_days: int,
+    ) -> dict[MarketSlice, AggregatedResult | None]:
+        stored = self._store.fetch_many(slices, max_age_days)
+        # Недостающие и протухшие срезы пересчитываются одним проходом, а не запросом на каждый
+        materialized = self._materializer.materialize_many([key for key in slices if key not in stored])
+        return {
+            key: stored[key].result if key in stored else materialized[key]
+            for key in slices
+        }
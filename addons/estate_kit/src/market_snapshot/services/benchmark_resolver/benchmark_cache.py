@@ -0,0 +1,91 @@
+import threading
+import time
+
+from .benchmark import MarketBenchmark
+
+# (city_id, district_id, нормализованный тип, rooms, окно в днях)
+SliceKey = tuple[int, int | None, str, int | None, int]
+
+# Поколение кэша общее для всех воркеров: словарь живёт в процессе, а сброс должен дойти до каждого
+_GENERATION_PARAM = "estate_kit.benchmark_cache_generation"
+
+
+class BenchmarkCache:
+    def __init__(self, ttl_seconds: float) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._entries: dict[SliceKey, tuple[float, MarketBenchmark | None]] = {}
+        self._generation: str | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def ttl_seconds(self) -> float:
+        return self._ttl_seconds
+
+    def get(self, key: SliceKey) -> tuple[bool, MarketBenchmark | None]:
+        if self._ttl_seconds <= 0:
+            return False, None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, benchmark = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return False, None
+            return True, benchmark
+
+    def put(self, key: SliceKey, benchmark: MarketBenchmark | None) -> None:
+        if self._ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl_seconds, benchmark)
+
+    def sync(self, generation: str) -> None:
+        with self._lock:
+            if generation != self._generation:
+                self._entries.clear()
+                self._generation = generation
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class BenchmarkCacheGeneration:
+    def __init__(self, env) -> None:
+        self._env = env
+
+    def current(self) -> str:
+        # get_param закэширован в реестре, а set_param рассылает сброс реестра остальным воркерам
+        return self._env["ir.config_parameter"].sudo().get_param(_GENERATION_PARAM, "0")
+
+    def bump(self) -> None:
+        self._env["ir.config_parameter"].sudo().set_param(_GENERATION_PARAM, str(int(self.current() or 0) + 1))
+
+
+_caches: dict[str, BenchmarkCache] = {}
+_caches_lock = threading.Lock()
+
+
+def shared_benchmark_cache(dbname: str, ttl_seconds: float) -> BenchmarkCache:
+    with _caches_lock:
+        cache = _caches.get(dbname)
+        if cache is None or cache.ttl_seconds != ttl_seconds:
+            cache = BenchmarkCache(ttl_seconds)
+            _caches[dbname] = cache
+        return cache
+
+
+def invalidate_benchmark_cache(env) -> None:
+    BenchmarkCacheGeneration(env).bump()
+    dbname = env.cr.dbname
+    _invalidate_local(dbname)
+    # Поток этого же процесса мог закэшировать данные до коммита уже под новым поколением
+    env.cr.postcommit.add(lambda: _invalidate_local(dbname))
+
+
+def _invalidate_local(dbname: str) -> None:
+    with _caches_lock:
+        cache = _caches.get(dbname)
+    if cache is not None:
+        cache.invalidate()
@@ -0,0 +1,169 @@
+from datetime import datetime, timedelta
+
+from .market_slice import MarketSlice
+from .protocols import (
+    AggregatedResult,
+    IBenchmarkStore,
+    ISampleAggregator,
+    ISnapshotLookup,
+    ISnapshotSampleWriter,
+    QuantileSketch,
+)
+
+_WATERMARK_PARAM = "estate_kit.benchmark_snapshot_id"
+# Первый снапшот, который разрешено сжать в скетч: режим sketch не трогает строки, записанные до его включения
+_SKETCH_SINCE_PARAM = "estate_kit.snapshot_sketch_since_id"
+
+
+class BenchmarkMaterializer:
+    def __init__(
+        self,
+        lookup: ISnapshotLookup,
+        aggregator: ISampleAggregator,
+        store: IBenchmarkStore,
+        sample_writer: ISnapshotSampleWriter,
+        snapshots_limit: int,
+        window_days: int,
+        sql_percentiles: bool,
+        sample_storage: str,
+        env,
+    ) -> None:
+        self._lookup = lookup
+        self._aggregator = aggregator
+        self._store = store
+        self._sample_writer = sample_writer
+        self._snapshots_limit = snapshots_limit
+        self._window_days = window_days
+        self._sql_percentiles = sql_percentiles
+        self._sample_storage = sample_storage
+        self._env = env
+
+    def materialize(
+        self,
+        city_id: int,
+        district_id: int | None,
+        property_type: str,
+        rooms: int | None,
+    ) -> AggregatedResult | None:
+        key = (city_id, district_id, property_type, rooms)
+        return self.materialize_many([key])[key]
+
+    def materialize_many(
+        self,
+        slices: list[MarketSlice],
+    ) -> dict[MarketSlice, AggregatedResult | None]:
+        if not slices:
+            return {}
+        slices = list(dict.fromkeys(slices))
+        if self._sample_storage == "sketch":
+            rows = self._aggregate_sketches(slices)
+        elif self._sql_percentiles:
+            rows = self._aggregate_in_sql(slices)
+        else:
+            rows = self._aggregate_in_python(slices)
+        self._store.upsert_many(rows, self._window_days)
+        return {key: result for key, (result, _) in rows.items()}
+
+    def _aggregate_in_sql(
+        self,
+        slices: list[MarketSlice],
+    ) -> dict[MarketSlice, tuple[AggregatedResult | None, datetime | None]]:
+        summaries = self._lookup.summarize_recent_samples_many(
+            slices, max_age_days=self._window_days, limit=self._snapshots_limit,
+        )
+        rows: dict[MarketSlice, tuple[AggregatedResult | None, datetime | None]] = {}
+        for key in slices:
+            summary = summaries.get(key)
+            if summary is None or not self._aggregator.meets_minimum(summary.stats.sample_size):
+                rows[key] = (None, None)
+                continue
+            rows[key] = (
+                AggregatedResult(stats=summary.stats, latest_snapshot_id=summary.latest_snapshot_id),
+                summary.oldest_collected_at + timedelta(days=self._window_days),
+            )
+        return rows
+
+    def _aggregate_in_python(
+        self,
+        slices: list[MarketSlice],
+    ) -> dict[MarketSlice, tuple[AggregatedResult | None, datetime | None]]:
+        found = self._lookup.find_recent_samples_many(
+            slices, max_age_days=self._window_days, limit=self._snapshots_limit,
+        )
+        rows: dict[MarketSlice, tuple[AggregatedResult | None, datetime | None]] = {}
+        for key in slices:
+            groups = found.get(key)
+            stats = self._aggregator.aggregate([samples for _, _, samples in groups]) if groups else None
+            if stats is None:
+                rows[key] = (None, None)
+                continue
+            rows[key] = (
+                AggregatedResult(stats=stats, latest_snapshot_id=groups[0][0]),
+                min(collected_at for _, collected_at, _ in groups) + timedelta(days=self._window_days),
+            )
+        return rows
+
+    def _aggregate_sketches(
+        self,
+        slices: list[MarketSlice],
+    ) -> dict[MarketSlice, tuple[AggregatedResult | None, datetime | None]]:
+        found = self._lookup.find_recent_sketches_many(
+            slices, max_age_days=self._window_days, limit=self._snapshots_limit,
+        )
+        rows: dict[MarketSlice, tuple[AggregatedResult | None, datetime | None]] = {}
+        for key in slices:
+            snapshots = found.get(key)
+            if not snapshots:
+                rows[key] = (None, None)
+                continue
+            sketches = [
+                QuantileSketch(weight=sample_size, points=list(sketch))
+                if sketch
+                else self._aggregator.build_sketch(sorted(raw_samples))
+                for _, _, sample_size, sketch, raw_samples in snapshots
+            ]
+            stats = self._aggregator.aggregate_sketches(sketches)
+            if stats is None:
+                rows[key] = (None, None)
+                continue
+            rows[key] = (
+                AggregatedResult(stats=stats, latest_snapshot_id=snapshots[0][0]),
+                min(collected_at for _, collected_at, *_ in snapshots) + timedelta(days=self._window_days),
+            )
+        return rows
+
+    def refresh_for_snapshots(self, snapshots) -> None:
+        slices: set[MarketSlice] = set()
+        for snapshot in snapshots:
+            city_id = snapshot.city_id.id
+            district_id = snapshot.district_id.id or None
+            slices.add((city_id, district_id, snapshot.property_type, None))
+            if snapshot.rooms:
+                slices.add((city_id, district_id, snapshot.property_type, snapshot.rooms))
+        # Стабильный порядок строк upsert — параллельные пересчёты не блокируют друг друга крест-накрест
+        self.materialize_many(sorted(slices, key=str))
+
+    def refresh_new_snapshots(self) -> int:
+        get_param = self._env["ir.config_parameter"].sudo().get_param
+        watermark = int(get_param(_WATERMARK_PARAM, "0") or 0)
+        snapshots = self._env["estate.market.snapshot"].search(
+            [("id", ">", watermark)], order="id",
+        )
+        if not snapshots:
+            return 0
+        self._sample_writer.compact_pending(self._compactable_ids(snapshots.ids))
+        self.refresh_for_snapshots(snapshots)
+        self._env["ir.config_parameter"].sudo().set_param(_WATERMARK_PARAM, str(snapshots.ids[-1]))
+        return len(snapshots)
+
+    def _compactable_ids(self, snapshot_ids: list[int]) -> list[int]:
+        if self._sample_storage != "sketch":
+            # raw только добавляет скетч, сэмплы и статистика строки не меняются
+            return snapshot_ids
+        config = self._env["ir.config_parameter"].sudo()
+        since_id = config.get_param(_SKETCH_SINCE_PARAM)
+        if since_id is None:
+            self._env.cr.execute("SELECT COALESCE(max(id), 0) FROM estate_market_snapshot")
+            since_id = self._env.cr.fetchone()[0]
+            config.set_param(_SKETCH_SINCE_PARAM, str(since_id))
+        return [snapshot_id for snapshot_id in snapshot_ids if snapshot_id > int(since_id)]
@@ -0,0 +1,160 @@
+from datetime import datetime
+
+from .market_slice import MarketSlice
+from .protocols import AggregatedResult, AggregatedStats, StoredBenchmark
+
+
+class BenchmarkStore:
+    def __init__(self, env) -> None:
+        self._env = env
+
+    def fetch(
+        self,
+        city_id: int,
+        district_id: int | None,
+        property_type: str,
+        rooms: int | None,
+        window_days: int,
+    ) -> StoredBenchmark | None:
+        self._env.cr.execute(
+            """
+            SELECT sample_size, median_price_per_sqm, p25_price_per_sqm,
+                   p75_price_per_sqm, latest_snapshot_id
+            FROM estate_market_benchmark
+            WHERE city_id = %s
+              AND COALESCE(district_id, 0) = %s
+              AND property_type = %s
+              AND rooms = %s
+              AND window_days = %s
+              AND (valid_until IS NULL OR valid_until > now() at time zone 'UTC')
+            """,
+            [city_id, district_id or 0, property_type, rooms or 0, window_days],
+        )
+        row = self._env.cr.fetchone()
+        if row is None:
+            return None
+        return StoredBenchmark(result=_to_result(row))
+
+    def fetch_many(
+        self,
+        slices: list[MarketSlice],
+        window_days: int,
+    ) -> dict[MarketSlice, StoredBenchmark]:
+        if not slices:
+            return {}
+        self._env.cr.execute(
+            """
+            SELECT v.city_id, v.district_id, v.property_type, v.rooms,
+                   b.sample_size, b.median_price_per_sqm, b.p25_price_per_sqm,
+                   b.p75_price_per_sqm, b.latest_snapshot_id
+            FROM unnest(%s::int[], %s::int[], %s::varchar[], %s::int[])
+                AS v(city_id, district_id, property_type, rooms)
+            JOIN estate_market_benchmark b
+              ON b.city_id = v.city_id
+             AND COALESCE(b.district_id, 0) = v.district_id
+             AND b.property_type = v.property_type
+             AND b.rooms = v.rooms
+            WHERE b.window_days = %s
+              AND (b.valid_until IS NULL OR b.valid_until > now() at time zone 'UTC')
+            """,
+            [
+                [key[0] for key in slices],
+                [key[1] or 0 for key in slices],
+                [key[2] for key in slices],
+                [key[3] or 0 for key in slices],
+                window_days,
+            ],
+        )
+        return {
+            (row[0], row[1] or None, row[2], row[3] or None): StoredBenchmark(result=_to_result(row[4:]))
+            for row in self._env.cr.fetchall()
+        }
+
+    def upsert(
+        self,
+        city_id: int,
+        district_id: int | None,
+        property_type: str,
+        rooms: int | None,
+        window_days: int,
+        result: AggregatedResult | None,
+        valid_until: datetime | None,
+    ) -> None:
+        self.upsert_many(
+            {(city_id, district_id, property_type, rooms): (result, valid_until)}, window_days,
+        )
+
+    def upsert_many(
+        self,
+        rows: dict[MarketSlice, tuple[AggregatedResult | None, datetime | None]],
+        window_days: int,
+    ) -> None:
+        if not rows:
+            return
+        # Срезы с district/rooms = None и 0 совпадают по ключу конфликта — дубль сломал бы ON CONFLICT
+        unique: dict[tuple[int, int, str, int], tuple[AggregatedResult | None, datetime | None]] = {}
+        for (city_id, district_id, property_type, rooms), row in rows.items():
+            unique[(city_id, district_id or 0, property_type, rooms or 0)] = row
+        columns: list[list] = [[] for _ in range(11)]
+        for key, (result, valid_until) in unique.items():
+            stats = result.stats if result is not None else None
+            values = (
+                *key,
+                window_days,
+                stats.sample_size if stats else 0,
+                stats.median_price_per_sqm if stats else 0.0,
+                stats.p25_price_per_sqm if stats else 0.0,
+                stats.p75_price_per_sqm if stats else 0.0,
+                result.latest_snapshot_id if result is not None else None,
+                valid_until,
+            )
+            for column, value in zip(columns, values):
+                column.append(value)
+        self._env.cr.execute(
+            """
+            INSERT INTO estate_market_benchmark
+                (city_id, district_id, property_type, rooms, window_days,
+                 sample_size, median_price_per_sqm, p25_price_per_sqm, p75_price_per_sqm,
+                 latest_snapshot_id, valid_until, computed_at,
+                 create_uid, create_date, write_uid, write_date)
+            SELECT v.city_id, NULLIF(v.district_id, 0), v.property_type, v.rooms, v.window_days,
+                   v.sample_size, v.median, v.p25, v.p75,
+                   v.latest_snapshot_id, v.valid_until,
+                   now() at time zone 'UTC',
+                   %s, now() at time zone 'UTC', %s, now() at time zone 'UTC'
+            FROM unnest(
+                %s::int[], %s::int[], %s::varchar[], %s::int[], %s::int[],
+                %s::int[], %s::float8[], %s::float8[], %s::float8[],
+                %s::int[], %s::timestamp[]
+            ) AS v(city_id, district_id, property_type, rooms, window_days,
+                   sample_size, median, p25, p75, latest_snapshot_id, valid_until)
+            ON CONFLICT (city_id, (COALESCE(district_id, 0)), property_type, rooms) DO UPDATE
+            SET window_days = EXCLUDED.window_days,
+                sample_size = EXCLUDED.sample_size,
+                median_price_per_sqm = EXCLUDED.median_price_per_sqm,
+                p25_price_per_sqm = EXCLUDED.p25_price_per_sqm,
+                p75_price_per_sqm = EXCLUDED.p75_price_per_sqm,
+                latest_snapshot_id = EXCLUDED.latest_snapshot_id,
+                valid_until = EXCLUDED.valid_until,
+                computed_at = EXCLUDED.computed_at,
+                write_uid = EXCLUDED.write_uid,
+                write_date = EXCLUDED.write_date
+            """,
+            [self._env.uid, self._env.uid, *columns],
+        )
+        self._env["estate.market.benchmark"].invalidate_model()
+
+
+def _to_result(row) -> AggregatedResult | None:
+    sample_size, median, p25, p75, latest_snapshot_id = row
+    if not sample_size or not latest_snapshot_id:
+        return None
+    return AggregatedResult(
+        stats=AggregatedStats(
+            sample_size=sample_size,
+            median_price_per_sqm=median,
+            p25_price_per_sqm=p25,
+            p75_price_per_sqm=p75,
+        ),
+        latest_snapshot_id=latest_snapshot_id,
+    )
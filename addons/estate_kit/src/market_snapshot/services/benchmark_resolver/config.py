@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Any
 
 
 @dataclass(frozen=True)
@@ -6,3 +7,17 @@ class BenchmarkResolverConfig:
     window_days: int = 30
     aggregation_snapshots_limit: int = 10
     min_aggregated_sample_size: int = 30
+    cache_ttl_seconds: int = 600
+    sql_percentiles: bool = True
+    sample_storage: str = "raw"
+    outlier_iqr_factor: float = 1.5
+
+    @classmethod
+    def from_env(cls, env: Any) -> "BenchmarkResolverConfig":
+        get_param = env["ir.config_parameter"].sudo().get_param
+        return cls(
+            cache_ttl_seconds=int(get_param("estate_kit.benchmark_cache_ttl_seconds", "600")),
+            sql_percentiles=get_param("estate_kit.benchmark_sql_percentiles", "True") == "True",
+            sample_storage=get_param("estate_kit.snapshot_sample_storage", "raw"),
+            outlier_iqr_factor=float(get_param("estate_kit.snapshot_outlier_iqr_factor", "1.5")),
+        )
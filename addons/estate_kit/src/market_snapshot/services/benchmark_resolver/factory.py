@@ -1,27 +1,61 @@
 from .aggregated_resolver import AggregatedResolver
+from .benchmark_cache import BenchmarkCacheGeneration, shared_benchmark_cache
+from .benchmark_materializer import BenchmarkMaterializer
+from .benchmark_store import BenchmarkStore
 from .config import BenchmarkResolverConfig
 from .property_type_normalizer import PropertyTypeNormalizer
 from .sample_aggregator import SampleAggregator
+from .sample_compactor import SampleCompactor
 from .service import BenchmarkResolverService
 from .snapshot_lookup import SnapshotLookup
+from .snapshot_sample_writer import SnapshotSampleWriter
 
 
 class Factory:
     @staticmethod
     def create(env) -> BenchmarkResolverService:
-        config = BenchmarkResolverConfig()
-        lookup = SnapshotLookup(env)
-        aggregator = SampleAggregator(
-            min_sample_size=config.min_aggregated_sample_size,
-        )
+        config = BenchmarkResolverConfig.from_env(env)
+        store = BenchmarkStore(env)
         aggregated_resolver = AggregatedResolver(
-            lookup=lookup,
-            aggregator=aggregator,
-            snapshots_limit=config.aggregation_snapshots_limit,
+            store=store,
+            materializer=Factory._materializer(env, config, store),
         )
         return BenchmarkResolverService(
-            lookup=lookup,
+            lookup=SnapshotLookup(env),
             aggregated_resolver=aggregated_resolver,
             property_type_normalizer=PropertyTypeNormalizer(),
             config=config,
+            cache=shared_benchmark_cache(env.cr.dbname, config.cache_ttl_seconds),
+            cache_generation=BenchmarkCacheGeneration(env),
+        )
+
+    @staticmethod
+    def create_materializer(env) -> BenchmarkMaterializer:
+        return Factory._materializer(env, BenchmarkResolverConfig.from_env(env), BenchmarkStore(env))
+
+    @staticmethod
+    def create_sample_writer(env) -> SnapshotSampleWriter:
+        return Factory._sample_writer(env, BenchmarkResolverConfig.from_env(env))
+
+    @staticmethod
+    def _materializer(env, config: BenchmarkResolverConfig, store: BenchmarkStore) -> BenchmarkMaterializer:
+        return BenchmarkMaterializer(
+            lookup=SnapshotLookup(env),
+            aggregator=SampleAggregator(min_sample_size=config.min_aggregated_sample_size),
+            store=store,
+            sample_writer=Factory._sample_writer(env, config),
+            snapshots_limit=config.aggregation_snapshots_limit,
+            window_days=config.window_days,
+            sql_percentiles=config.sql_percentiles,
+            sample_storage=config.sample_storage,
+            env=env,
+        )
+
+    @staticmethod
+    def _sample_writer(env, config: BenchmarkResolverConfig) -> SnapshotSampleWriter:
+        compactor = SampleCompactor(
+            aggregator=SampleAggregator(min_sample_size=config.min_aggregated_sample_size),
+            outlier_iqr_factor=config.outlier_iqr_factor,
+            keep_raw=config.sample_storage == "raw",
         )
+        return SnapshotSampleWriter(env, compactor)
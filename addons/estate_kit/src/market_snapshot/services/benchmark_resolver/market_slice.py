@@ -0,0 +1,2 @@
+# (city_id, district_id, property_type, rooms); None в district/rooms — без фильтра по полю
+MarketSlice = tuple[int, int | None, str, int | None]
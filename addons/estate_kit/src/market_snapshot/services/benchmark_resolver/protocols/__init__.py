@@ -1,17 +1,32 @@
 from .i_aggregated_resolver import AggregatedResult, IAggregatedResolver
+from .i_benchmark_cache import IBenchmarkCache, IBenchmarkCacheGeneration
+from .i_benchmark_materializer import IBenchmarkMaterializer
+from .i_benchmark_store import IBenchmarkStore, StoredBenchmark
 from .i_property_type_normalizer import IPropertyTypeNormalizer
-from .i_sample_aggregator import AggregatedStats, ISampleAggregator
-from .i_snapshot_lookup import ISnapshotLookup
+from .i_sample_aggregator import AggregatedStats, ISampleAggregator, QuantileSketch
+from .i_sample_compactor import CompactedSamples, ISampleCompactor
+from .i_snapshot_lookup import ISnapshotLookup, RecentSamplesSummary
 from .i_snapshot_record import ICityRecord, IDistrictRecord, ISnapshotRecord
+from .i_snapshot_sample_writer import ISnapshotSampleWriter
 
 __all__ = [
     "AggregatedResult",
     "AggregatedStats",
+    "CompactedSamples",
     "ICityRecord",
     "IAggregatedResolver",
+    "IBenchmarkCache",
+    "IBenchmarkCacheGeneration",
+    "IBenchmarkMaterializer",
+    "IBenchmarkStore",
     "IDistrictRecord",
     "IPropertyTypeNormalizer",
     "ISampleAggregator",
+    "ISampleCompactor",
     "ISnapshotLookup",
     "ISnapshotRecord",
+    "ISnapshotSampleWriter",
+    "QuantileSketch",
+    "RecentSamplesSummary",
+    "StoredBenchmark",
 ]
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Protocol
 
+from ..market_slice import MarketSlice
 from .i_sample_aggregator import AggregatedStats
 
 
@@ -19,3 +20,9 @@ class IAggregatedResolver(Protocol):
         rooms: int | None,
         max_age_days: int,
     ) -> AggregatedResult | None: ...
+
+    def resolve_many(
+        self,
+        slices: list[MarketSlice],
+        max_age_days: int,
+    ) -> dict[MarketSlice, AggregatedResult | None]: ...
@@ -0,0 +1,16 @@
+from typing import Protocol
+
+from ..benchmark import MarketBenchmark
+from ..benchmark_cache import SliceKey
+
+
+class IBenchmarkCache(Protocol):
+    def get(self, key: SliceKey) -> tuple[bool, MarketBenchmark | None]: ...
+
+    def put(self, key: SliceKey, benchmark: MarketBenchmark | None) -> None: ...
+
+    def sync(self, generation: str) -> None: ...
+
+
+class IBenchmarkCacheGeneration(Protocol):
+    def current(self) -> str: ...
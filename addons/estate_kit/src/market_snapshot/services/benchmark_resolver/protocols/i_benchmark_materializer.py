@@ -0,0 +1,19 @@
+from typing import Protocol
+
+from ..market_slice import MarketSlice
+from .i_aggregated_resolver import AggregatedResult
+
+
+class IBenchmarkMaterializer(Protocol):
+    def materialize(
+        self,
+        city_id: int,
+        district_id: int | None,
+        property_type: str,
+        rooms: int | None,
+    ) -> AggregatedResult | None: ...
+
+    def materialize_many(
+        self,
+        slices: list[MarketSlice],
+    ) -> dict[MarketSlice, AggregatedResult | None]: ...
@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Protocol
+
+from ..market_slice import MarketSlice
+from .i_aggregated_resolver import AggregatedResult
+
+
+@dataclass(frozen=True)
+class StoredBenchmark:
+    result: AggregatedResult | None  # None — выборки недостаточно для агрегата
+
+
+class IBenchmarkStore(Protocol):
+    def fetch(
+        self,
+        city_id: int,
+        district_id: int | None,
+        property_type: str,
+        rooms: int | None,
+        window_days: int,
+    ) -> StoredBenchmark | None: ...
+
+    def fetch_many(
+        self,
+        slices: list[MarketSlice],
+        window_days: int,
+    ) -> dict[MarketSlice, StoredBenchmark]: ...
+
+    def upsert(
+        self,
+        city_id: int,
+        district_id: int | None,
+        property_type: str,
+        rooms: int | None,
+        window_days: int,
+        result: AggregatedResult | None,
+        valid_until: datetime | None,
+    ) -> None: ...
+
+    def upsert_many(
+        self,
+        rows: dict[MarketSlice, tuple[AggregatedResult | None, datetime | None]],
+        window_days: int,
+    ) -> None: ...
@@ -10,5 +10,19 @@ class AggregatedStats:
     p75_price_per_sqm: float
 
 
+@dataclass(frozen=True)
+class QuantileSketch:
+    weight: int
+    points: list[float]
+
+
 class ISampleAggregator(Protocol):
+    def meets_minimum(self, sample_size: int) -> bool: ...
+
     def aggregate(self, samples_groups: list[list[float]]) -> AggregatedStats | None: ...
+
+    def build_sketch(self, sorted_values: list[float]) -> QuantileSketch: ...
+
+    def merge_sketches(self, sketches: list[QuantileSketch]) -> QuantileSketch | None: ...
+
+    def aggregate_sketches(self, sketches: list[QuantileSketch]) -> AggregatedStats | None: ...
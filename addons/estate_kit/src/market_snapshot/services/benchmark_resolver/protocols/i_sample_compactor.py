@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from typing import Protocol
+
+from .i_sample_aggregator import AggregatedStats, QuantileSketch
+
+
+@dataclass(frozen=True)
+class CompactedSamples:
+    raw_samples: list[float] | None
+    sketch: QuantileSketch
+    # None — статистику снапшота не трогаем (режим raw)
+    stats: AggregatedStats | None
+
+
+class ISampleCompactor(Protocol):
+    def compact(self, samples: list[float]) -> CompactedSamples | None: ...
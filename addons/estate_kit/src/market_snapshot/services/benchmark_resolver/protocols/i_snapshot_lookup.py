@@ -1,8 +1,19 @@
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Protocol
 
+from ..market_slice import MarketSlice
+from .i_sample_aggregator import AggregatedStats
 from .i_snapshot_record import ISnapshotRecord
 
 
+@dataclass(frozen=True)
+class RecentSamplesSummary:
+    latest_snapshot_id: int
+    oldest_collected_at: datetime
+    stats: AggregatedStats
+
+
 class ISnapshotLookup(Protocol):
     def find_latest(
         self,
@@ -23,4 +34,43 @@ class ISnapshotLookup(Protocol):
         limit: int,
     ) -> list[tuple[int, list[float]]]: ...
 
+    def find_recent_samples_many(
+        self,
+        slices: list[MarketSlice],
+        max_age_days: int,
+        limit: int,
+    ) -> dict[MarketSlice, list[tuple[int, datetime, list[float]]]]: ...
+
+    def find_recent_sketches_many(
+        self,
+        slices: list[MarketSlice],
+        max_age_days: int,
+        limit: int,
+    ) -> dict[MarketSlice, list[tuple[int, datetime, int, list[float] | None, list[float] | None]]]: ...
+
+    def summarize_recent_samples(
+        self,
+        city_id: int,
+        district_id: int | None,
+        property_type: str,
+        rooms: int | None,
+        max_age_days: int,
+        limit: int,
+    ) -> RecentSamplesSummary | None: ...
+
+    def summarize_recent_samples_many(
+        self,
+        slices: list[MarketSlice],
+        max_age_days: int,
+        limit: int,
+    ) -> dict[MarketSlice, RecentSamplesSummary]: ...
+
+    def find_latest_many(
+        self,
+        slices: list[MarketSlice],
+        max_age_days: int,
+    ) -> dict[MarketSlice, int]: ...
+
     def browse_snapshot(self, snapshot_id: int) -> ISnapshotRecord: ...
+
+    def browse_snapshots(self, snapshot_ids: list[int]): ...
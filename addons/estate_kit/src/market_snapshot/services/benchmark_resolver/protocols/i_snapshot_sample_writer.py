@@ -0,0 +1,9 @@
+from typing import Protocol
+
+from .i_sample_compactor import CompactedSamples
+
+
+class ISnapshotSampleWriter(Protocol):
+    def write(self, snapshot_id: int, samples: list[float]) -> CompactedSamples | None: ...
+
+    def compact_pending(self, snapshot_ids: list[int]) -> int: ...
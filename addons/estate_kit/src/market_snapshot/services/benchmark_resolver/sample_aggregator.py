@@ -1,17 +1,24 @@
 import statistics
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable
 
-from .protocols import AggregatedStats
+from .protocols import AggregatedStats, QuantileSketch
+
+SKETCH_POINTS = 101
 
 
 class SampleAggregator:
     def __init__(self, min_sample_size: int) -> None:
         self._min_sample_size = min_sample_size
 
+    def meets_minimum(self, sample_size: int) -> bool:
+        return sample_size >= self._min_sample_size
+
     def aggregate(self, samples_groups: list[list[float]]) -> AggregatedStats | None:
         merged: list[float] = []
         for group in samples_groups:
             merged.extend(group)
-        if len(merged) < self._min_sample_size:
+        if not self.meets_minimum(len(merged)):
             return None
 
         merged.sort()
@@ -22,13 +29,110 @@ class SampleAggregator:
             p75_price_per_sqm=_percentile(merged, 75),
         )
 
+    def build_sketch(self, sorted_values: list[float]) -> QuantileSketch:
+        step = 100 / (SKETCH_POINTS - 1)
+        return QuantileSketch(
+            weight=len(sorted_values),
+            points=[_percentile(sorted_values, i * step) for i in range(SKETCH_POINTS)],
+        )
+
+    def merge_sketches(self, sketches: list[QuantileSketch]) -> QuantileSketch | None:
+        sketches = [sketch for sketch in sketches if sketch.weight > 0 and sketch.points]
+        if not sketches:
+            return None
+        if len(sketches) == 1:
+            return sketches[0]
+
+        # Смесь кусочно-линейных CDF, взвешенная размерами выборок. Все изломы
+        # лежат в объединении точек, поэтому обратная функция между ними линейна.
+        total = sum(sketch.weight for sketch in sketches)
+        breakpoints = sorted({point for sketch in sketches for point in sketch.points})
+        cdf = [
+            sum(sketch.weight * _sketch_cdf(sketch.points, x) for sketch in sketches) / total
+            for x in breakpoints
+        ]
+        step = 1.0 / (SKETCH_POINTS - 1)
+        return QuantileSketch(
+            weight=total,
+            points=[_invert_cdf(breakpoints, cdf, i * step) for i in range(SKETCH_POINTS)],
+        )
+
+    def aggregate_sketches(self, sketches: list[QuantileSketch]) -> AggregatedStats | None:
+        merged = self.merge_sketches(sketches)
+        if merged is None or not self.meets_minimum(merged.weight):
+            return None
+        return stats_from_sketch(merged)
+
+
+def stats_from_sketch(sketch: QuantileSketch) -> AggregatedStats:
+    last = SKETCH_POINTS - 1
+    return AggregatedStats(
+        sample_size=sketch.weight,
+        median_price_per_sqm=sketch.points[last // 2],
+        p25_price_per_sqm=sketch.points[last // 4],
+        p75_price_per_sqm=sketch.points[last * 3 // 4],
+    )
+
+
+# Запасной путь для строк без сэмплов: перцентили по срезам не смешиваются,
+# поэтому берём среднее, взвешенное размером выборки
+def weighted_stats(parts: list[AggregatedStats]) -> AggregatedStats:
+    total = sum(part.sample_size for part in parts)
+    if not total:
+        return parts[0]
+    return AggregatedStats(
+        sample_size=total,
+        median_price_per_sqm=sum(p.median_price_per_sqm * p.sample_size for p in parts) / total,
+        p25_price_per_sqm=sum(p.p25_price_per_sqm * p.sample_size for p in parts) / total,
+        p75_price_per_sqm=sum(p.p75_price_per_sqm * p.sample_size for p in parts) / total,
+    )
 
-def _percentile(sorted_values: list[float], percentile: int) -> float:
+
+def _sketch_cdf(points: list[float], x: float) -> float:
+    last = len(points) - 1
+    if x < points[0]:
+        return 0.0
+    if x >= points[last]:
+        return 1.0
+    j = bisect_right(points, x) - 1
+    low, high = points[j], points[j + 1]
+    return (j + (x - low) / (high - low)) / last
+
+
+def _invert_cdf(xs: list[float], cdf: list[float], fraction: float) -> float:
+    i = bisect_left(cdf, fraction)
+    if i == 0:
+        return xs[0]
+    if i >= len(xs):
+        return xs[-1]
+    low, high = cdf[i - 1], cdf[i]
+    if high == low:
+        return xs[i]
+    return xs[i - 1] + (xs[i] - xs[i - 1]) * (fraction - low) / (high - low)
+
+
+def _percentile(sorted_values: list[float], percentile: float) -> float:
     if not sorted_values:
         return 0.0
-    n = len(sorted_values)
+    return percentile_at(len(sorted_values), sorted_values.__getitem__, percentile)
+
+
+# Порядковые статистики по позиции: SQL-путь передаёт только нужные элементы, а не всю выборку
+def percentile_positions(n: int, percentile: float) -> tuple[int, int]:
+    lower = int((percentile / 100) * (n - 1))
+    return lower, min(lower + 1, n - 1)
+
+
+def percentile_at(n: int, value_at: Callable[[int], float], percentile: float) -> float:
     rank = (percentile / 100) * (n - 1)
-    lower = int(rank)
-    upper = min(lower + 1, n - 1)
+    lower, upper = percentile_positions(n, percentile)
     weight = rank - lower
-    return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+    return value_at(lower) * (1 - weight) + value_at(upper) * weight
+
+
+def median_at(n: int, value_at: Callable[[int], float]) -> float:
+    # Как statistics.median: средний элемент или полусумма двух средних
+    middle = n // 2
+    if n % 2:
+        return value_at(middle)
+    return (value_at(middle - 1) + value_at(middle)) / 2
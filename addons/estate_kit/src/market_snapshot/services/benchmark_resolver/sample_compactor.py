@@ -0,0 +1,36 @@
+from .protocols import CompactedSamples, ISampleAggregator
+from .sample_aggregator import _percentile, stats_from_sketch
+
+
+class SampleCompactor:
+    def __init__(self, aggregator: ISampleAggregator, outlier_iqr_factor: float, keep_raw: bool) -> None:
+        self._aggregator = aggregator
+        self._outlier_iqr_factor = outlier_iqr_factor
+        self._keep_raw = keep_raw
+
+    def compact(self, samples: list[float]) -> CompactedSamples | None:
+        values = sorted(value for value in samples if value and value > 0)
+        if self._keep_raw:
+            # Режим raw: сэмплы и статистика снапшота остаются как пришли, скетч только добавляется для свёрток
+            if not values:
+                return None
+            return CompactedSamples(
+                raw_samples=list(samples),
+                sketch=self._aggregator.build_sketch(values),
+                stats=None,
+            )
+        values = self._trim_outliers(values)
+        if not values:
+            return None
+        sketch = self._aggregator.build_sketch(values)
+        return CompactedSamples(raw_samples=None, sketch=sketch, stats=stats_from_sketch(sketch))
+
+    def _trim_outliers(self, sorted_values: list[float]) -> list[float]:
+        # Заборы Тьюки: отсекаем ошибки ввода цены/площади (цена за объект вместо м², 1 м² и т.п.)
+        if self._outlier_iqr_factor <= 0 or len(sorted_values) < 4:
+            return sorted_values
+        q1 = _percentile(sorted_values, 25)
+        q3 = _percentile(sorted_values, 75)
+        margin = (q3 - q1) * self._outlier_iqr_factor
+        low, high = q1 - margin, q3 + margin
+        return [value for value in sorted_values if low <= value <= high]
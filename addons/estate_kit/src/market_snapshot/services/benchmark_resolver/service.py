@@ -1,6 +1,15 @@
 from .benchmark import MarketBenchmark
+from .benchmark_cache import SliceKey
 from .config import BenchmarkResolverConfig
-from .protocols import IAggregatedResolver, IPropertyTypeNormalizer, ISnapshotLookup
+from .market_slice import MarketSlice
+from .protocols import (
+    AggregatedResult,
+    IAggregatedResolver,
+    IBenchmarkCache,
+    IBenchmarkCacheGeneration,
+    IPropertyTypeNormalizer,
+    ISnapshotLookup,
+)
 
 
 class BenchmarkResolverService:
@@ -10,22 +19,48 @@ class BenchmarkResolverService:
         aggregated_resolver: IAggregatedResolver,
         property_type_normalizer: IPropertyTypeNormalizer,
         config: BenchmarkResolverConfig,
+        cache: IBenchmarkCache,
+        cache_generation: IBenchmarkCacheGeneration,
     ) -> None:
         self._lookup = lookup
         self._aggregated_resolver = aggregated_resolver
         self._property_type_normalizer = property_type_normalizer
         self._config = config
+        self._cache = cache
+        self._cache_generation = cache_generation
 
     def resolve(self, prop) -> MarketBenchmark | None:
-        if not prop.city_id:
+        key = self.slice_key(prop)
+        if key is None:
             return None
 
-        city_id = prop.city_id.id
-        district_id = prop.district_id.id if prop.district_id else None
-        property_type = self._property_type_normalizer.normalize(prop.property_type)
-        rooms = prop.rooms if prop.rooms else None
-        window = self._config.window_days
+        self._cache.sync(self._cache_generation.current())
+        found, benchmark = self._cache.get(key)
+        if found:
+            return benchmark
+        benchmark = self._resolve_slice(*key)
+        self._cache.put(key, benchmark)
+        return benchmark
+
+    def slice_key(self, prop) -> SliceKey | None:
+        if not prop.city_id:
+            return None
+        return (
+            prop.city_id.id,
+            prop.district_id.id if prop.district_id else None,
+            self._property_type_normalizer.normalize(prop.property_type),
+            prop.rooms if prop.rooms else None,
+            self._config.window_days,
+        )
 
+    def _resolve_slice(
+        self,
+        city_id: int,
+        district_id: int | None,
+        property_type: str,
+        rooms: int | None,
+        window: int,
+    ) -> MarketBenchmark | None:
         relax_chain: list[tuple[str, int | None, int | None]] = [
             ("exact", district_id, rooms),
             ("no_rooms", district_id, None),
@@ -42,40 +77,111 @@ class BenchmarkResolverService:
             )
             if aggregated is not None:
                 snapshot = self._lookup.browse_snapshot(aggregated.latest_snapshot_id)
-                stats = aggregated.stats
-                median = stats.median_price_per_sqm
-                p25 = stats.p25_price_per_sqm
-                p75 = stats.p75_price_per_sqm
-                sample_size = stats.sample_size
-            else:
-                snapshot = self._lookup.find_latest(
-                    city_id=city_id,
-                    district_id=relax_district,
-                    property_type=property_type,
-                    rooms=relax_rooms,
-                    max_age_days=window,
-                )
-                if not snapshot:
-                    continue
-                median = snapshot.median_price_per_sqm
-                p25 = snapshot.p25_price_per_sqm
-                p75 = snapshot.p75_price_per_sqm
-                sample_size = snapshot.sample_size
-
-            return MarketBenchmark(
-                median_price_per_sqm=median,
-                p25_price_per_sqm=p25,
-                p75_price_per_sqm=p75,
-                sample_size=sample_size,
-                snapshot_id=snapshot.id,
-                collected_at=snapshot.collected_at,
-                city_name=snapshot.city_id.name,
-                district_name=(
-                    snapshot.district_id.name if snapshot.district_id else None
-                ),
-                property_type=snapshot.property_type,
-                rooms=snapshot.rooms if relax_level == "exact" else 0,
-                relax_level=relax_level,
+                return _to_benchmark(snapshot, relax_level, aggregated)
+
+            snapshot = self._lookup.find_latest(
+                city_id=city_id,
+                district_id=relax_district,
+                property_type=property_type,
+                rooms=relax_rooms,
+                max_age_days=window,
             )
+            if snapshot:
+                return _to_benchmark(snapshot, relax_level, None)
 
         return None
+
+    def resolve_many(self, props) -> dict[int, MarketBenchmark]:
+        keys_by_property: dict[int, SliceKey] = {}
+        for prop in props:
+            key = self.slice_key(prop)
+            if key is not None:
+                keys_by_property[prop.id] = key
+
+        self._cache.sync(self._cache_generation.current())
+        resolved: dict[SliceKey, MarketBenchmark | None] = {}
+        pending: set[SliceKey] = set()
+        for key in set(keys_by_property.values()):
+            found, benchmark = self._cache.get(key)
+            if found:
+                resolved[key] = benchmark
+            else:
+                pending.add(key)
+
+        window = self._config.window_days
+        for relax_level in ("exact", "no_rooms", "city_only"):
+            if not pending:
+                break
+            slice_by_key = {key: _relax(key, relax_level) for key in pending}
+            slices = list(set(slice_by_key.values()))
+
+            aggregated = self._aggregated_resolver.resolve_many(slices, window)
+            missing = [market_slice for market_slice in slices if aggregated.get(market_slice) is None]
+            latest_ids = self._lookup.find_latest_many(missing, window)
+
+            snapshot_ids = {result.latest_snapshot_id for result in aggregated.values() if result is not None}
+            snapshot_ids.update(latest_ids.values())
+            snapshots = {
+                snapshot.id: snapshot
+                for snapshot in self._lookup.browse_snapshots(list(snapshot_ids))
+            }
+
+            for key, market_slice in slice_by_key.items():
+                result = aggregated.get(market_slice)
+                if result is not None:
+                    resolved[key] = _to_benchmark(snapshots[result.latest_snapshot_id], relax_level, result)
+                elif market_slice in latest_ids:
+                    resolved[key] = _to_benchmark(snapshots[latest_ids[market_slice]], relax_level, None)
+                else:
+                    continue
+                pending.discard(key)
+
+        for key in pending:
+            resolved[key] = None
+        for key, benchmark in resolved.items():
+            self._cache.put(key, benchmark)
+
+        return {
+            property_id: resolved[key]
+            for property_id, key in keys_by_property.items()
+            if resolved[key] is not None
+        }
+
+
+def _relax(key: SliceKey, relax_level: str) -> MarketSlice:
+    city_id, district_id, property_type, rooms, _window = key
+    if relax_level == "exact":
+        return city_id, district_id, property_type, rooms
+    if relax_level == "no_rooms":
+        return city_id, district_id, property_type, None
+    return city_id, None, property_type, None
+
+
+def _to_benchmark(snapshot, relax_level: str, aggregated: AggregatedResult | None) -> MarketBenchmark:
+    if aggregated is not None:
+        stats = aggregated.stats
+        median = stats.median_price_per_sqm
+        p25 = stats.p25_price_per_sqm
+        p75 = stats.p75_price_per_sqm
+        sample_size = stats.sample_size
+    else:
+        median = snapshot.median_price_per_sqm
+        p25 = snapshot.p25_price_per_sqm
+        p75 = snapshot.p75_price_per_sqm
+        sample_size = snapshot.sample_size
+
+    return MarketBenchmark(
+        median_price_per_sqm=median,
+        p25_price_per_sqm=p25,
+        p75_price_per_sqm=p75,
+        sample_size=sample_size,
+        snapshot_id=snapshot.id,
+        collected_at=snapshot.collected_at,
+        city_name=snapshot.city_id.name,
+        district_name=(
+            snapshot.district_id.name if snapshot.district_id else None
+        ),
+        property_type=snapshot.property_type,
+        rooms=snapshot.rooms if relax_level == "exact" else 0,
+        relax_level=relax_level,
+    )
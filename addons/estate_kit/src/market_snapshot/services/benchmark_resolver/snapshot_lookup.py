@@ -1,5 +1,37 @@
 from datetime import datetime, timedelta
 
+from .market_slice import MarketSlice
+from .protocols import AggregatedStats, RecentSamplesSummary
+from .sample_aggregator import median_at, percentile_at
+
+_RAW_SAMPLES_CLAUSE = "array_length(s.samples_per_sqm, 1) > 0"
+_ANY_SAMPLES_CLAUSE = "(array_length(s.samples_sketch, 1) > 0 OR array_length(s.samples_per_sqm, 1) > 0)"
+
+# Последние `limit` снапшотов каждого среза одним запросом; rooms = 0 в срезе — без фильтра по комнатам
+_RECENT_CTE = """
+    slices AS (
+        SELECT *
+        FROM unnest(%s::int[], %s::int[], %s::varchar[], %s::int[])
+            WITH ORDINALITY AS v(city_id, district_id, property_type, rooms, idx)
+    ),
+    recent AS (
+        SELECT v.idx, r.*
+        FROM slices v
+        CROSS JOIN LATERAL (
+            SELECT s.id, s.collected_at, s.sample_size, s.samples_sketch, s.samples_per_sqm
+            FROM estate_market_snapshot s
+            WHERE s.city_id = v.city_id
+              AND COALESCE(s.district_id, 0) = v.district_id
+              AND s.property_type = v.property_type
+              AND (v.rooms = 0 OR s.rooms = v.rooms)
+              AND s.collected_at >= %s
+              AND {samples_clause}
+            ORDER BY s.collected_at DESC, s.id DESC
+            LIMIT %s
+        ) r
+    )
+"""
+
 
 class SnapshotLookup:
     def __init__(self, env) -> None:
@@ -30,9 +62,43 @@ class SnapshotLookup:
             domain, order="collected_at desc", limit=1,
         )
 
+    def find_latest_many(
+        self,
+        slices: list[MarketSlice],
+        max_age_days: int,
+    ) -> dict[MarketSlice, int]:
+        if not slices:
+            return {}
+        threshold = datetime.now() - timedelta(days=max_age_days)
+        self._env.cr.execute(
+            """
+            SELECT DISTINCT ON (v.idx) v.idx, s.id
+            FROM unnest(%s::int[], %s::int[], %s::varchar[], %s::int[])
+                WITH ORDINALITY AS v(city_id, district_id, property_type, rooms, idx)
+            JOIN estate_market_snapshot s
+              ON s.city_id = v.city_id
+             AND COALESCE(s.district_id, 0) = v.district_id
+             AND s.property_type = v.property_type
+             AND (v.rooms = 0 OR s.rooms = v.rooms)
+            WHERE s.collected_at >= %s
+            ORDER BY v.idx, s.collected_at DESC, s.id DESC
+            """,
+            [
+                [key[0] for key in slices],
+                [key[1] or 0 for key in slices],
+                [key[2] for key in slices],
+                [key[3] or 0 for key in slices],
+                threshold,
+            ],
+        )
+        return {slices[idx - 1]: snapshot_id for idx, snapshot_id in self._env.cr.fetchall()}
+
     def browse_snapshot(self, snapshot_id: int):
         return self._env["estate.market.snapshot"].browse(snapshot_id)
 
+    def browse_snapshots(self, snapshot_ids: list[int]):
+        return self._env["estate.market.snapshot"].browse(snapshot_ids)
+
     def find_recent_samples(
         self,
         city_id: int,
@@ -42,33 +108,142 @@ class SnapshotLookup:
         max_age_days: int,
         limit: int,
     ) -> list[tuple[int, list[float]]]:
-        threshold = datetime.now() - timedelta(days=max_age_days)
-        params: list[object] = [city_id, property_type, threshold]
-        district_clause = (
-            "district_id IS NULL"
-            if district_id is None
-            else "district_id = %s"
-        )
-        if district_id is not None:
-            params.append(district_id)
-        rooms_clause = "" if rooms is None else "AND rooms = %s"
-        if rooms is not None:
-            params.append(rooms)
-        params.append(limit)
+        key = (city_id, district_id, property_type, rooms)
+        rows = self.find_recent_samples_many([key], max_age_days, limit).get(key, [])
+        return [(snapshot_id, samples) for snapshot_id, _, samples in rows]
 
+    def find_recent_samples_many(
+        self,
+        slices: list[MarketSlice],
+        max_age_days: int,
+        limit: int,
+    ) -> dict[MarketSlice, list[tuple[int, datetime, list[float]]]]:
         query = f"""
-            SELECT id, samples_per_sqm
-            FROM estate_market_snapshot
-            WHERE city_id = %s
-              AND property_type = %s
-              AND collected_at >= %s
-              AND {district_clause}
-              {rooms_clause}
-              AND samples_per_sqm IS NOT NULL
-              AND array_length(samples_per_sqm, 1) > 0
-            ORDER BY collected_at DESC
-            LIMIT %s
+            WITH {_RECENT_CTE.format(samples_clause=_RAW_SAMPLES_CLAUSE)}
+            SELECT idx, id, collected_at, samples_per_sqm
+            FROM recent
+            ORDER BY idx, collected_at DESC, id DESC
+        """
+        grouped: dict[MarketSlice, list[tuple[int, datetime, list[float]]]] = {}
+        for idx, snapshot_id, collected_at, samples in self._fetch_recent(query, slices, max_age_days, limit):
+            grouped.setdefault(slices[idx - 1], []).append((int(snapshot_id), collected_at, list(samples or [])))
+        return grouped
+
+    def find_recent_sketches_many(
+        self,
+        slices: list[MarketSlice],
+        max_age_days: int,
+        limit: int,
+    ) -> dict[MarketSlice, list[tuple[int, datetime, int, list[float] | None, list[float] | None]]]:
+        # Сырые сэмплы читаем только у строк без скетча (до сжатия) — размер ответа ограничен
+        query = f"""
+            WITH {_RECENT_CTE.format(samples_clause=_ANY_SAMPLES_CLAUSE)}
+            SELECT
+                idx,
+                id,
+                collected_at,
+                sample_size,
+                samples_sketch,
+                CASE WHEN samples_sketch IS NULL THEN samples_per_sqm END
+            FROM recent
+            ORDER BY idx, collected_at DESC, id DESC
+        """
+        grouped: dict[MarketSlice, list[tuple[int, datetime, int, list[float] | None, list[float] | None]]] = {}
+        for idx, snapshot_id, collected_at, sample_size, sketch, raw in self._fetch_recent(
+            query, slices, max_age_days, limit,
+        ):
+            grouped.setdefault(slices[idx - 1], []).append(
+                (int(snapshot_id), collected_at, int(sample_size), sketch, raw)
+            )
+        return grouped
+
+    def summarize_recent_samples(
+        self,
+        city_id: int,
+        district_id: int | None,
+        property_type: str,
+        rooms: int | None,
+        max_age_days: int,
+        limit: int,
+    ) -> RecentSamplesSummary | None:
+        key = (city_id, district_id, property_type, rooms)
+        return self.summarize_recent_samples_many([key], max_age_days, limit).get(key)
+
+    def summarize_recent_samples_many(
+        self,
+        slices: list[MarketSlice],
+        max_age_days: int,
+        limit: int,
+    ) -> dict[MarketSlice, RecentSamplesSummary]:
+        # Postgres сортирует выборку и отдаёт только порядковые статистики, нужные для интерполяции;
+        # сама интерполяция — та же функция, что у SampleAggregator, поэтому результаты совпадают побитово
+        query = f"""
+            WITH {_RECENT_CTE.format(samples_clause=_RAW_SAMPLES_CLAUSE)},
+            ranked AS (
+                SELECT
+                    idx,
+                    value,
+                    row_number() OVER (PARTITION BY idx ORDER BY value) - 1 AS pos,
+                    count(*) OVER (PARTITION BY idx) AS n
+                FROM recent, unnest(recent.samples_per_sqm) AS value
+            ),
+            picked AS (
+                SELECT
+                    idx,
+                    max(n) AS n,
+                    array_agg(pos ORDER BY pos) AS positions,
+                    array_agg(value ORDER BY pos) AS vals
+                FROM ranked
+                WHERE pos IN (
+                    (n - 1) / 4, least((n - 1) / 4 + 1, n - 1),
+                    (n - 1) / 2, n / 2,
+                    3 * (n - 1) / 4, least(3 * (n - 1) / 4 + 1, n - 1)
+                )
+                GROUP BY idx
+            ),
+            heads AS (
+                SELECT
+                    idx,
+                    (array_agg(id ORDER BY collected_at DESC, id DESC))[1] AS latest_id,
+                    min(collected_at) AS oldest
+                FROM recent
+                GROUP BY idx
+            )
+            SELECT h.idx, h.latest_id, h.oldest, p.n, p.positions, p.vals
+            FROM heads h
+            JOIN picked p USING (idx)
         """
-        self._env.cr.execute(query, params)
-        rows = self._env.cr.fetchall()
-        return [(int(row[0]), list(row[1] or [])) for row in rows]
+        summaries: dict[MarketSlice, RecentSamplesSummary] = {}
+        for idx, latest_id, oldest, sample_size, positions, values in self._fetch_recent(
+            query, slices, max_age_days, limit,
+        ):
+            sample_size = int(sample_size)
+            value_at = dict(zip(positions, values)).__getitem__
+            summaries[slices[idx - 1]] = RecentSamplesSummary(
+                latest_snapshot_id=int(latest_id),
+                oldest_collected_at=oldest,
+                stats=AggregatedStats(
+                    sample_size=sample_size,
+                    median_price_per_sqm=median_at(sample_size, value_at),
+                    p25_price_per_sqm=percentile_at(sample_size, value_at, 25),
+                    p75_price_per_sqm=percentile_at(sample_size, value_at, 75),
+                ),
+            )
+        return summaries
+
+    def _fetch_recent(self, query: str, slices: list[MarketSlice], max_age_days: int, limit: int) -> list[tuple]:
+        if not slices:
+            return []
+        threshold = datetime.now() - timedelta(days=max_age_days)
+        self._env.cr.execute(
+            query,
+            [
+                [key[0] for key in slices],
+                [key[1] or 0 for key in slices],
+                [key[2] for key in slices],
+                [key[3] or 0 for key in slices],
+                threshold,
+                limit,
+            ],
+        )
+        return self._env.cr.fetchall()
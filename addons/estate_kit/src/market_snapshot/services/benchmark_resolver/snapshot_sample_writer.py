@@ -0,0 +1,80 @@
+from .protocols import CompactedSamples, ISampleCompactor
+
+_STATS_FIELDS = [
+    "sample_size",
+    "median_price_per_sqm",
+    "p25_price_per_sqm",
+    "p75_price_per_sqm",
+]
+
+
+class SnapshotSampleWriter:
+    def __init__(self, env, compactor: ISampleCompactor) -> None:
+        self._env = env
+        self._compactor = compactor
+
+    def write(self, snapshot_id: int, samples: list[float]) -> CompactedSamples | None:
+        compacted = self._compactor.compact(samples)
+        if compacted is None:
+            return None
+        self._update(snapshot_id, compacted)
+        self._env["estate.market.snapshot"].browse(snapshot_id).invalidate_recordset(_STATS_FIELDS)
+        return compacted
+
+    def compact_pending(self, snapshot_ids: list[int]) -> int:
+        # Строки, записанные sidecar-ом напрямую в БД, приходят с сырыми сэмплами без скетча
+        self._env.cr.execute(
+            """
+            SELECT id, samples_per_sqm
+            FROM estate_market_snapshot
+            WHERE id = ANY(%s)
+              AND samples_sketch IS NULL
+              AND array_length(samples_per_sqm, 1) > 0
+            """,
+            [snapshot_ids],
+        )
+        rows = self._env.cr.fetchall()
+        compacted_ids = []
+        for snapshot_id, samples in rows:
+            compacted = self._compactor.compact(samples)
+            if compacted is not None:
+                self._update(snapshot_id, compacted)
+                compacted_ids.append(snapshot_id)
+        if compacted_ids:
+            self._env["estate.market.snapshot"].browse(compacted_ids).invalidate_recordset(_STATS_FIELDS)
+        return len(compacted_ids)
+
+    def _update(self, snapshot_id: int, compacted: CompactedSamples) -> None:
+        stats = compacted.stats
+        if stats is None:
+            self._env.cr.execute(
+                """
+                UPDATE estate_market_snapshot
+                SET samples_per_sqm = %s,
+                    samples_sketch = %s
+                WHERE id = %s
+                """,
+                [compacted.raw_samples, compacted.sketch.points, snapshot_id],
+            )
+            return
+        self._env.cr.execute(
+            """
+            UPDATE estate_market_snapshot
+            SET samples_per_sqm = %s,
+                samples_sketch = %s,
+                sample_size = %s,
+                median_price_per_sqm = %s,
+                p25_price_per_sqm = %s,
+                p75_price_per_sqm = %s
+            WHERE id = %s
+            """,
+            [
+                compacted.raw_samples,
+                compacted.sketch.points,
+                stats.sample_size,
+                stats.median_price_per_sqm,
+                stats.p25_price_per_sqm,
+                stats.p75_price_per_sqm,
+                snapshot_id,
+            ],
+        )
@@ -0,0 +1,4 @@
+from .factory import Factory
+from .trend_cache import invalidate_trend_cache
+
+__all__ = ["Factory", "invalidate_trend_cache"]
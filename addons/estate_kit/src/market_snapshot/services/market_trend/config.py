@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import Any
+
+GRANULARITIES = ("week", "month")
+
+
+@dataclass(frozen=True)
+class MarketTrendConfig:
+    cache_ttl_seconds: int = 600
+    max_periods: int = 104
+
+    @classmethod
+    def from_env(cls, env: Any) -> "MarketTrendConfig":
+        get_param = env["ir.config_parameter"].sudo().get_param
+        return cls(
+            cache_ttl_seconds=int(get_param("estate_kit.market_trend_cache_ttl_seconds", "600")),
+        )
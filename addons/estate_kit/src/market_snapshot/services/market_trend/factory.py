@@ -0,0 +1,25 @@
+from ..benchmark_resolver.config import BenchmarkResolverConfig
+from ..benchmark_resolver.property_type_normalizer import PropertyTypeNormalizer
+from ..benchmark_resolver.sample_aggregator import SampleAggregator
+from .config import MarketTrendConfig
+from .service import MarketTrendService
+from .trend_cache import shared_trend_cache
+from .trend_exporter import TrendExporter
+from .trend_query import TrendQuery
+
+
+class Factory:
+    @staticmethod
+    def create(env) -> MarketTrendService:
+        config = MarketTrendConfig.from_env(env)
+        return MarketTrendService(
+            query=TrendQuery(
+                env,
+                SampleAggregator(min_sample_size=BenchmarkResolverConfig.from_env(env).min_aggregated_sample_size),
+            ),
+            cache=shared_trend_cache(env.cr.dbname, config.cache_ttl_seconds),
+            property_type_normalizer=PropertyTypeNormalizer(),
+            exporter=TrendExporter(),
+            config=config,
+            env=env,
+        )
@@ -0,0 +1,11 @@
+from .i_property_type_normalizer import IPropertyTypeNormalizer
+from .i_sample_aggregator import ISampleAggregator
+from .i_trend_cache import ITrendCache
+from .i_trend_query import ITrendQuery
+
+__all__ = [
+    "IPropertyTypeNormalizer",
+    "ISampleAggregator",
+    "ITrendCache",
+    "ITrendQuery",
+]
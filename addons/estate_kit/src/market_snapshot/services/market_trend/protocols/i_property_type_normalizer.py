@@ -0,0 +1,3 @@
+from ...benchmark_resolver.protocols import IPropertyTypeNormalizer
+
+__all__ = ["IPropertyTypeNormalizer"]
@@ -0,0 +1,10 @@
+from typing import Protocol
+
+from ..trend_cache import TrendKey
+from ..trend_point import TrendPoint
+
+
+class ITrendCache(Protocol):
+    def get_many(self, keys: list[TrendKey]) -> dict[TrendKey, list[TrendPoint]]: ...
+
+    def put_many(self, series: dict[TrendKey, list[TrendPoint]]) -> None: ...
@@ -0,0 +1,13 @@
+from typing import Protocol
+
+from ...benchmark_resolver.market_slice import MarketSlice
+from ..trend_point import TrendPoint
+
+
+class ITrendQuery(Protocol):
+    def series_many(
+        self,
+        slices: list[MarketSlice],
+        granularity: str,
+        periods: int,
+    ) -> dict[MarketSlice, list[TrendPoint]]: ...
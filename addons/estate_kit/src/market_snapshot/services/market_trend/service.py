@@ -0,0 +1,81 @@
+from ..benchmark_resolver.market_slice import MarketSlice
+from .config import GRANULARITIES, MarketTrendConfig
+from .protocols import IPropertyTypeNormalizer, ITrendCache, ITrendQuery
+from .trend_exporter import TrendExporter
+from .trend_point import TrendPoint
+
+
+class MarketTrendService:
+    def __init__(
+        self,
+        query: ITrendQuery,
+        cache: ITrendCache,
+        property_type_normalizer: IPropertyTypeNormalizer,
+        exporter: TrendExporter,
+        config: MarketTrendConfig,
+        env,
+    ) -> None:
+        self._query = query
+        self._cache = cache
+        self._property_type_normalizer = property_type_normalizer
+        self._exporter = exporter
+        self._config = config
+        self._env = env
+
+    def series(
+        self,
+        city_id: int,
+        district_id: int | None,
+        property_type: str,
+        rooms: int | None,
+        granularity: str = "month",
+        periods: int = 12,
+    ) -> list[TrendPoint]:
+        key = self.normalize_slice(city_id, district_id, property_type, rooms)
+        return self.series_many([key], granularity, periods)[key]
+
+    def series_many(
+        self,
+        slices: list[MarketSlice],
+        granularity: str = "month",
+        periods: int = 12,
+    ) -> dict[MarketSlice, list[TrendPoint]]:
+        if granularity not in GRANULARITIES:
+            raise ValueError("Неизвестная гранулярность: %s" % granularity)
+        periods = max(1, min(int(periods), self._config.max_periods))
+
+        keys = [(key, granularity, periods) for key in dict.fromkeys(slices)]
+        cached = self._cache.get_many(keys)
+        missing = [key[0] for key in keys if key not in cached]
+        if missing:
+            fresh = {
+                (key, granularity, periods): points
+                for key, points in self._query.series_many(missing, granularity, periods).items()
+            }
+            self._cache.put_many(fresh)
+            cached.update(fresh)
+        return {key[0]: cached[key] for key in keys}
+
+    def export_csv(self, granularity: str = "month", periods: int = 12) -> str:
+        return self._exporter.to_csv(self.series_many(self.configured_slices(), granularity, periods))
+
+    def configured_slices(self) -> list[MarketSlice]:
+        configs = self._env["estate.market.snapshot.config"].sudo().search([])
+        return list(dict.fromkeys(
+            self.normalize_slice(c.city_id.id, c.district_id.id or None, c.property_type, c.rooms or None)
+            for c in configs
+        ))
+
+    def normalize_slice(
+        self,
+        city_id: int,
+        district_id: int | None,
+        property_type: str,
+        rooms: int | None,
+    ) -> MarketSlice:
+        return (
+            int(city_id),
+            int(district_id) if district_id else None,
+            self._property_type_normalizer.normalize(property_type),
+            int(rooms) if rooms else None,
+        )
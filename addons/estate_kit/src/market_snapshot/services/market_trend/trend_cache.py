@@ -0,0 +1,67 @@
+import threading
+import time
+
+from ..benchmark_resolver.market_slice import MarketSlice
+from .trend_point import TrendPoint
+
+# (срез, гранулярность, число периодов)
+TrendKey = tuple[MarketSlice, str, int]
+
+
+class TrendCache:
+    def __init__(self, ttl_seconds: float) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._entries: dict[TrendKey, tuple[float, list[TrendPoint]]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def ttl_seconds(self) -> float:
+        return self._ttl_seconds
+
+    def get_many(self, keys: list[TrendKey]) -> dict[TrendKey, list[TrendPoint]]:
+        if self._ttl_seconds <= 0:
+            return {}
+        now = time.monotonic()
+        found: dict[TrendKey, list[TrendPoint]] = {}
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                if entry[0] < now:
+                    del self._entries[key]
+                    continue
+                found[key] = entry[1]
+        return found
+
+    def put_many(self, series: dict[TrendKey, list[TrendPoint]]) -> None:
+        if self._ttl_seconds <= 0:
+            return
+        expires_at = time.monotonic() + self._ttl_seconds
+        with self._lock:
+            for key, points in series.items():
+                self._entries[key] = (expires_at, points)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_caches: dict[str, TrendCache] = {}
+_caches_lock = threading.Lock()
+
+
+def shared_trend_cache(dbname: str, ttl_seconds: float) -> TrendCache:
+    with _caches_lock:
+        cache = _caches.get(dbname)
+        if cache is None or cache.ttl_seconds != ttl_seconds:
+            cache = TrendCache(ttl_seconds)
+            _caches[dbname] = cache
+        return cache
+
+
+def invalidate_trend_cache(dbname: str) -> None:
+    with _caches_lock:
+        cache = _caches.get(dbname)
+    if cache is not None:
+        cache.invalidate()
@@ -0,0 +1,37 @@
+import csv
+import io
+
+from ..benchmark_resolver.market_slice import MarketSlice
+from .trend_point import TrendPoint
+
+_COLUMNS = [
+    "city_id",
+    "district_id",
+    "property_type",
+    "rooms",
+    "period_start",
+    "snapshot_count",
+    "sample_size",
+    "median_price_per_sqm",
+    "p25_price_per_sqm",
+    "p75_price_per_sqm",
+    "median_change_pct",
+    "approximate",
+]
+
+
+class TrendExporter:
+    def to_csv(self, series: dict[MarketSlice, list[TrendPoint]]) -> str:
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=_COLUMNS)
+        writer.writeheader()
+        for (city_id, district_id, property_type, rooms), points in series.items():
+            for point in points:
+                writer.writerow({
+                    "city_id": city_id,
+                    "district_id": district_id or "",
+                    "property_type": property_type,
+                    "rooms": rooms or 0,
+                    **point.as_dict(),
+                })
+        return buffer.getvalue()
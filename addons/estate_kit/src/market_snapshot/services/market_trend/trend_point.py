@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Any
+
+
+@dataclass(frozen=True)
+class TrendPoint:
+    period_start: date
+    snapshot_count: int
+    sample_size: int
+    median_price_per_sqm: float
+    p25_price_per_sqm: float
+    p75_price_per_sqm: float
+    median_change_pct: float | None
+    # Перцентили — среднее по снапшотам, взвешенное выборкой: у части снапшотов периода нет ни скетча, ни сэмплов
+    approximate: bool = False
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "period_start": self.period_start.isoformat(),
+            "snapshot_count": self.snapshot_count,
+            "sample_size": self.sample_size,
+            "median_price_per_sqm": round(self.median_price_per_sqm, 2),
+            "p25_price_per_sqm": round(self.p25_price_per_sqm, 2),
+            "p75_price_per_sqm": round(self.p75_price_per_sqm, 2),
+            "median_change_pct": (
+                round(self.median_change_pct, 2) if self.median_change_pct is not None else None
+            ),
+            "approximate": self.approximate,
+        }
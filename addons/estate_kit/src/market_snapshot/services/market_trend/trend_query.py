@@ -0,0 +1,120 @@
+from collections import defaultdict
+from datetime import date
+
+from ..benchmark_resolver.market_slice import MarketSlice
+from ..benchmark_resolver.protocols import AggregatedStats, QuantileSketch
+from ..benchmark_resolver.sample_aggregator import stats_from_sketch, weighted_stats
+from .protocols import ISampleAggregator
+from .trend_point import TrendPoint
+
+
+class TrendQuery:
+    def __init__(self, env, aggregator: ISampleAggregator) -> None:
+        self._env = env
+        self._aggregator = aggregator
+
+    def series_many(
+        self,
+        slices: list[MarketSlice],
+        granularity: str,
+        periods: int,
+    ) -> dict[MarketSlice, list[TrendPoint]]:
+        if not slices:
+            return {}
+        # Одним запросом: снапшоты (и месячные агрегаты retention-а для month) со скетчами;
+        # перцентили периода считаются по смеси скетчей в Python, как в MonthlyRollup.
+        # rooms = 0 в срезе — только агрегаты по всем комнатам, иначе поквартирные снапшоты посчитались бы дважды
+        self._env.cr.execute(
+            """
+            WITH v AS (
+                SELECT *
+                FROM unnest(%(city_ids)s::int[], %(district_ids)s::int[],
+                            %(property_types)s::varchar[], %(rooms)s::int[])
+                    WITH ORDINALITY AS v(city_id, district_id, property_type, rooms, idx)
+            ),
+            bounds AS (
+                SELECT date_trunc(%(granularity)s, now() at time zone 'UTC')
+                       - (%(periods)s - 1) * ('1 ' || %(granularity)s)::interval AS since
+            )
+            SELECT v.idx,
+                   date_trunc(%(granularity)s, s.collected_at)::date AS period_start,
+                   1 AS snapshot_count,
+                   s.sample_size,
+                   s.median_price_per_sqm,
+                   s.p25_price_per_sqm,
+                   s.p75_price_per_sqm,
+                   s.samples_sketch,
+                   CASE WHEN s.samples_sketch IS NULL THEN s.samples_per_sqm END
+            FROM v
+            JOIN estate_market_snapshot s
+              ON s.city_id = v.city_id
+             AND COALESCE(s.district_id, 0) = v.district_id
+             AND s.property_type = v.property_type
+             AND COALESCE(s.rooms, 0) = v.rooms
+            CROSS JOIN bounds
+            WHERE s.collected_at >= bounds.since
+              AND s.sample_size > 0
+            UNION ALL
+            SELECT v.idx, m.month, m.snapshot_count, m.sample_size,
+                   m.median_price_per_sqm, m.p25_price_per_sqm, m.p75_price_per_sqm,
+                   m.samples_sketch, NULL
+            FROM v
+            JOIN estate_market_snapshot_monthly m
+              ON m.city_id = v.city_id
+             AND COALESCE(m.district_id, 0) = v.district_id
+             AND m.property_type = v.property_type
+             AND COALESCE(m.rooms, 0) = v.rooms
+            CROSS JOIN bounds
+            WHERE %(granularity)s = 'month'
+              AND m.month >= bounds.since
+              AND m.sample_size > 0
+            """,
+            {
+                "city_ids": [key[0] for key in slices],
+                "district_ids": [key[1] or 0 for key in slices],
+                "property_types": [key[2] for key in slices],
+                "rooms": [key[3] or 0 for key in slices],
+                "granularity": granularity,
+                "periods": periods,
+            },
+        )
+        buckets: dict[tuple[int, date], list[tuple]] = defaultdict(list)
+        for idx, period_start, *row in self._env.cr.fetchall():
+            buckets[(idx, period_start)].append(row)
+
+        series: dict[MarketSlice, list[TrendPoint]] = defaultdict(list)
+        previous: dict[int, float] = {}
+        for idx, period_start in sorted(buckets):
+            point = self._point(period_start, buckets[(idx, period_start)], previous.get(idx))
+            previous[idx] = point.median_price_per_sqm
+            series[slices[idx - 1]].append(point)
+        return {key: series.get(key, []) for key in slices}
+
+    def _point(self, period_start: date, rows: list[tuple], previous_median: float | None) -> TrendPoint:
+        sketches: list[QuantileSketch] = []
+        parts: list[AggregatedStats] = []
+        for _, sample_size, median, p25, p75, sketch, raw_samples in rows:
+            parts.append(AggregatedStats(
+                sample_size=int(sample_size),
+                median_price_per_sqm=float(median),
+                p25_price_per_sqm=float(p25),
+                p75_price_per_sqm=float(p75),
+            ))
+            if sketch:
+                sketches.append(QuantileSketch(weight=int(sample_size), points=list(sketch)))
+            elif raw_samples:
+                sketches.append(self._aggregator.build_sketch(sorted(raw_samples)))
+
+        merged = self._aggregator.merge_sketches(sketches) if len(sketches) == len(rows) else None
+        stats = stats_from_sketch(merged) if merged is not None else weighted_stats(parts)
+        median = float(stats.median_price_per_sqm)
+        return TrendPoint(
+            period_start=period_start,
+            snapshot_count=sum(int(row[0]) for row in rows),
+            sample_size=int(stats.sample_size),
+            median_price_per_sqm=median,
+            p25_price_per_sqm=float(stats.p25_price_per_sqm),
+            p75_price_per_sqm=float(stats.p75_price_per_sqm),
+            median_change_pct=(median / previous_median - 1) * 100 if previous_median else None,
+            approximate=merged is None,
+        )
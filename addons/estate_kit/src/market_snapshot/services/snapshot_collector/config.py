@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class CollectorConfig:
+    parallelism: int
+    request_interval_seconds: float
+    min_sample_size: int
+
+    @classmethod
+    def from_env(cls, env: Any) -> "CollectorConfig":
+        get_param = env["ir.config_parameter"].sudo().get_param
+        return cls(
+            parallelism=max(int(get_param("estate_kit.krisha_snapshot_parallelism", "3")), 1),
+            request_interval_seconds=float(get_param("estate_kit.krisha_request_interval_seconds", "3.0")),
+            min_sample_size=int(get_param("estate_kit.krisha_snapshot_min_samples", "20")),
+        )
@@ -0,0 +1,37 @@
+from ....property.services.krisha_scraping import (
+    HtmlFallbackParser,
+    HttpSession,
+    ListingPageParser,
+    PriceParser,
+    RoomsExtractor,
+)
+from ..benchmark_resolver.sample_aggregator import SampleAggregator
+from .config import CollectorConfig
+from .host_rate_limiter import HostRateLimiter
+from .listing_url_builder import ListingUrlBuilder
+from .protocols import IHttpSession
+from .rate_limited_session import RateLimitedHttpSession
+from .service import SnapshotCollectorService
+from .slice_crawler import SliceCrawler
+from .snapshot_writer import SnapshotWriter
+from .target_loader import TargetLoader
+
+
+class Factory:
+    @staticmethod
+    def create(env, session_factory=None) -> SnapshotCollectorService:
+        config = CollectorConfig.from_env(env)
+        rate_limiter = HostRateLimiter(config.request_interval_seconds)
+        base_session_factory = session_factory or HttpSession
+
+        def create_session() -> IHttpSession:
+            return RateLimitedHttpSession(base_session_factory(), rate_limiter)
+
+        listing_parser = ListingPageParser(HtmlFallbackParser(RoomsExtractor(), PriceParser()))
+        return SnapshotCollectorService(
+            target_loader=TargetLoader(env),
+            crawler=SliceCrawler(create_session, listing_parser, ListingUrlBuilder()),
+            writer=SnapshotWriter(env, SampleAggregator(min_sample_size=config.min_sample_size)),
+            config=config,
+            env=env,
+        )
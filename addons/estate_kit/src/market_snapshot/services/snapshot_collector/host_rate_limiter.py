@@ -0,0 +1,20 @@
+import threading
+import time
+from urllib.parse import urlparse
+
+
+class HostRateLimiter:
+    def __init__(self, min_interval_seconds: float) -> None:
+        self._min_interval = min_interval_seconds
+        self._next_allowed: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url: str) -> None:
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_allowed.get(host, now))
+            self._next_allowed[host] = slot + self._min_interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
@@ -0,0 +1,27 @@
+from urllib.parse import urlencode
+
+from ....property.services.krisha_scraping.config import BASE_URL
+from .slice_target import SliceTarget
+
+_CATEGORY_SLUG: dict[str, str] = {
+    "apartment": "kvartiry",
+    "house": "doma-dachi",
+    "townhouse": "doma-dachi",
+    "commercial": "kommercheskaya-nedvizhimost",
+    "land": "uchastkov",
+}
+
+
+class ListingUrlBuilder:
+    def build(self, target: SliceTarget, page: int) -> str:
+        query: list[tuple[str, str]] = []
+        if target.rooms:
+            query.append(("das[live.rooms]", str(target.rooms)))
+        if page > 1:
+            query.append(("page", str(page)))
+        url = "%s/prodazha/%s/%s/" % (
+            BASE_URL,
+            _CATEGORY_SLUG.get(target.property_type, "kvartiry"),
+            target.city_code,
+        )
+        return "%s?%s" % (url, urlencode(query)) if query else url
@@ -0,0 +1,19 @@
+from .i_host_rate_limiter import IHostRateLimiter
+from .i_http_session import IHttpSession
+from .i_listing_page_parser import IListingPageParser
+from .i_listing_url_builder import IListingUrlBuilder
+from .i_sample_aggregator import ISampleAggregator
+from .i_slice_crawler import ISliceCrawler
+from .i_snapshot_writer import ISnapshotWriter
+from .i_target_loader import ITargetLoader
+
+__all__ = [
+    "IHostRateLimiter",
+    "IHttpSession",
+    "IListingPageParser",
+    "IListingUrlBuilder",
+    "ISampleAggregator",
+    "ISliceCrawler",
+    "ISnapshotWriter",
+    "ITargetLoader",
+]
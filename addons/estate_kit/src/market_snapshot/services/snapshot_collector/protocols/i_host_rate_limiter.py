@@ -0,0 +1,5 @@
+from typing import Protocol
+
+
+class IHostRateLimiter(Protocol):
+    def wait(self, url: str) -> None: ...
@@ -0,0 +1,3 @@
+from .....property.services.krisha_scraping.protocols import IHttpSession
+
+__all__ = ["IHttpSession"]
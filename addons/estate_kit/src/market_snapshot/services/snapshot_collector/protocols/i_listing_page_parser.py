@@ -0,0 +1,3 @@
+from .....property.services.krisha_scraping.protocols import IListingPageParser
+
+__all__ = ["IListingPageParser"]
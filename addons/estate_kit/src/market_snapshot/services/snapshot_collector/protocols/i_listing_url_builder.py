@@ -0,0 +1,7 @@
+from typing import Protocol
+
+from ..slice_target import SliceTarget
+
+
+class IListingUrlBuilder(Protocol):
+    def build(self, target: SliceTarget, page: int) -> str: ...
@@ -0,0 +1,8 @@
+from typing import Protocol
+
+from ..slice_samples import SliceSamples
+from ..slice_target import SliceTarget
+
+
+class ISliceCrawler(Protocol):
+    def crawl(self, target: SliceTarget) -> SliceSamples: ...
@@ -0,0 +1,7 @@
+from typing import Protocol
+
+from ..slice_samples import SliceSamples
+
+
+class ISnapshotWriter(Protocol):
+    def write(self, slice_samples: SliceSamples) -> int | None: ...
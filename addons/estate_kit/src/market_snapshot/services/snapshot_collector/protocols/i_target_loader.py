@@ -0,0 +1,7 @@
+from typing import Protocol
+
+from ..slice_target import SliceTarget
+
+
+class ITargetLoader(Protocol):
+    def load(self) -> list[SliceTarget]: ...
@@ -0,0 +1,15 @@
+from .protocols import IHostRateLimiter, IHttpSession
+
+
+class RateLimitedHttpSession:
+    def __init__(self, session: IHttpSession, rate_limiter: IHostRateLimiter) -> None:
+        self._session = session
+        self._rate_limiter = rate_limiter
+
+    def get_text(self, url: str) -> str:
+        self._rate_limiter.wait(url)
+        return self._session.get_text(url)
+
+    def get_bytes(self, url: str) -> bytes:
+        self._rate_limiter.wait(url)
+        return self._session.get_bytes(url)
@@ -0,0 +1,61 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any
+
+from .config import CollectorConfig
+from .protocols import ISliceCrawler, ISnapshotWriter, ITargetLoader
+
+_logger = logging.getLogger(__name__)
+
+_LOG_CATEGORY = "market_snapshot"
+
+
+class SnapshotCollectorService:
+    def __init__(
+        self,
+        target_loader: ITargetLoader,
+        crawler: ISliceCrawler,
+        writer: ISnapshotWriter,
+        config: CollectorConfig,
+        env: Any,
+    ) -> None:
+        self._target_loader = target_loader
+        self._crawler = crawler
+        self._writer = writer
+        self._config = config
+        self._env = env
+
+    def collect(self) -> dict[str, int]:
+        targets = self._target_loader.load()
+        report = {"slices": len(targets), "created": 0, "skipped": 0, "failed": 0}
+        if not targets:
+            return report
+
+        # Потоки только ходят в сеть и парсят HTML; запись в БД — в текущем потоке с его курсором
+        with ThreadPoolExecutor(max_workers=min(self._config.parallelism, len(targets))) as executor:
+            futures = [executor.submit(self._crawler.crawl, target) for target in targets]
+            for future in as_completed(futures):
+                slice_samples = future.result()
+                target = slice_samples.target
+                if slice_samples.error:
+                    report["failed"] += 1
+                    _logger.warning("Срез config=%s: ошибка сбора: %s", target.config_id, slice_samples.error)
+                    continue
+                if self._writer.write(slice_samples) is None:
+                    report["skipped"] += 1
+                    _logger.info(
+                        "Срез config=%s: недостаточно выборки (%d из %d объявлений)",
+                        target.config_id,
+                        len(slice_samples.samples_per_sqm),
+                        slice_samples.listings_seen,
+                    )
+                    continue
+                report["created"] += 1
+
+        self._env["estate.kit.log"].log(
+            _LOG_CATEGORY,
+            "Сбор снапшотов рынка: создано %(created)d из %(slices)d срезов" % report,
+            details="Пропущено (мало выборки): %(skipped)d, ошибок: %(failed)d" % report,
+            level="warning" if report["failed"] else "info",
+        )
+        return report
@@ -0,0 +1,59 @@
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import requests
+
+from .protocols import IHttpSession, IListingPageParser, IListingUrlBuilder
+from .slice_samples import SliceSamples
+from .slice_target import SliceTarget
+
+
+class SliceCrawler:
+    def __init__(
+        self,
+        session_factory: Callable[[], IHttpSession],
+        listing_parser: IListingPageParser,
+        url_builder: IListingUrlBuilder,
+    ) -> None:
+        self._session_factory = session_factory
+        self._listing_parser = listing_parser
+        self._url_builder = url_builder
+
+    def crawl(self, target: SliceTarget) -> SliceSamples:
+        samples: list[float] = []
+        seen = 0
+        try:
+            for item in self._iter_listings(target):
+                seen += 1
+                price_per_sqm = self._price_per_sqm(item, target)
+                if price_per_sqm is not None:
+                    samples.append(price_per_sqm)
+        except (requests.RequestException, ValueError, KeyError, TypeError) as e:
+            # Сеть или вёрстка страницы: срез помечается ошибкой, остальные собираются дальше
+            return SliceSamples(target=target, samples_per_sqm=samples, listings_seen=seen, error=str(e))
+        return SliceSamples(target=target, samples_per_sqm=samples, listings_seen=seen)
+
+    def _iter_listings(self, target: SliceTarget) -> Iterator[dict[str, Any]]:
+        # Сессия на срез: requests.Session не потокобезопасна, а каждый срез обходится в одном потоке
+        session = self._session_factory()
+        seen_ids: set[int] = set()
+        for page in range(1, target.max_pages + 1):
+            items = self._listing_parser.parse(session.get_text(self._url_builder.build(target, page)))
+            fresh = [item for item in items if item["krisha_id"] not in seen_ids]
+            if not fresh:
+                return
+            seen_ids.update(item["krisha_id"] for item in fresh)
+            yield from fresh
+
+    @staticmethod
+    def _price_per_sqm(item: dict[str, Any], target: SliceTarget) -> float | None:
+        price = item.get("price") or 0
+        area = item.get("area") or 0.0
+        if price <= 0 or area <= 0:
+            return None
+        if target.rooms and item.get("rooms") != target.rooms:
+            return None
+        address_title = (item.get("address_title") or "").lower()
+        if target.district_krisha_name and target.district_krisha_name.lower() not in address_title:
+            return None
+        return price / area
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+from .slice_target import SliceTarget
+
+
+@dataclass(frozen=True)
+class SliceSamples:
+    target: SliceTarget
+    samples_per_sqm: list[float]
+    listings_seen: int
+    error: str | None = None
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SliceTarget:
+    config_id: int
+    city_id: int
+    city_code: str
+    district_id: int | None
+    district_krisha_name: str | None
+    property_type: str
+    rooms: int
+    max_pages: int
@@ -0,0 +1,29 @@
+from typing import Any
+
+from .protocols import ISampleAggregator
+from .slice_samples import SliceSamples
+
+
+class SnapshotWriter:
+    def __init__(self, env: Any, aggregator: ISampleAggregator) -> None:
+        self._env = env
+        self._aggregator = aggregator
+
+    def write(self, slice_samples: SliceSamples) -> int | None:
+        stats = self._aggregator.aggregate([slice_samples.samples_per_sqm])
+        if stats is None:
+            return None
+        target = slice_samples.target
+        snapshot = self._env["estate.market.snapshot"].sudo().create({
+            "city_id": target.city_id,
+            "district_id": target.district_id or False,
+            "property_type": target.property_type,
+            "rooms": target.rooms,
+            "sample_size": stats.sample_size,
+            "median_price_per_sqm": stats.median_price_per_sqm,
+            "p25_price_per_sqm": stats.p25_price_per_sqm,
+            "p75_price_per_sqm": stats.p75_price_per_sqm,
+            "samples_per_sqm": slice_samples.samples_per_sqm,
+            "source": "krisha",
+        })
+        return snapshot.id
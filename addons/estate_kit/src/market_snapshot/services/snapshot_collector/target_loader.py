@@ -0,0 +1,28 @@
+from typing import Any
+
+from .slice_target import SliceTarget
+
+
+class TargetLoader:
+    def __init__(self, env: Any) -> None:
+        self._env = env
+
+    def load(self) -> list[SliceTarget]:
+        configs = self._env["estate.market.snapshot.config"].sudo().search([])
+        targets: list[SliceTarget] = []
+        for config in configs:
+            if not config.city_id.code:
+                continue
+            if config.district_id and not config.district_id.krisha_name:
+                continue
+            targets.append(SliceTarget(
+                config_id=config.id,
+                city_id=config.city_id.id,
+                city_code=config.city_id.code,
+                district_id=config.district_id.id or None,
+                district_krisha_name=config.district_id.krisha_name or None,
+                property_type=config.property_type,
+                rooms=config.rooms or 0,
+                max_pages=config.max_pages,
+            ))
+        return targets
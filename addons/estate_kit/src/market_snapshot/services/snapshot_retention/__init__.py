@@ -0,0 +1,3 @@
+from .factory import Factory
+
+__all__ = ["Factory"]
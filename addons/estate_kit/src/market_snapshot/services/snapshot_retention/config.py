@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class RetentionConfig:
+    retention_days: int
+    batch_size: int
+
+    @classmethod
+    def from_env(cls, env: Any, window_days: int) -> "RetentionConfig":
+        get_param = env["ir.config_parameter"].sudo().get_param
+        # Удалять снапшоты внутри окна агрегации нельзя — бенчмарки пересчитываются по ним
+        retention_days = int(get_param("estate_kit.snapshot_retention_days", str(window_days)))
+        return cls(
+            retention_days=max(retention_days, window_days),
+            batch_size=int(get_param("estate_kit.snapshot_retention_batch_size", "1000")),
+        )
@@ -0,0 +1,20 @@
+from ..benchmark_resolver.config import BenchmarkResolverConfig
+from ..benchmark_resolver.sample_aggregator import SampleAggregator
+from .config import RetentionConfig
+from .monthly_aggregate_store import MonthlyAggregateStore
+from .monthly_rollup import MonthlyRollup
+from .service import SnapshotRetentionService
+from .snapshot_archive import SnapshotArchive
+
+
+class Factory:
+    @staticmethod
+    def create(env) -> SnapshotRetentionService:
+        resolver_config = BenchmarkResolverConfig.from_env(env)
+        return SnapshotRetentionService(
+            archive=SnapshotArchive(env),
+            monthly_store=MonthlyAggregateStore(env),
+            rollup=MonthlyRollup(SampleAggregator(min_sample_size=resolver_config.min_aggregated_sample_size)),
+            config=RetentionConfig.from_env(env, resolver_config.window_days),
+            env=env,
+        )
@@ -0,0 +1,90 @@
+from ..benchmark_resolver.protocols import AggregatedStats, QuantileSketch
+from .protocols import MonthKey, MonthlyAggregate
+
+
+class MonthlyAggregateStore:
+    def __init__(self, env) -> None:
+        self._env = env
+
+    def fetch_many(self, keys: list[MonthKey]) -> dict[MonthKey, MonthlyAggregate]:
+        if not keys:
+            return {}
+        self._env.cr.execute(
+            """
+            SELECT v.city_id, v.district_id, v.property_type, v.rooms, v.month,
+                   m.snapshot_count, m.sample_size, m.median_price_per_sqm,
+                   m.p25_price_per_sqm, m.p75_price_per_sqm, m.samples_sketch
+            FROM unnest(%s::int[], %s::int[], %s::varchar[], %s::int[], %s::date[])
+                AS v(city_id, district_id, property_type, rooms, month)
+            JOIN estate_market_snapshot_monthly m
+              ON m.city_id = v.city_id
+             AND COALESCE(m.district_id, 0) = v.district_id
+             AND m.property_type = v.property_type
+             AND m.rooms = v.rooms
+             AND m.month = v.month
+            """,
+            [
+                [key[0][0] for key in keys],
+                [key[0][1] or 0 for key in keys],
+                [key[0][2] for key in keys],
+                [key[0][3] or 0 for key in keys],
+                [key[1] for key in keys],
+            ],
+        )
+        result: dict[MonthKey, MonthlyAggregate] = {}
+        for row in self._env.cr.fetchall():
+            slice_key = (row[0], row[1] or None, row[2], row[3])
+            sample_size = row[6] or 0
+            result[(slice_key, row[4])] = MonthlyAggregate(
+                slice_key=slice_key,
+                month=row[4],
+                snapshot_count=row[5] or 0,
+                stats=AggregatedStats(
+                    sample_size=sample_size,
+                    median_price_per_sqm=row[7],
+                    p25_price_per_sqm=row[8],
+                    p75_price_per_sqm=row[9],
+                ),
+                sketch=QuantileSketch(weight=sample_size, points=list(row[10])) if row[10] else None,
+            )
+        return result
+
+    def upsert(self, aggregate: MonthlyAggregate) -> None:
+        city_id, district_id, property_type, rooms = aggregate.slice_key
+        stats = aggregate.stats
+        self._env.cr.execute(
+            """
+            INSERT INTO estate_market_snapshot_monthly
+                (city_id, district_id, property_type, rooms, month,
+                 snapshot_count, sample_size, median_price_per_sqm,
+                 p25_price_per_sqm, p75_price_per_sqm, samples_sketch,
+                 create_uid, create_date, write_uid, write_date)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
+                    %s, now() at time zone 'UTC', %s, now() at time zone 'UTC')
+            ON CONFLICT (city_id, (COALESCE(district_id, 0)), property_type, rooms, month) DO UPDATE
+            SET snapshot_count = EXCLUDED.snapshot_count,
+                sample_size = EXCLUDED.sample_size,
+                median_price_per_sqm = EXCLUDED.median_price_per_sqm,
+                p25_price_per_sqm = EXCLUDED.p25_price_per_sqm,
+                p75_price_per_sqm = EXCLUDED.p75_price_per_sqm,
+                samples_sketch = EXCLUDED.samples_sketch,
+                write_uid = EXCLUDED.write_uid,
+                write_date = EXCLUDED.write_date
+            """,
+            [
+                city_id,
+                district_id,
+                property_type,
+                rooms or 0,
+                aggregate.month,
+                aggregate.snapshot_count,
+                stats.sample_size,
+                stats.median_price_per_sqm,
+                stats.p25_price_per_sqm,
+                stats.p75_price_per_sqm,
+                aggregate.sketch.points if aggregate.sketch else None,
+                self._env.uid,
+                self._env.uid,
+            ],
+        )
+        self._env["estate.market.snapshot.monthly"].invalidate_model()
@@ -0,0 +1,44 @@
+from ..benchmark_resolver.protocols import AggregatedStats, QuantileSketch
+from ..benchmark_resolver.sample_aggregator import stats_from_sketch, weighted_stats
+from .protocols import ISampleAggregator, MonthlyAggregate
+from .snapshot_row import SnapshotRow
+
+
+class MonthlyRollup:
+    def __init__(self, aggregator: ISampleAggregator) -> None:
+        self._aggregator = aggregator
+
+    def merge(self, existing: MonthlyAggregate | None, rows: list[SnapshotRow]) -> MonthlyAggregate:
+        parts: list[tuple[AggregatedStats, QuantileSketch | None]] = [
+            (self._row_stats(row), self._row_sketch(row)) for row in rows
+        ]
+        if existing is not None:
+            parts.append((existing.stats, existing.sketch))
+
+        sketches = [sketch for _, sketch in parts if sketch is not None]
+        merged = self._aggregator.merge_sketches(sketches) if len(sketches) == len(parts) else None
+        stats = stats_from_sketch(merged) if merged is not None else weighted_stats([s for s, _ in parts])
+        return MonthlyAggregate(
+            slice_key=rows[0].slice_key,
+            month=rows[0].month,
+            snapshot_count=len(rows) + (existing.snapshot_count if existing is not None else 0),
+            stats=stats,
+            sketch=merged,
+        )
+
+    def _row_sketch(self, row: SnapshotRow) -> QuantileSketch | None:
+        if row.sketch:
+            return QuantileSketch(weight=row.sample_size, points=list(row.sketch))
+        if row.raw_samples:
+            return self._aggregator.build_sketch(sorted(row.raw_samples))
+        return None
+
+    @staticmethod
+    def _row_stats(row: SnapshotRow) -> AggregatedStats:
+        return AggregatedStats(
+            sample_size=row.sample_size,
+            median_price_per_sqm=row.median_price_per_sqm,
+            p25_price_per_sqm=row.p25_price_per_sqm,
+            p75_price_per_sqm=row.p75_price_per_sqm,
+        )
+
@@ -0,0 +1,13 @@
+from .i_monthly_aggregate_store import IMonthlyAggregateStore, MonthKey, MonthlyAggregate
+from .i_monthly_rollup import IMonthlyRollup
+from .i_sample_aggregator import ISampleAggregator
+from .i_snapshot_archive import ISnapshotArchive
+
+__all__ = [
+    "IMonthlyAggregateStore",
+    "IMonthlyRollup",
+    "ISampleAggregator",
+    "ISnapshotArchive",
+    "MonthKey",
+    "MonthlyAggregate",
+]
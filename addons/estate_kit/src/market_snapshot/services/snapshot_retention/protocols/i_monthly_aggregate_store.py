@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Protocol
+
+from ...benchmark_resolver.market_slice import MarketSlice
+from ...benchmark_resolver.protocols import AggregatedStats, QuantileSketch
+
+MonthKey = tuple[MarketSlice, date]
+
+
+@dataclass(frozen=True)
+class MonthlyAggregate:
+    slice_key: MarketSlice
+    month: date
+    snapshot_count: int
+    stats: AggregatedStats
+    sketch: QuantileSketch | None
+
+
+class IMonthlyAggregateStore(Protocol):
+    def fetch_many(self, keys: list[MonthKey]) -> dict[MonthKey, MonthlyAggregate]: ...
+
+    def upsert(self, aggregate: MonthlyAggregate) -> None: ...
@@ -0,0 +1,8 @@
+from typing import Protocol
+
+from ..snapshot_row import SnapshotRow
+from .i_monthly_aggregate_store import MonthlyAggregate
+
+
+class IMonthlyRollup(Protocol):
+    def merge(self, existing: MonthlyAggregate | None, rows: list[SnapshotRow]) -> MonthlyAggregate: ...
@@ -0,0 +1,3 @@
+from ...benchmark_resolver.protocols import ISampleAggregator
+
+__all__ = ["ISampleAggregator"]
@@ -0,0 +1,16 @@
+from datetime import datetime
+from typing import Protocol
+
+from ..snapshot_row import SnapshotRow
+
+
+class ISnapshotArchive(Protocol):
+    def find_expired_ids(self, cutoff: datetime, limit: int) -> list[int]: ...
+
+    def read_rows(self, snapshot_ids: list[int]) -> list[SnapshotRow]: ...
+
+    def row_bytes(self, snapshot_ids: list[int]) -> int: ...
+
+    def delete(self, snapshot_ids: list[int]) -> int: ...
+
+    def table_bytes(self) -> int: ...
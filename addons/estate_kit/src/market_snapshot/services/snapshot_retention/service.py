@@ -0,0 +1,79 @@
+import logging
+from collections import defaultdict
+from datetime import timedelta
+
+from odoo import fields
+
+from ..benchmark_resolver.benchmark_cache import invalidate_benchmark_cache
+from ..market_trend import invalidate_trend_cache
+from .config import RetentionConfig
+from .protocols import IMonthlyAggregateStore, IMonthlyRollup, ISnapshotArchive, MonthKey
+from .snapshot_row import SnapshotRow
+
+_logger = logging.getLogger(__name__)
+
+_LOG_CATEGORY = "market_snapshot"
+
+
+class SnapshotRetentionService:
+    def __init__(
+        self,
+        archive: ISnapshotArchive,
+        monthly_store: IMonthlyAggregateStore,
+        rollup: IMonthlyRollup,
+        config: RetentionConfig,
+        env,
+    ) -> None:
+        self._archive = archive
+        self._monthly_store = monthly_store
+        self._rollup = rollup
+        self._config = config
+        self._env = env
+
+    def rollup(self) -> dict[str, int]:
+        cutoff = fields.Datetime.now() - timedelta(days=self._config.retention_days)
+        table_bytes_before = self._archive.table_bytes()
+        report = {"deleted": 0, "months": 0, "freed_bytes": 0}
+
+        while True:
+            snapshot_ids = self._archive.find_expired_ids(cutoff, self._config.batch_size)
+            if not snapshot_ids:
+                break
+            report["months"] += self._rollup_batch(self._archive.read_rows(snapshot_ids))
+            report["freed_bytes"] += self._archive.row_bytes(snapshot_ids)
+            report["deleted"] += self._archive.delete(snapshot_ids)
+            # Свёртка и удаление пачки — одна транзакция: снапшот не может попасть в агрегат дважды
+            self._env.cr.commit()
+
+        if not report["deleted"]:
+            return report
+
+        invalidate_benchmark_cache(self._env)
+        invalidate_trend_cache(self._env.cr.dbname)
+        report["table_bytes_before"] = table_bytes_before
+        report["table_bytes_after"] = self._archive.table_bytes()
+        _logger.info(
+            "Свёртка снапшотов: удалено %d строк, обновлено %d месячных агрегатов, освобождено ~%d байт",
+            report["deleted"],
+            report["months"],
+            report["freed_bytes"],
+        )
+        self._env["estate.kit.log"].log(
+            _LOG_CATEGORY,
+            "Свёртка снапшотов старше %d дн.: удалено %d, освобождено ~%d КБ"
+            % (self._config.retention_days, report["deleted"], report["freed_bytes"] // 1024),
+            details=(
+                "Месячных агрегатов обновлено: %(months)d. Размер таблицы: %(table_bytes_before)d → "
+                "%(table_bytes_after)d байт (место возвращается после autovacuum)" % report
+            ),
+        )
+        return report
+
+    def _rollup_batch(self, rows: list[SnapshotRow]) -> int:
+        groups: dict[MonthKey, list[SnapshotRow]] = defaultdict(list)
+        for row in rows:
+            groups[(row.slice_key, row.month)].append(row)
+        existing = self._monthly_store.fetch_many(list(groups))
+        for key, group in groups.items():
+            self._monthly_store.upsert(self._rollup.merge(existing.get(key), group))
+        return len(groups)
@@ -0,0 +1,74 @@
+from datetime import datetime
+
+from .snapshot_row import SnapshotRow
+
+
+class SnapshotArchive:
+    def __init__(self, env) -> None:
+        self._env = env
+
+    def find_expired_ids(self, cutoff: datetime, limit: int) -> list[int]:
+        self._env.cr.execute(
+            """
+            SELECT id
+            FROM estate_market_snapshot
+            WHERE collected_at < %s
+            ORDER BY id
+            LIMIT %s
+            """,
+            [cutoff, limit],
+        )
+        return [row[0] for row in self._env.cr.fetchall()]
+
+    def read_rows(self, snapshot_ids: list[int]) -> list[SnapshotRow]:
+        self._env.cr.execute(
+            """
+            SELECT
+                city_id,
+                district_id,
+                property_type,
+                rooms,
+                date_trunc('month', collected_at)::date,
+                sample_size,
+                median_price_per_sqm,
+                p25_price_per_sqm,
+                p75_price_per_sqm,
+                samples_sketch,
+                CASE WHEN samples_sketch IS NULL THEN samples_per_sqm END
+            FROM estate_market_snapshot
+            WHERE id = ANY(%s)
+            """,
+            [snapshot_ids],
+        )
+        return [
+            SnapshotRow(
+                slice_key=(row[0], row[1], row[2], row[3] or 0),
+                month=row[4],
+                sample_size=row[5],
+                median_price_per_sqm=row[6],
+                p25_price_per_sqm=row[7],
+                p75_price_per_sqm=row[8],
+                sketch=row[9],
+                raw_samples=row[10],
+            )
+            for row in self._env.cr.fetchall()
+        ]
+
+    def row_bytes(self, snapshot_ids: list[int]) -> int:
+        self._env.cr.execute(
+            "SELECT COALESCE(sum(pg_column_size(s.*)), 0) FROM estate_market_snapshot s WHERE id = ANY(%s)",
+            [snapshot_ids],
+        )
+        return int(self._env.cr.fetchone()[0])
+
+    def delete(self, snapshot_ids: list[int]) -> int:
+        self._env.cr.execute("DELETE FROM estate_market_snapshot WHERE id = ANY(%s)", [snapshot_ids])
+        deleted = self._env.cr.rowcount
+        # Строки бенчмарков с этими снапшотами удаляются каскадом на уровне БД
+        self._env["estate.market.snapshot"].invalidate_model()
+        self._env["estate.market.benchmark"].invalidate_model()
+        return deleted
+
+    def table_bytes(self) -> int:
+        self._env.cr.execute("SELECT pg_total_relation_size('estate_market_snapshot')")
+        return int(self._env.cr.fetchone()[0])
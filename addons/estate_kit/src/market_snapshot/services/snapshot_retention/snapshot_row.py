@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from datetime import date
+
+from ..benchmark_resolver.market_slice import MarketSlice
+
+
+@dataclass(frozen=True)
+class SnapshotRow:
+    slice_key: MarketSlice
+    month: date
+    sample_size: int
+    median_price_per_sqm: float
+    p25_price_per_sqm: float
+    p75_price_per_sqm: float
+    sketch: list[float] | None
+    raw_samples: list[float] | None
@@ -1,5 +1,8 @@
 from . import estate_property
 from . import estate_property_scoring
+from . import estate_property_scoring_batch_item
+from . import estate_property_scoring_cache
+from . import estate_property_similar
 from . import estate_property_image
 from . import estate_property_tier
 from . import krisha_import_wizard
@@ -1,7 +1,15 @@
+import logging
+
+import psycopg2
 from odoo import api, fields, models
 from odoo.exceptions import UserError
 
 from ..services.locator import ServiceLocator
+from ..services.marketing_pool.mps_dirty_marker import MPS_TRIGGER_FIELDS
+from ..services.similar_picker.config import SIMILAR_TRIGGER_FIELDS
+from ..services.unified_search.property_text_search import TEXT_DOCUMENT_SQL, TRIGRAM_DOCUMENT_SQL
+
+_logger = logging.getLogger(__name__)
 
 
 class EstateProperty(models.Model):
@@ -470,6 +478,27 @@ class EstateProperty(models.Model):
         string="MPS",
         copy=False,
     )
+    mps_dirty = fields.Boolean(
+        string="MPS требует пересчёта",
+        default=True,
+        copy=False,
+        index=True,
+        help="Изменились данные, влияющие на MPS: скоринг, тир-листы, статус или теги",
+    )
+    similar_dirty = fields.Boolean(
+        string="Похожие требуют пересчёта",
+        default=True,
+        copy=False,
+        index=True,
+        help="Изменились цена, площадь, комнаты, район или статус — предрасчитанные похожие устарели",
+    )
+    similar_corridor_dirty = fields.Boolean(
+        string="Коридор похожих требует разметки",
+        copy=False,
+        index=True,
+        help="Объект изменился и может войти в топ соседей из своего ценового и площадного коридора — "
+        "cron пересчёта похожих размечает их к пересчёту",
+    )
 
     # === Медиа ===
     image_ids = fields.One2many(
@@ -492,11 +521,68 @@ class EstateProperty(models.Model):
     @api.model_create_multi
     def create(self, vals_list):
         self._svc.validator.validate_create(vals_list, self.env.context)
-        return super().create(vals_list)
+        records = super().create(vals_list)
+        # Новый объект может войти в топ соседей того же города и типа — их пересчитывает тот же cron
+        self._svc.similar_store.mark_dirty(records.ids)
+        self._trigger_similar_refresh()
+        return records
 
     def write(self, vals):
         self._svc.validator.validate_write(self, vals, self.env.context)
-        return super().write(vals)
+        if MPS_TRIGGER_FIELDS.intersection(vals):
+            vals = dict(vals, mps_dirty=True)
+        result = super().write(vals)
+        if SIMILAR_TRIGGER_FIELDS.intersection(vals):
+            self._svc.similar_store.mark_dirty(self.ids)
+            self._trigger_similar_refresh()
+        return result
+
+    def _trigger_similar_refresh(self):
+        cron = self.env.ref("estate_kit.cron_refresh_similar_properties", raise_if_not_found=False)
+        if cron:
+            cron.sudo()._trigger()
+
+    def init(self):
+        super().init()
+        # Индекс под ценовой/площадной срез кандидатов для похожих объектов
+        self.env.cr.execute(
+            """
+            CREATE INDEX IF NOT EXISTS estate_property_similar_candidates_idx
+            ON estate_property (city_id, property_type, price, area_total)
+            WHERE state IN ('active', 'published', 'mls_listed')
+            """
+        )
+        # Keyset-пагинация единого поиска: ORDER BY create_date DESC, id DESC
+        self.env.cr.execute(
+            """
+            CREATE INDEX IF NOT EXISTS estate_property_unified_search_keyset_idx
+            ON estate_property (create_date DESC, id DESC)
+            WHERE active
+            """
+        )
+        # Текстовый критерий единого поиска: словоформы (russian) и триграммы вместо ilike по всей таблице
+        self.env.cr.execute(
+            f"""
+            CREATE INDEX IF NOT EXISTS estate_property_text_search_idx
+            ON estate_property USING gin ({TEXT_DOCUMENT_SQL})
+            WHERE active
+            """
+        )
+        if not self.env.registry.has_trigram:
+            try:
+                with self.env.cr.savepoint(flush=False):
+                    self.env.cr.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+                self.env.registry.has_trigram = True
+            except psycopg2.Error:
+                _logger.warning("pg_trgm недоступен, нечёткий поиск по названию и адресу отключён")
+        if self.env.registry.has_trigram:
+            self.env.cr.execute(
+                f"""
+                CREATE INDEX IF NOT EXISTS estate_property_trigram_search_idx
+                ON estate_property USING gin ({TRIGRAM_DOCUMENT_SQL} gin_trgm_ops)
+                WHERE active
+                """
+            )
 
     # =========================================================================
     # Compute / onchange
@@ -666,6 +752,10 @@ class EstateProperty(models.Model):
     def _cron_rotate_pool(self):
         self._svc.pool_rotation.rotate_pool()
 
+    @api.model
+    def rpc_rotate_pool_dry_run(self):
+        return self._svc.pool_rotation.rotate_pool(dry_run=True)
+
     @api.model
     def _cron_create_callback_activities(self):
         self._svc.pool_rotation.create_callback_activities()
@@ -679,8 +769,8 @@ class EstateProperty(models.Model):
     # =========================================================================
 
     @api.model
-    def search_unified(self, criteria, limit=50, offset=0, count=False):
-        return self._svc.unified_search.search_unified(criteria, limit, offset, count)
+    def search_unified(self, criteria, limit=50, offset=0, count=False, with_status=False, cursor=None):
+        return self._svc.unified_search.search_unified(criteria, limit, offset, count, with_status, cursor)
 
     # =========================================================================
     # Actions — public view delegates
@@ -2,6 +2,9 @@ from odoo import api, fields, models
 
 from ..services.ai_scoring import Factory as AiScoringFactory
 from ..services.ai_scoring.score_colorizer import ScoreColorizer
+from ..services.marketing_pool.mps_dirty_marker import MpsDirtyMarker
+from ..services.price_refresh import Factory as PriceRefreshFactory
+from ..services.scoring_batch import Factory as ScoringBatchFactory
 
 _score_colorizer = ScoreColorizer()
 
@@ -32,6 +35,20 @@ class EstatePropertyScoring(models.Model):
     )
     rationale = fields.Text(string="Обоснование")
     scored_at = fields.Datetime(string="Дата оценки", default=fields.Datetime.now)
+    benchmark_snapshot_id = fields.Integer(
+        string="Снапшот бенчмарка",
+        help="Последний снапшот рынка, по которому пересобран ценовой блок обоснования",
+    )
+    benchmark_median_per_sqm = fields.Float(
+        string="Медиана бенчмарка, ₸/м²",
+        help="Медиана рынка, по которой пересобран ценовой блок обоснования",
+    )
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        MpsDirtyMarker(self.env).mark_properties(records.mapped("property_id").ids)
+        return records
 
     @api.depends("price_score", "quality_score", "listing_score")
     def _compute_score_color(self):
@@ -43,3 +60,15 @@ class EstatePropertyScoring(models.Model):
     @api.model
     def score_property(self, property_id: int):
         return AiScoringFactory.create(self.env).score(property_id)
+
+    @api.model
+    def submit_scoring_batch(self, property_ids: list[int]) -> bool:
+        return ScoringBatchFactory.create(self.env).submit(property_ids)
+
+    @api.model
+    def _cron_poll_scoring_batch(self):
+        ScoringBatchFactory.create(self.env).poll()
+
+    @api.model
+    def _cron_refresh_price_scores(self):
+        PriceRefreshFactory.create(self.env).refresh()
@@ -0,0 +1,19 @@
+from odoo import fields, models
+
+
+class EstatePropertyScoringBatchItem(models.Model):
+    _name = "estate.property.scoring.batch.item"
+    _description = "Запрос пакетного AI-скоринга"
+
+    batch_id = fields.Char(string="Пакет", required=True, index=True)
+    property_id = fields.Many2one(
+        "estate.property",
+        string="Объект",
+        required=True,
+        ondelete="cascade",
+    )
+    with_benchmark = fields.Boolean(string="С рыночным бенчмарком")
+    price_score = fields.Integer(string="Цена по формуле (балл)")
+    price_block = fields.Text(string="Ценовой блок обоснования")
+    system_prompt = fields.Text(string="Системный промпт")
+    user_message = fields.Text(string="Сообщение")
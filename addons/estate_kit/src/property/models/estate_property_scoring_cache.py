@@ -0,0 +1,33 @@
+from odoo import api, fields, models
+
+from ..services.marketing_pool.response_cache_config import ResponseCacheConfig
+from ..services.marketing_pool.scoring_response_cache import ScoringResponseCache
+
+
+class EstatePropertyScoringCache(models.Model):
+    _name = "estate.property.scoring.cache"
+    _description = "Кэш ответов AI-скоринга"
+    _order = "last_used_at desc"
+    _rec_name = "key"
+
+    key = fields.Char(string="Хэш запроса", required=True, index=True)
+    model = fields.Char(string="Модель", required=True)
+    response_text = fields.Text(string="Ответ модели", required=True)
+    hit_count = fields.Integer(string="Попаданий", default=0)
+    last_used_at = fields.Datetime(
+        string="Последнее использование",
+        default=fields.Datetime.now,
+        index=True,
+    )
+
+    _sql_constraints = [
+        (
+            "key_unique",
+            "UNIQUE (key)",
+            "Запись кэша с таким хэшем уже существует.",
+        ),
+    ]
+
+    @api.model
+    def _cron_evict(self):
+        ScoringResponseCache(self.env, ResponseCacheConfig.from_env(self.env)).evict()
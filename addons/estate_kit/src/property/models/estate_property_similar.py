@@ -0,0 +1,36 @@
+from odoo import api, fields, models
+
+from ..services.similar_refresh import Factory as SimilarRefreshFactory
+
+
+class EstatePropertySimilar(models.Model):
+    _name = "estate.property.similar"
+    _description = "Похожий объект (предрасчёт)"
+    _order = "property_id, rank"
+
+    property_id = fields.Many2one(
+        "estate.property",
+        string="Объект",
+        required=True,
+        ondelete="cascade",
+    )
+    similar_id = fields.Many2one(
+        "estate.property",
+        string="Похожий объект",
+        required=True,
+        ondelete="cascade",
+        index=True,
+    )
+    rank = fields.Integer(string="Позиция", required=True)
+
+    def init(self):
+        self.env.cr.execute(
+            """
+            CREATE UNIQUE INDEX IF NOT EXISTS estate_property_similar_rank_uniq
+            ON estate_property_similar (property_id, rank)
+            """
+        )
+
+    @api.model
+    def _cron_refresh_similar(self, full=False):
+        SimilarRefreshFactory.create(self.env).refresh(full=full)
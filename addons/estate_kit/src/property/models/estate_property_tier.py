@@ -1,5 +1,7 @@
 from odoo import api, fields, models
 
+from ..services.marketing_pool.mps_dirty_marker import MpsDirtyMarker
+from ..services.marketing_pool.tier_stats_cache import TierStatsCache
 from ..services.tier_list import Factory as TierListFactory
 from ..services.tier_list.tier_limit_checker import TierLimitChecker
 
@@ -57,6 +59,27 @@ class EstatePropertyTier(models.Model):
         ),
     ]
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        TierStatsCache.invalidate_for(self.env)
+        MpsDirtyMarker(self.env).mark_tier_owners(records)
+        return records
+
+    def write(self, vals):
+        marker = MpsDirtyMarker(self.env)
+        marker.mark_tier_owners(self)
+        result = super().write(vals)
+        TierStatsCache.invalidate_for(self.env)
+        marker.mark_tier_owners(self)
+        return result
+
+    def unlink(self):
+        MpsDirtyMarker(self.env).mark_tier_owners(self)
+        result = super().unlink()
+        TierStatsCache.invalidate_for(self.env)
+        return result
+
     def get_role_limits(self, role: str) -> tuple[int, int]:
         return TierLimitChecker(self.env).get_role_limits(role)
 
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from typing import Any
+
+from ....market_snapshot.services.benchmark_resolver import MarketBenchmark
+from ..marketing_pool.price_score_calculator.result import PriceScoreResult
+
+
+@dataclass(frozen=True)
+class PreparedScoring:
+    property_data: dict[str, Any]
+    benchmark: MarketBenchmark | None
+    price_score_result: PriceScoreResult | None
+
+    @property
+    def with_benchmark(self) -> bool:
+        return self.price_score_result is not None
@@ -13,3 +13,13 @@ class IMarketingPool(Protocol):
         property_data: dict,
         with_benchmark: bool = False,
     ) -> dict | None: ...
+
+    def build_scoring_prompt(
+        self,
+        property_data: dict,
+        with_benchmark: bool = False,
+    ) -> tuple[str, str]: ...
+
+    def parse_scoring_response(self, response_text: str) -> dict | None: ...
+
+    def remember_response(self, system_prompt: str, user_message: str, response_text: str) -> None: ...
@@ -0,0 +1,14 @@
+NO_BENCHMARK_NOTE = "\n\n[Оценка без рыночных данных: нет снапшота рынка для района/типа]"
+QUALITY_HEADER = "\n\nКачество: "
+
+
+def replace_price_block(rationale: str | None, price_block: str) -> str:
+    rationale = rationale or ""
+    if rationale.endswith(NO_BENCHMARK_NOTE):
+        # Обоснование целиком от LLM: цену теперь считает формула, текст AI остаётся про качество и карточку
+        llm_text = rationale[:-len(NO_BENCHMARK_NOTE)].strip()
+        return "%s\n\nОценка AI: %s" % (price_block, llm_text) if llm_text else price_block
+    index = rationale.find(QUALITY_HEADER)
+    if index != -1:
+        return price_block + rationale[index:]
+    return "%s\n\n%s" % (price_block, rationale) if rationale.strip() else price_block
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ScoringRequest:
+    system_prompt: str
+    user_message: str
+    # Цена по формуле на момент отправки; None — промпт без бенчмарка, цену оценивает LLM
+    price_score: int | None = None
+    price_block: str | None = None
+
+    @property
+    def with_benchmark(self) -> bool:
+        return self.price_score is not None
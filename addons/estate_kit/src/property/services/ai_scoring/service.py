@@ -2,6 +2,7 @@ import logging
 
 from odoo.exceptions import UserError
 
+from .prepared_scoring import PreparedScoring
 from .protocols import (
     IBenchmarkResolver,
     IMarketingPool,
@@ -10,6 +11,8 @@ from .protocols import (
     IPropertyDataCollector,
     IScoringRequestLogger,
 )
+from .rationale import NO_BENCHMARK_NOTE, QUALITY_HEADER
+from .scoring_request import ScoringRequest
 
 _logger = logging.getLogger(__name__)
 
@@ -36,18 +39,63 @@ class AiScoringService:
         self._env = env
 
     def score(self, property_id: int):
+        prop = self._get_property(property_id)
+        self._ensure_configured()
+
+        prepared = self._prepare(prop)
+        result = self._marketing_pool.score_property(
+            prepared.property_data, with_benchmark=prepared.with_benchmark,
+        )
+        price_score, price_block = self._price_part(prop, prepared)
+        return self._store(prop, result, price_score, price_block)
+
+    def build_request(self, property_id: int) -> ScoringRequest:
+        prop = self._get_property(property_id)
+        self._ensure_configured()
+
+        prepared = self._prepare(prop)
+        system_prompt, user_message = self._marketing_pool.build_scoring_prompt(
+            prepared.property_data, with_benchmark=prepared.with_benchmark,
+        )
+        price_score, price_block = self._price_part(prop, prepared)
+        return ScoringRequest(
+            system_prompt=system_prompt,
+            user_message=user_message,
+            price_score=price_score,
+            price_block=price_block,
+        )
+
+    def apply_response(
+        self,
+        property_id: int,
+        request: ScoringRequest,
+        response_text: str | None,
+        remember: bool = True,
+    ):
+        # Ответ разбирается в режиме, в котором ушёл запрос: бенчмарк мог появиться или устареть до опроса пакета
+        prop = self._get_property(property_id)
+        result = None
+        if response_text is not None:
+            result = self._marketing_pool.parse_scoring_response(response_text)
+            # Ключ кэша — ровно тот промпт, что ушёл в API, а не перерисованный по текущим данным
+            if remember and result is not None and request.system_prompt and request.user_message:
+                self._marketing_pool.remember_response(request.system_prompt, request.user_message, response_text)
+        return self._store(prop, result, request.price_score, request.price_block)
+
+    def _get_property(self, property_id: int):
         prop = self._env["estate.property"].browse(property_id)
         if not prop.exists():
             raise UserError("Объект не найден.")
+        return prop
 
+    def _ensure_configured(self) -> None:
         if not self._marketing_pool.is_configured:
             raise UserError(
                 "API-ключ Anthropic не настроен. "
                 "Перейдите в Настройки → Estate Kit → AI-скоринг."
             )
 
-        Log = self._env["estate.kit.log"]
-
+    def _prepare(self, prop, log_request: bool = True) -> PreparedScoring:
         benchmark = self._benchmark_resolver.resolve(prop)
         price_score_result = None
         if benchmark is not None:
@@ -66,13 +114,28 @@ class AiScoringService:
                 ],
             }
 
-        self._scoring_request_logger.log_request(Log, prop, property_data)
-        self._env.cr.commit()
+        if log_request:
+            Log = self._env["estate.kit.log"]
+            self._scoring_request_logger.log_request(Log, prop, property_data)
+            self._env.cr.commit()
 
-        with_benchmark = price_score_result is not None
-        result = self._marketing_pool.score_property(
-            property_data, with_benchmark=with_benchmark,
+        return PreparedScoring(
+            property_data=property_data,
+            benchmark=benchmark,
+            price_score_result=price_score_result,
         )
+
+    def _price_part(self, prop, prepared: PreparedScoring) -> tuple[int | None, str | None]:
+        if prepared.price_score_result is None:
+            return None, None
+        price_block = self._price_block_builder.build(
+            prop, prepared.benchmark, prepared.price_score_result,
+        )
+        return prepared.price_score_result.score, price_block.text
+
+    def _store(self, prop, result: dict | None, price_score: int | None, price_block: str | None):
+        Log = self._env["estate.kit.log"]
+
         if result is None:
             Log.log(
                 _LOG_CATEGORY,
@@ -85,24 +148,19 @@ class AiScoringService:
                 "Не удалось получить оценку от AI. Проверьте логи сервера."
             )
 
-        if price_score_result is not None:
-            price_block = self._price_block_builder.build(
-                prop, benchmark, price_score_result,
-            )
-            price_score = price_score_result.score
+        with_benchmark = price_score is not None
+        if with_benchmark:
             quality_text = result.get("quality_text", "").strip()
             listing_text = result.get("listing_text", "").strip()
-            rationale = "%s\n\nКачество: %s\n\nКарточка: %s" % (
-                price_block.text,
+            rationale = "%s%s%s\n\nКарточка: %s" % (
+                price_block,
+                QUALITY_HEADER,
                 quality_text,
                 listing_text,
             )
         else:
             price_score = result.get("price_score", 1)
-            rationale_suffix = (
-                "\n\n[Оценка без рыночных данных: нет снапшота рынка для района/типа]"
-            )
-            rationale = (result.get("rationale") or "") + rationale_suffix
+            rationale = (result.get("rationale") or "") + NO_BENCHMARK_NOTE
 
         scoring = self._env["estate.property.scoring"].create({
             "property_id": prop.id,
@@ -112,7 +170,7 @@ class AiScoringService:
             "rationale": rationale,
         })
 
-        price_source = "формула" if price_score_result is not None else "LLM"
+        price_source = "формула" if with_benchmark else "LLM"
         Log.log(
             _LOG_CATEGORY,
             "Ответ AI-скоринга: %s → price=%d (%s), quality=%d, listing=%d"
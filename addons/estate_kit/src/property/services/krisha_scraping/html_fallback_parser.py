@@ -29,6 +29,9 @@ class HtmlFallbackParser:
             title = link.get_text(strip=True) if link else ""
             href = link.get("href", "") if link else ""
 
+            subtitle_el = card.select_one(".a-card__subtitle")
+            subtitle = subtitle_el.get_text(" ", strip=True) if subtitle_el else ""
+
             price_el = card.select_one(".a-card__price")
             price_text = price_el.get_text(strip=True) if price_el else "0"
             price = self._price_parser.parse(price_text)
@@ -50,7 +53,7 @@ class HtmlFallbackParser:
                 "price": price,
                 "city": "",
                 "address": "",
-                "address_title": "",
+                "address_title": subtitle,
                 "address_struct": {},
                 "latitude": None,
                 "longitude": None,
@@ -12,6 +12,7 @@ if TYPE_CHECKING:
     from .pool_rotation.service import PoolRotationService
     from .property_validator.service import PropertyValidatorService
     from .scoring.service import ScoringService
+    from .similar_picker.similar_store import SimilarStore
     from .state_machine.service import StateMachineService
     from .tier_list.service import TierListService
     from .unified_search.service import UnifiedSearchService
@@ -78,6 +79,10 @@ class ServiceLocator:
     def contract_data(self) -> ContractDataService:
         return self._resolve("contract_data")
 
+    @property
+    def similar_store(self) -> SimilarStore:
+        return self._resolve("similar_store")
+
     def _resolve(self, name: str):
         if name not in self._cache:
             self._cache[name] = _FACTORIES[name](self._env)
@@ -144,6 +149,12 @@ def _create_contract_data(env):
     return Factory.create(env)
 
 
+def _create_similar_store(env):
+    from .similar_picker.config import DEFAULT_CONFIG
+    from .similar_picker.similar_store import SimilarStore
+    return SimilarStore(env, DEFAULT_CONFIG)
+
+
 _FACTORIES: dict = {
     "state_machine": _create_state_machine,
     "tier_list": _create_tier_list,
@@ -157,4 +168,5 @@ _FACTORIES: dict = {
     "krisha_import": _create_krisha_import,
     "contract_renderer": _create_contract_renderer,
     "contract_data": _create_contract_data,
+    "similar_store": _create_similar_store,
 }
@@ -1,11 +1,41 @@
+from collections.abc import Iterator
+
 POOL_ELIGIBLE_STATES = ("active", "published")
 
+# Поля, которые читает расчёт MPS; остальное не подгружается в кэш ORM
+MPS_FETCH_FIELDS = ("name", "tier_ids")
+
+DEFAULT_BATCH_SIZE = 500
+
 
 class ActivePropertiesLoader:
-    def __init__(self, env):
+    def __init__(self, env, batch_size: int = DEFAULT_BATCH_SIZE):
         self._env = env
+        self._batch_size = batch_size
+
+    def count(self, dirty_only: bool = False) -> int:
+        return self._env["estate.property"].search_count(self._domain(dirty_only))
+
+    def iter_batches(self, dirty_only: bool = False) -> Iterator:
+        Property = self._env["estate.property"]
+        domain = self._domain(dirty_only)
+        last_id = 0
+        while True:
+            batch = Property.search(
+                domain + [("id", ">", last_id)], order="id", limit=self._batch_size,
+            )
+            if not batch:
+                return
+            batch.fetch(list(MPS_FETCH_FIELDS))
+            last_id = batch.ids[-1]
+            yield batch
+            self._env.invalidate_all()
+            if len(batch) < self._batch_size:
+                return
 
-    def load(self):
-        return self._env["estate.property"].search([
-            ("state", "in", list(POOL_ELIGIBLE_STATES)),
-        ])
+    @staticmethod
+    def _domain(dirty_only: bool) -> list:
+        domain = [("state", "in", list(POOL_ELIGIBLE_STATES))]
+        if dirty_only:
+            domain.append(("mps_dirty", "=", True))
+        return domain
@@ -1,15 +1,28 @@
+from collections.abc import Iterable
+
 from .config import PoolScoreConfig
-from .protocols import IMpsCalculator
+from .protocols import ILatestScoringLoader, IMpsCalculator, IMpsWriter
 
 
 class BatchPropertyScorer:
-    def __init__(self, config: PoolScoreConfig, calculator: IMpsCalculator):
+    def __init__(
+        self,
+        config: PoolScoreConfig,
+        calculator: IMpsCalculator,
+        scoring_loader: ILatestScoringLoader,
+        mps_writer: IMpsWriter,
+    ):
         self._config = config
         self._calculator = calculator
+        self._scoring_loader = scoring_loader
+        self._mps_writer = mps_writer
 
     def score_all(self, properties) -> tuple[dict, list[str]]:
+        return self.score_batches([properties])
+
+    def score_batches(self, batches: Iterable) -> tuple[dict, list[str]]:
         stats = {
-            "total": len(properties),
+            "total": 0,
             "no_scoring": 0,
             "below_price": 0,
             "below_quality": 0,
@@ -17,23 +30,25 @@ class BatchPropertyScorer:
             "below_inclusion": 0,
             "eligible": 0,
         }
-        details_lines = []
+        details_lines: list[str] = []
+        for properties in batches:
+            stats["total"] += len(properties)
+            self._score_batch(properties, stats, details_lines)
+        return stats, details_lines
+
+    def _score_batch(self, properties, stats: dict, details_lines: list[str]) -> None:
+        mps_rows: list[tuple[int, float, str]] = []
+        latest_by_property = self._scoring_loader.load(properties.ids)
 
         for prop in properties:
-            latest = prop.scoring_ids[:1]
-            if not latest:
-                prop.write({
-                    "marketing_pool_score": 0.0,
-                    "marketing_pool_score_display": "— нет скоринга",
-                })
+            latest = latest_by_property.get(prop.id)
+            if latest is None:
+                mps_rows.append((prop.id, 0.0, "— нет скоринга"))
                 stats["no_scoring"] += 1
                 continue
 
             result = self._calculator.calculate(prop, latest)
-            prop.write({
-                "marketing_pool_score": result.score,
-                "marketing_pool_score_display": result.display,
-            })
+            mps_rows.append((prop.id, result.score, result.display))
 
             failed_scores = []
             if latest.price_score < self._config.min_price:
@@ -64,4 +79,4 @@ class BatchPropertyScorer:
                     "%s: MPS=%.1f ✓ (кандидат в пул)" % (prop.name, result.score)
                 )
 
-        return stats, details_lines
+        self._mps_writer.write(mps_rows)
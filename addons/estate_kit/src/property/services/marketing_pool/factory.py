@@ -3,16 +3,22 @@ from .batch_property_scorer import BatchPropertyScorer
 from .calculator import MpsCalculator
 from .config import PoolScoreConfig
 from .freshness import ScoringFreshnessService
+from .freshness_config import FreshnessConfig
+from .latest_scoring_loader import LatestScoringLoader
+from .mps_writer import MpsBulkWriter
 from .pool_status_builder import PoolStatusBuilder
 from .pool_summary_logger import PoolSummaryLogger
 from .protocols import IAiClient
+from .response_cache_config import ResponseCacheConfig
 from .scoring_message_builder import ScoringMessageBuilder
 from .scoring_prompt_resolver import ScoringPromptResolver
+from .scoring_response_cache import ScoringResponseCache
 from .scoring_response_parser import ScoringResponseParser
 from .service import MarketingPoolService
 from .single_property_scorer import SinglePropertyScorer
 from .threshold_checker import ThresholdChecker
 from .tier_bonus import TierBonusCalculator
+from .tier_stats_cache import TierStatsCache
 
 _POOL_ELIGIBLE_STATES = frozenset(("active", "published"))
 
@@ -21,20 +27,29 @@ class Factory:
     @staticmethod
     def create(env, ai_client: IAiClient) -> MarketingPoolService:
         config = PoolScoreConfig.from_env(env)
-        tier_calc = TierBonusCalculator(env)
+        tier_calc = TierBonusCalculator(TierStatsCache.get(env))
         calculator = MpsCalculator(config, tier_calc)
+        scoring_loader = LatestScoringLoader(env)
         return MarketingPoolService(
             env=env,
             config=config,
             loader=ActivePropertiesLoader(env),
             single_scorer=SinglePropertyScorer(calculator),
-            batch_scorer=BatchPropertyScorer(config, calculator),
+            batch_scorer=BatchPropertyScorer(
+                config,
+                calculator,
+                scoring_loader,
+                MpsBulkWriter(env),
+            ),
             threshold_checker=ThresholdChecker(),
-            freshness=ScoringFreshnessService(env),
+            freshness=ScoringFreshnessService(
+                env, FreshnessConfig.from_env(env), scoring_loader,
+            ),
             summary_logger=PoolSummaryLogger(env),
             ai_client=ai_client,
             prompt_resolver=ScoringPromptResolver(),
             message_builder=ScoringMessageBuilder(),
             response_parser=ScoringResponseParser(),
             pool_status_builder=PoolStatusBuilder(config, _POOL_ELIGIBLE_STATES),
+            response_cache=ScoringResponseCache(env, ResponseCacheConfig.from_env(env)),
         )
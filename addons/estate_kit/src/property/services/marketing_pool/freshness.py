@@ -1,55 +1,104 @@
 import logging
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from typing import Any
 
-from odoo import fields
+from odoo import api, fields
 from odoo.exceptions import UserError
+from psycopg2.errors import SerializationFailure
+
+from .freshness_config import FreshnessConfig
+from .protocols import ILatestScoringLoader
+from .scoring_response_cache import SCORING_CACHE_STATS
 
 _logger = logging.getLogger(__name__)
 
 
 class ScoringFreshnessService:
-    def __init__(self, env: Any):
+    def __init__(self, env: Any, config: FreshnessConfig, scoring_loader: ILatestScoringLoader):
         self.env = env
+        self._config = config
+        self._scoring_loader = scoring_loader
 
-    def ensure_fresh(self, properties) -> None:
+    def ensure_fresh(self, batches: Iterable) -> None:
         Log = self.env["estate.kit.log"]
         CAT = "marketing_pool"
-        Scoring = self.env["estate.property.scoring"]
-        cutoff = fields.Datetime.now() - timedelta(days=14)
+        cutoff = fields.Datetime.now() - timedelta(days=self._config.max_age_days)
 
-        to_score = self.env["estate.property"]
+        to_score: list[int] = []
         fresh_count = 0
-        for prop in properties:
-            latest = prop.scoring_ids[:1]
-            if not latest or latest.scored_at < cutoff:
-                to_score |= prop
-            else:
-                fresh_count += 1
+        for properties in batches:
+            latest_by_property = self._scoring_loader.load(properties.ids)
+            for property_id in properties.ids:
+                latest = latest_by_property.get(property_id)
+                if latest is None or not latest.scored_at or latest.scored_at < cutoff:
+                    to_score.append(property_id)
+                else:
+                    fresh_count += 1
 
         Log.log(
             CAT,
-            "AI-скоринг: %d свежих, %d требуют расчёта" % (fresh_count, len(to_score)),
+            "AI-скоринг: %d свежих, %d требуют расчёта (потоков: %d)"
+            % (fresh_count, len(to_score), self._config.parallelism),
         )
         self.env.cr.commit()
 
         if not to_score:
             return
 
-        scored = 0
-        failed = 0
-        for prop in to_score:
-            try:
-                Scoring.score_property(prop.id)
-                scored += 1
-            except UserError:
-                failed += 1
-                _logger.warning("Failed to score property %s, skipping", prop.id)
-            self.env.cr.commit()
+        if self._config.use_batch_api:
+            self.env["estate.property.scoring"].submit_scoring_batch(to_score)
+            return
+
+        hits_before, misses_before = SCORING_CACHE_STATS.snapshot()
+        if self._config.parallelism == 1:
+            outcomes = [self._score_in_env(self.env, property_id) for property_id in to_score]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=self._config.parallelism,
+                thread_name_prefix="estate_kit_scoring",
+            ) as executor:
+                outcomes = list(executor.map(self._score_in_worker, to_score))
+
+        scored = sum(1 for ok in outcomes if ok)
+        failed = len(outcomes) - scored
 
         Log.log(
             CAT,
             "AI-скоринг завершён: %d рассчитано, %d ошибок" % (scored, failed),
             level="warning" if failed else "info",
         )
+        hits_after, misses_after = SCORING_CACHE_STATS.snapshot()
+        Log.log(
+            CAT,
+            "Кэш AI-скоринга: %d попаданий, %d промахов"
+            % (hits_after - hits_before, misses_after - misses_before),
+        )
         self.env.cr.commit()
+        self.env["estate.property.scoring"].invalidate_model()
+
+    def _score_in_worker(self, property_id: int) -> bool:
+        with self.env.registry.cursor() as cr:
+            env = api.Environment(cr, self.env.uid, dict(self.env.context))
+            return self._score_in_env(env, property_id)
+
+    def _score_in_env(self, env, property_id: int) -> bool:
+        scored = True
+        try:
+            env["estate.property.scoring"].score_property(property_id)
+        except UserError:
+            scored = False
+            _logger.warning("Failed to score property %s, skipping", property_id)
+        except SerializationFailure:
+            # Параллельные воркеры пишут в общий кэш ответов — конфликт не должен обрывать весь прогон
+            env.cr.rollback()
+            _logger.warning("Concurrent update while scoring property %s, skipping", property_id)
+            return False
+        except Exception:
+            # Сбой одного объекта не должен оставлять поток или весь прогон с прерванной транзакцией
+            env.cr.rollback()
+            _logger.error("Unexpected error while scoring property %s, skipping", property_id, exc_info=True)
+            return False
+        env.cr.commit()
+        return scored
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class FreshnessConfig:
+    max_age_days: int
+    parallelism: int
+    use_batch_api: bool
+
+    @classmethod
+    def from_env(cls, env: Any) -> "FreshnessConfig":
+        get_param = env["ir.config_parameter"].sudo().get_param
+        return cls(
+            max_age_days=int(get_param("estate_kit.scoring_max_age_days", "14")),
+            parallelism=max(int(get_param("estate_kit.scoring_parallelism", "1")), 1),
+            use_batch_api=get_param("estate_kit.scoring_use_batch_api", "False") == "True",
+        )
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class LatestScoring:
+    id: int
+    property_id: int
+    price_score: int
+    quality_score: int
+    listing_score: int
+    scored_at: datetime | None
+    # Бенчмарк, по которому собран ценовой блок обоснования; None — не записан
+    benchmark_snapshot_id: int | None = None
+    benchmark_median_per_sqm: float | None = None
@@ -0,0 +1,39 @@
+from .latest_scoring import LatestScoring
+
+
+class LatestScoringLoader:
+    def __init__(self, env):
+        self._env = env
+
+    def load(self, property_ids: list[int]) -> dict[int, LatestScoring]:
+        if not property_ids:
+            return {}
+
+        self._env["estate.property.scoring"].flush_model([
+            "property_id", "price_score", "quality_score", "listing_score", "scored_at",
+            "benchmark_snapshot_id", "benchmark_median_per_sqm",
+        ])
+        self._env.cr.execute(
+            """
+            SELECT DISTINCT ON (property_id)
+                   id, property_id, price_score, quality_score, listing_score, scored_at,
+                   benchmark_snapshot_id, benchmark_median_per_sqm
+            FROM estate_property_scoring
+            WHERE property_id = ANY(%s)
+            ORDER BY property_id, scored_at DESC NULLS LAST, id DESC
+            """,
+            [list(property_ids)],
+        )
+        return {
+            row[1]: LatestScoring(
+                id=row[0],
+                property_id=row[1],
+                price_score=row[2] or 0,
+                quality_score=row[3] or 0,
+                listing_score=row[4] or 0,
+                scored_at=row[5],
+                benchmark_snapshot_id=row[6],
+                benchmark_median_per_sqm=row[7],
+            )
+            for row in self._env.cr.fetchall()
+        }
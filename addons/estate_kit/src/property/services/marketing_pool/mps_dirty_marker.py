@@ -0,0 +1,50 @@
+MPS_TRIGGER_FIELDS = frozenset(("state", "tag_ids", "active"))
+
+
+class MpsDirtyMarker:
+    def __init__(self, env):
+        self._env = env
+
+    def mark_properties(self, property_ids: list[int]) -> None:
+        if not property_ids:
+            return
+        # Отложенная ORM-запись mps_dirty=False, сброшенная после UPDATE, затёрла бы флаг
+        self._env["estate.property"].flush_model(["mps_dirty"])
+        self._env.cr.execute(
+            """
+            UPDATE estate_property
+            SET mps_dirty = true
+            WHERE id = ANY(%s) AND mps_dirty IS NOT TRUE
+            """,
+            [list(property_ids)],
+        )
+        self._env["estate.property"].browse(property_ids).invalidate_recordset(["mps_dirty"], flush=False)
+
+    def mark_tier_owners(self, tiers) -> None:
+        if not tiers:
+            return
+        self._env["estate.property.tier"].flush_model(["property_id", "user_id", "role"])
+        self._env["estate.property"].flush_model(["mps_dirty"])
+        pairs = {(tier.user_id.id, tier.role) for tier in tiers}
+        self._env.cr.execute(
+            """
+            UPDATE estate_property
+            SET mps_dirty = true
+            WHERE mps_dirty IS NOT TRUE
+              AND (
+                id = ANY(%s)
+                OR id IN (
+                    SELECT t.property_id
+                    FROM estate_property_tier t
+                    JOIN unnest(%s::int[], %s::varchar[]) AS p(user_id, role)
+                      ON t.user_id = p.user_id AND t.role = p.role
+                )
+              )
+            """,
+            [
+                tiers.mapped("property_id").ids,
+                [pair[0] for pair in pairs],
+                [pair[1] for pair in pairs],
+            ],
+        )
+        self._env["estate.property"].invalidate_model(["mps_dirty"], flush=False)
@@ -0,0 +1,39 @@
+_MPS_FIELDS = ["marketing_pool_score", "marketing_pool_score_display", "mps_dirty"]
+
+
+class MpsBulkWriter:
+    def __init__(self, env):
+        self._env = env
+
+    def write(self, rows: list[tuple[int, float, str]]) -> None:
+        if not rows:
+            return
+
+        Property = self._env["estate.property"]
+        Property.flush_model(_MPS_FIELDS)
+
+        ids = [row[0] for row in rows]
+        self._env.cr.execute(
+            """
+            UPDATE estate_property AS p
+            SET marketing_pool_score = v.score,
+                marketing_pool_score_display = v.display,
+                mps_dirty = false,
+                write_uid = %s,
+                write_date = (now() at time zone 'UTC')
+            FROM unnest(%s::int[], %s::float8[], %s::varchar[]) AS v(id, score, display)
+            WHERE p.id = v.id
+            """,
+            [
+                self._env.uid,
+                ids,
+                [row[1] for row in rows],
+                [row[2] for row in rows],
+            ],
+        )
+        records = Property.browse(ids)
+        records.invalidate_recordset(_MPS_FIELDS + ["write_uid", "write_date"], flush=False)
+        # Сырой UPDATE не пересчитывает хранимые зависимые поля — помечаем их сами, как это делал write():
+        # иначе estate.lead.match.marketing_pool_score и сортировка подборов остаются устаревшими
+        records.modified(["marketing_pool_score", "marketing_pool_score_display"])
+        self._env["estate.lead.match"].flush_model(["marketing_pool_score"])
@@ -1,3 +1,5 @@
+from .batch_input import PriceScoreBatch
+from .batch_result import PriceScoreBatchResult
 from .config import DeviationBucket
 from .factory import Factory
 from .hedonic_factor import HedonicFactor
@@ -8,6 +10,8 @@ __all__ = [
     "DeviationBucket",
     "Factory",
     "HedonicFactor",
+    "PriceScoreBatch",
+    "PriceScoreBatchResult",
     "PriceScoreCalculator",
     "PriceScoreResult",
 ]
@@ -0,0 +1,39 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+
+# Колоночное представление объектов: i-й элемент каждой колонки — i-й объект
+@dataclass(frozen=True)
+class PriceScoreBatch:
+    property_ids: Sequence[int]
+    price: Sequence[float]
+    area_total: Sequence[float]
+    floor: Sequence[int]
+    floors_total: Sequence[int]
+    condition: Sequence[str | bool]
+    year_built: Sequence[int]
+    parking: Sequence[str | bool]
+    median_price_per_sqm: Sequence[float]
+    benchmark_snapshot_ids: Sequence[int]
+
+    def __len__(self) -> int:
+        return len(self.property_ids)
+
+    @classmethod
+    def from_records(cls, properties, benchmarks: Sequence) -> "PriceScoreBatch":
+        rows = properties.read(
+            ["price", "area_total", "floor", "floors_total", "condition", "year_built", "parking"],
+            load=None,
+        )
+        return cls(
+            property_ids=[row["id"] for row in rows],
+            price=[row["price"] or 0.0 for row in rows],
+            area_total=[row["area_total"] or 0.0 for row in rows],
+            floor=[row["floor"] or 0 for row in rows],
+            floors_total=[row["floors_total"] or 0 for row in rows],
+            condition=[row["condition"] for row in rows],
+            year_built=[row["year_built"] or 0 for row in rows],
+            parking=[row["parking"] for row in rows],
+            median_price_per_sqm=[benchmark.median_price_per_sqm for benchmark in benchmarks],
+            benchmark_snapshot_ids=[benchmark.snapshot_id for benchmark in benchmarks],
+        )
@@ -0,0 +1,40 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from .config import DeviationBucket
+from .hedonic_factor import HedonicFactor
+from .result import PriceScoreResult
+
+
+@dataclass(frozen=True)
+class PriceScoreBatchResult:
+    property_ids: list[int]
+    scores: list[int | None]  # None — у объекта нет цены или площади
+    deviations: list[float | None]
+    expected_per_sqm: list[float]
+    actual_per_sqm: list[float]
+    hedonic_multipliers: list[float]
+    buckets: list[DeviationBucket]
+    benchmark_snapshot_ids: list[int]
+    _factors_loader: Callable[[int], list[HedonicFactor]]
+
+    def __len__(self) -> int:
+        return len(self.property_ids)
+
+    def factors(self, index: int) -> list[HedonicFactor]:
+        return self._factors_loader(index)
+
+    def result(self, index: int) -> PriceScoreResult | None:
+        score = self.scores[index]
+        if score is None:
+            return None
+        return PriceScoreResult(
+            score=score,
+            deviation=self.deviations[index],
+            expected_per_sqm=self.expected_per_sqm[index],
+            actual_per_sqm=self.actual_per_sqm[index],
+            benchmark_snapshot_id=self.benchmark_snapshot_ids[index],
+            hedonic_multiplier=self.hedonic_multipliers[index],
+            hedonic_factors_applied=self.factors(index),
+            bucket_applied=self.buckets[index],
+        )
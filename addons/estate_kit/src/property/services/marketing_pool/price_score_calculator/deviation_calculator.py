@@ -1,5 +1,14 @@
+from collections.abc import Sequence
+
+
 class DeviationCalculator:
     def calculate(self, actual: float, expected: float) -> float:
         if expected <= 0:
             return 0.0
         return (actual - expected) / expected
+
+    def calculate_many(self, actual: Sequence[float], expected: Sequence[float]) -> list[float]:
+        return [
+            (a - e) / e if e > 0 else 0.0
+            for a, e in zip(actual, expected)
+        ]
@@ -1,64 +1,97 @@
+from collections.abc import Sequence
+
 from .config import HedonicCoefficients
 from .hedonic_factor import HedonicFactor
 from .labels import CONDITION_LABELS, PARKING_LABELS
 from .protocols.i_hedonic_multiplier_calculator import HedonicMultiplierResult
 
+_PARKING_BONUS_KINDS = ("underground", "garage")
+_MIN_AGE_MULTIPLIER = 0.7
+
 
 class HedonicMultiplierCalculator:
     def __init__(self, coefficients: HedonicCoefficients) -> None:
         self._coefficients = coefficients
 
     def calculate(self, prop) -> HedonicMultiplierResult:
+        factors = self.factors_for(
+            prop.floor, prop.floors_total, prop.condition, prop.year_built, prop.parking,
+        )
         multiplier = 1.0
+        for factor in factors:
+            multiplier *= factor.multiplier
+        return HedonicMultiplierResult(multiplier=multiplier, factors_applied=factors)
+
+    def calculate_batch(
+        self,
+        floor: Sequence[int],
+        floors_total: Sequence[int],
+        condition: Sequence[str | bool],
+        year_built: Sequence[int],
+        parking: Sequence[str | bool],
+    ) -> list[float]:
+        coefficients = self._coefficients
+        first_floor = coefficients.first_floor_penalty
+        last_floor = coefficients.last_floor_penalty
+        parking_bonus = coefficients.parking_bonus
+        reference = coefficients.year_built_reference
+        per_decade = coefficients.year_built_penalty_per_decade
+        condition_mult = coefficients.condition_multipliers
+
+        multipliers: list[float] = []
+        for fl, total, cond, year, park in zip(floor, floors_total, condition, year_built, parking):
+            multiplier = 1.0
+            if fl == 1:
+                multiplier *= first_floor
+            elif fl and total and fl == total:
+                multiplier *= last_floor
+            if cond and cond in condition_mult:
+                multiplier *= condition_mult[cond]
+            if year and year > 0 and reference > year:
+                multiplier *= max(_MIN_AGE_MULTIPLIER, 1.0 - (reference - year) / 10.0 * per_decade)
+            if park in _PARKING_BONUS_KINDS:
+                multiplier *= parking_bonus
+            multipliers.append(multiplier)
+        return multipliers
+
+    def factors_for(self, floor, floors_total, condition, year_built, parking) -> list[HedonicFactor]:
         factors: list[HedonicFactor] = []
 
-        if prop.floor and prop.floor == 1:
-            multiplier *= self._coefficients.first_floor_penalty
+        if floor and floor == 1:
             factors.append(HedonicFactor(
                 reason="Первый этаж",
                 multiplier=self._coefficients.first_floor_penalty,
             ))
-        elif (
-            prop.floor
-            and prop.floors_total
-            and prop.floor == prop.floors_total
-        ):
-            multiplier *= self._coefficients.last_floor_penalty
+        elif floor and floors_total and floor == floors_total:
             factors.append(HedonicFactor(
                 reason="Последний этаж",
                 multiplier=self._coefficients.last_floor_penalty,
             ))
 
-        if prop.condition:
-            condition_mult = self._coefficients.condition_multipliers.get(
-                prop.condition,
-            )
+        if condition:
+            condition_mult = self._coefficients.condition_multipliers.get(condition)
             if condition_mult is not None:
-                multiplier *= condition_mult
-                label = CONDITION_LABELS.get(prop.condition, prop.condition)
+                label = CONDITION_LABELS.get(condition, condition)
                 factors.append(HedonicFactor(
                     reason="Состояние «%s»" % label,
                     multiplier=condition_mult,
                 ))
 
-        if prop.year_built and prop.year_built > 0:
+        if year_built and year_built > 0:
             reference = self._coefficients.year_built_reference
-            decades = (reference - prop.year_built) / 10.0
+            decades = (reference - year_built) / 10.0
             if decades > 0:
                 penalty = decades * self._coefficients.year_built_penalty_per_decade
-                age_mult = max(0.7, 1.0 - penalty)
-                multiplier *= age_mult
                 factors.append(HedonicFactor(
-                    reason="Год постройки %d" % prop.year_built,
-                    multiplier=age_mult,
+                    reason="Год постройки %d" % year_built,
+                    multiplier=max(_MIN_AGE_MULTIPLIER, 1.0 - penalty),
                 ))
 
-        if prop.parking and prop.parking in ("underground", "garage"):
-            multiplier *= self._coefficients.parking_bonus
-            label = PARKING_LABELS.get(prop.parking, prop.parking)
+        if parking and parking in _PARKING_BONUS_KINDS:
+            label = PARKING_LABELS.get(parking, parking)
             factors.append(HedonicFactor(
                 reason="Паркинг %s" % label,
                 multiplier=self._coefficients.parking_bonus,
             ))
 
-        return HedonicMultiplierResult(multiplier=multiplier, factors_applied=factors)
+        return factors
@@ -1,5 +1,8 @@
+from collections.abc import Sequence
 from typing import Protocol
 
 
 class IDeviationCalculator(Protocol):
     def calculate(self, actual: float, expected: float) -> float: ...
+
+    def calculate_many(self, actual: Sequence[float], expected: Sequence[float]) -> list[float]: ...
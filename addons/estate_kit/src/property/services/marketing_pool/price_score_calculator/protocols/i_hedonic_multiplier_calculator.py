@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Protocol
 
@@ -12,3 +13,14 @@ class HedonicMultiplierResult:
 
 class IHedonicMultiplierCalculator(Protocol):
     def calculate(self, prop) -> HedonicMultiplierResult: ...
+
+    def calculate_batch(
+        self,
+        floor: Sequence[int],
+        floors_total: Sequence[int],
+        condition: Sequence[str | bool],
+        year_built: Sequence[int],
+        parking: Sequence[str | bool],
+    ) -> list[float]: ...
+
+    def factors_for(self, floor, floors_total, condition, year_built, parking) -> list[HedonicFactor]: ...
@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from typing import Protocol
 
 from ..config import DeviationBucket
@@ -5,3 +6,5 @@ from ..config import DeviationBucket
 
 class IScoreMapper(Protocol):
     def map(self, deviation: float) -> DeviationBucket: ...
+
+    def map_many(self, deviations: Sequence[float]) -> list[DeviationBucket]: ...
@@ -1,12 +1,23 @@
+from bisect import bisect_left
+from collections.abc import Sequence
+
 from .config import DeviationBucket
 
 
 class ScoreMapper:
     def __init__(self, buckets: tuple[DeviationBucket, ...]) -> None:
         self._buckets = buckets
+        self._upper_bounds = [bucket.upper_bound for bucket in buckets]
 
     def map(self, deviation: float) -> DeviationBucket:
         for bucket in self._buckets:
             if deviation <= bucket.upper_bound:
                 return bucket
         return self._buckets[-1]
+
+    def map_many(self, deviations: Sequence[float]) -> list[DeviationBucket]:
+        last = len(self._buckets) - 1
+        return [
+            self._buckets[min(bisect_left(self._upper_bounds, deviation), last)]
+            for deviation in deviations
+        ]
@@ -1,3 +1,5 @@
+from .batch_input import PriceScoreBatch
+from .batch_result import PriceScoreBatchResult
 from .protocols import (
     IDeviationCalculator,
     IHedonicMultiplierCalculator,
@@ -39,3 +41,43 @@ class PriceScoreCalculator:
             hedonic_factors_applied=hedonic_result.factors_applied,
             bucket_applied=bucket,
         )
+
+    def calculate_batch(self, batch: PriceScoreBatch) -> PriceScoreBatchResult:
+        multipliers = self._hedonic_calculator.calculate_batch(
+            batch.floor, batch.floors_total, batch.condition, batch.year_built, batch.parking,
+        )
+        valid = [
+            bool(price) and bool(area) and area > 0
+            for price, area in zip(batch.price, batch.area_total)
+        ]
+        actual = [
+            price / area if ok else 0.0
+            for price, area, ok in zip(batch.price, batch.area_total, valid)
+        ]
+        expected = [
+            median * multiplier
+            for median, multiplier in zip(batch.median_price_per_sqm, multipliers)
+        ]
+        deviations = self._deviation_calculator.calculate_many(actual, expected)
+        buckets = self._score_mapper.map_many(deviations)
+
+        def load_factors(index: int):
+            return self._hedonic_calculator.factors_for(
+                batch.floor[index],
+                batch.floors_total[index],
+                batch.condition[index],
+                batch.year_built[index],
+                batch.parking[index],
+            )
+
+        return PriceScoreBatchResult(
+            property_ids=list(batch.property_ids),
+            scores=[bucket.score if ok else None for bucket, ok in zip(buckets, valid)],
+            deviations=[deviation if ok else None for deviation, ok in zip(deviations, valid)],
+            expected_per_sqm=expected,
+            actual_per_sqm=actual,
+            hedonic_multipliers=multipliers,
+            buckets=buckets,
+            benchmark_snapshot_ids=list(batch.benchmark_snapshot_ids),
+            _factors_loader=load_factors,
+        )
@@ -3,11 +3,15 @@ from .pool_status_builder import IPoolStatusBuilder
 from .ai_client import IAiClient
 from .batch_property_scorer import IBatchPropertyScorer
 from .freshness_checker import IFreshnessChecker
+from .latest_scoring_loader import ILatestScoringLoader
 from .message_builder import IMessageBuilder
 from .mps_calculator import IMpsCalculator
+from .mps_writer import IMpsWriter
 from .pool_summary_logger import IPoolSummaryLogger
 from .prompt_resolver import IPromptResolver
+from .response_cache import IResponseCache
 from .response_parser import IResponseParser
 from .single_property_scorer import ISinglePropertyScorer
 from .threshold_checker import IThresholdChecker
 from .tier_bonus_calculator import ITierBonusCalculator
+from .tier_stats_cache import ITierStatsCache
@@ -1,5 +1,8 @@
+from collections.abc import Iterator
 from typing import Protocol
 
 
 class IActivePropertiesLoader(Protocol):
-    def load(self): ...
+    def count(self, dirty_only: bool = False) -> int: ...
+
+    def iter_batches(self, dirty_only: bool = False) -> Iterator: ...
@@ -1,5 +1,8 @@
+from collections.abc import Iterable
 from typing import Protocol
 
 
 class IBatchPropertyScorer(Protocol):
     def score_all(self, properties) -> tuple[dict, list[str]]: ...
+
+    def score_batches(self, batches: Iterable) -> tuple[dict, list[str]]: ...
@@ -1,5 +1,6 @@
+from collections.abc import Iterable
 from typing import Protocol
 
 
 class IFreshnessChecker(Protocol):
-    def ensure_fresh(self, properties) -> None: ...
+    def ensure_fresh(self, batches: Iterable) -> None: ...
@@ -0,0 +1,7 @@
+from typing import Protocol
+
+from ..latest_scoring import LatestScoring
+
+
+class ILatestScoringLoader(Protocol):
+    def load(self, property_ids: list[int]) -> dict[int, LatestScoring]: ...
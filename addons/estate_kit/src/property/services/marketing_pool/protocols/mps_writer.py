@@ -0,0 +1,5 @@
+from typing import Protocol
+
+
+class IMpsWriter(Protocol):
+    def write(self, rows: list[tuple[int, float, str]]) -> None: ...
@@ -0,0 +1,7 @@
+from typing import Protocol
+
+
+class IResponseCache(Protocol):
+    def get(self, system: str, user: str, model: str) -> str | None: ...
+
+    def put(self, system: str, user: str, model: str, response_text: str) -> None: ...
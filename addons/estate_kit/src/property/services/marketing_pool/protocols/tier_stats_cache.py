@@ -0,0 +1,7 @@
+from typing import Protocol
+
+
+class ITierStatsCache(Protocol):
+    def count(self, user_id: int, role: str) -> int: ...
+
+    def invalidate(self) -> None: ...
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class ResponseCacheConfig:
+    ttl_days: int
+    max_entries: int
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_days > 0 and self.max_entries > 0
+
+    @classmethod
+    def from_env(cls, env: Any) -> "ResponseCacheConfig":
+        get_param = env["ir.config_parameter"].sudo().get_param
+        return cls(
+            ttl_days=int(get_param("estate_kit.scoring_cache_ttl_days", "30")),
+            max_entries=int(get_param("estate_kit.scoring_cache_max_entries", "5000")),
+        )
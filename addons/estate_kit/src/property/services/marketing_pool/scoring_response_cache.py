@@ -0,0 +1,111 @@
+import hashlib
+import threading
+from datetime import timedelta
+
+from odoo import fields
+
+from .response_cache_config import ResponseCacheConfig
+
+
+class CacheStats:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def record(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    def snapshot(self) -> tuple[int, int]:
+        with self._lock:
+            return self._hits, self._misses
+
+
+SCORING_CACHE_STATS = CacheStats()
+
+
+class ScoringResponseCache:
+    def __init__(self, env, config: ResponseCacheConfig):
+        self._env = env
+        self._config = config
+
+    def get(self, system: str, user: str, model: str) -> str | None:
+        if not self._config.enabled:
+            return None
+
+        Cache = self._env["estate.property.scoring.cache"].sudo()
+        entry = Cache.search([("key", "=", _cache_key(system, user, model))], limit=1)
+        expires_before = fields.Datetime.now() - timedelta(days=self._config.ttl_days)
+        if entry and entry.create_date < expires_before:
+            entry.unlink()
+            entry = Cache
+        if not entry:
+            SCORING_CACHE_STATS.record(hit=False)
+            return None
+
+        entry.write({
+            "hit_count": entry.hit_count + 1,
+            "last_used_at": fields.Datetime.now(),
+        })
+        SCORING_CACHE_STATS.record(hit=True)
+        return entry.response_text
+
+    def put(self, system: str, user: str, model: str, response_text: str) -> None:
+        if not self._config.enabled:
+            return
+
+        self._env.cr.execute(
+            """
+            INSERT INTO estate_property_scoring_cache
+                (key, model, response_text, hit_count, last_used_at,
+                 create_uid, create_date, write_uid, write_date)
+            VALUES (%s, %s, %s, 0, now() at time zone 'UTC',
+                    %s, now() at time zone 'UTC', %s, now() at time zone 'UTC')
+            ON CONFLICT (key) DO UPDATE
+            SET response_text = EXCLUDED.response_text,
+                last_used_at = EXCLUDED.last_used_at,
+                create_date = EXCLUDED.create_date,
+                write_date = EXCLUDED.write_date
+            """,
+            [
+                _cache_key(system, user, model),
+                model,
+                response_text,
+                self._env.uid,
+                self._env.uid,
+            ],
+        )
+        self._env["estate.property.scoring.cache"].invalidate_model()
+
+    def evict(self) -> int:
+        # Вытеснение идёт отдельным кроном: общий DELETE в каждом put конфликтовал между параллельными воркерами
+        if not self._config.enabled:
+            return 0
+        self._env["estate.property.scoring.cache"].flush_model()
+        self._env.cr.execute(
+            """
+            DELETE FROM estate_property_scoring_cache
+            WHERE create_date < (now() at time zone 'UTC') - make_interval(days => %s)
+               OR id IN (
+                SELECT id FROM estate_property_scoring_cache
+                ORDER BY last_used_at DESC, id DESC
+                OFFSET %s
+            )
+            """,
+            [self._config.ttl_days, self._config.max_entries],
+        )
+        evicted = self._env.cr.rowcount
+        self._env["estate.property.scoring.cache"].invalidate_model()
+        return evicted
+
+
+def _cache_key(system: str, user: str, model: str) -> str:
+    digest = hashlib.sha256()
+    for part in (model, system, user):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
@@ -10,6 +10,7 @@ from .protocols import (
     IPoolStatusBuilder,
     IPoolSummaryLogger,
     IPromptResolver,
+    IResponseCache,
     IResponseParser,
     ISinglePropertyScorer,
     IThresholdChecker,
@@ -32,6 +33,7 @@ class MarketingPoolService:
         message_builder: IMessageBuilder,
         response_parser: IResponseParser,
         pool_status_builder: IPoolStatusBuilder,
+        response_cache: IResponseCache,
     ):
         self._env = env
         self._config = config
@@ -46,21 +48,23 @@ class MarketingPoolService:
         self._message_builder = message_builder
         self._response_parser = response_parser
         self._pool_status_builder = pool_status_builder
+        self._response_cache = response_cache
 
     # --- Pool ---
 
-    def calculate_all(self) -> None:
+    def calculate_all(self, incremental: bool = False) -> None:
         Log = self._env["estate.kit.log"]
         CAT = "marketing_pool"
 
-        properties = self._loader.load()
-        if not properties:
+        total = self._loader.count()
+        if not total:
             Log.log(CAT, "Нет активных объектов для расчёта", level="warning")
             return
 
         Log.log(
             CAT,
-            "Расчёт пула запущен: %d объектов" % len(properties),
+            "Расчёт пула запущен (%s): %d объектов"
+            % ("инкрементальный" if incremental else "полный", total),
             details="W_scoring=%.2f, W_tier=%.2f, "
                     "мин. price=%d, мин. quality=%d, мин. listing=%d, "
                     "порог включения=%.1f, порог исключения=%.1f"
@@ -76,14 +80,24 @@ class MarketingPoolService:
         )
         self._env.cr.commit()
 
-        self._freshness.ensure_fresh(properties)
+        self._freshness.ensure_fresh(self._loader.iter_batches())
 
-        stats, details_lines = self._batch_scorer.score_all(properties)
+        if incremental and not self._loader.count(dirty_only=True):
+            Log.log(CAT, "Нет изменённых объектов, пересчёт MPS не требуется")
+            return
+
+        stats, details_lines = self._batch_scorer.score_batches(
+            self._loader.iter_batches(dirty_only=incremental)
+        )
         self._summary_logger.log(stats, details_lines)
 
     def update_single(self, prop) -> None:
         self._single_scorer.update(prop)
 
+    def update_many(self, properties) -> None:
+        if properties:
+            self._batch_scorer.score_all(properties)
+
     def scores_below_threshold(
         self, scoring, min_price: int, min_quality: int, min_listing: int,
     ) -> bool:
@@ -112,12 +126,32 @@ class MarketingPoolService:
         if not self.is_configured:
             return None
 
+        system_prompt, user_message = self.build_scoring_prompt(property_data, with_benchmark)
+
+        response_text = self.cached_response(system_prompt, user_message)
+        if response_text is None:
+            response_text = self._ai_client.complete(system_prompt, user_message)
+            if response_text is None:
+                return None
+            self.remember_response(system_prompt, user_message, response_text)
+
+        return self.parse_scoring_response(response_text)
+
+    def cached_response(self, system_prompt: str, user_message: str) -> str | None:
+        return self._response_cache.get(system_prompt, user_message, self.model)
+
+    def remember_response(self, system_prompt: str, user_message: str, response_text: str) -> None:
+        self._response_cache.put(system_prompt, user_message, self.model, response_text)
+
+    def build_scoring_prompt(
+        self,
+        property_data: dict[str, Any],
+        with_benchmark: bool = False,
+    ) -> tuple[str, str]:
         prop_type = property_data.get("property_type", "apartment")
         system_prompt = self._prompt_resolver.resolve(prop_type, with_benchmark)
         user_message = self._message_builder.build(property_data)
+        return system_prompt, user_message
 
-        response_text = self._ai_client.complete(system_prompt, user_message)
-        if response_text is None:
-            return None
-
+    def parse_scoring_response(self, response_text: str) -> dict[str, Any] | None:
         return self._response_parser.parse(response_text)
@@ -14,4 +14,5 @@ class SinglePropertyScorer:
         prop.write({
             "marketing_pool_score": result.score,
             "marketing_pool_score_display": result.display,
+            "mps_dirty": False,
         })
@@ -1,9 +1,9 @@
-from typing import Any
+from .protocols import ITierStatsCache
 
 
 class TierBonusCalculator:
-    def __init__(self, env: Any):
-        self.env = env
+    def __init__(self, stats_cache: ITierStatsCache):
+        self._stats_cache = stats_cache
 
     def calculate(self, prop) -> float:
         tiers = prop.tier_ids
@@ -24,10 +24,7 @@ class TierBonusCalculator:
 
         best_tier = min(tiers, key=lambda t: t.priority)
         role = best_tier.role
-        same_role_tiers = self.env["estate.property.tier"].search_count([
-            ("user_id", "=", best_tier.user_id.id),
-            ("role", "=", role),
-        ])
+        same_role_tiers = self._stats_cache.count(best_tier.user_id.id, role)
         p_max = max(same_role_tiers, 1)
         multiplier = 1.0 + (1 - best_tier.priority / p_max) * 0.25
         result = base_bonus * multiplier
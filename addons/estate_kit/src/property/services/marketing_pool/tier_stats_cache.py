@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+# Кэш живёт на транзакции, а не на Environment: sudo()/with_context() создают новые env,
+# и сброс из записи тир-листа должен доходить до всех env той же транзакции
+_TRANSACTION_KEY = "_estate_tier_stats_cache"
+
+
+class TierStatsCache:
+    def __init__(self, env) -> None:
+        self._env = env
+        self._counts: dict[tuple[int, str], int] | None = None
+
+    @classmethod
+    def get(cls, env) -> TierStatsCache:
+        cache = getattr(env.transaction, _TRANSACTION_KEY, None)
+        if cache is None:
+            cache = cls(env)
+            setattr(env.transaction, _TRANSACTION_KEY, cache)
+        return cache
+
+    @classmethod
+    def invalidate_for(cls, env) -> None:
+        cache = getattr(env.transaction, _TRANSACTION_KEY, None)
+        if cache is not None:
+            cache.invalidate()
+
+    def count(self, user_id: int, role: str) -> int:
+        if self._counts is None:
+            self._counts = self._load()
+        return self._counts.get((user_id, role), 0)
+
+    def invalidate(self) -> None:
+        self._counts = None
+
+    def _load(self) -> dict[tuple[int, str], int]:
+        # Счётчики верны только до конца транзакции: после commit/rollback перечитываем
+        self._env.cr.postcommit.add(self.invalidate)
+        self._env.cr.postrollback.add(self.invalidate)
+        self._env["estate.property.tier"].flush_model(["user_id", "role"])
+        self._env.cr.execute(
+            """
+            SELECT user_id, role, count(*)
+            FROM estate_property_tier
+            GROUP BY user_id, role
+            """
+        )
+        return {(row[0], row[1]): row[2] for row in self._env.cr.fetchall()}
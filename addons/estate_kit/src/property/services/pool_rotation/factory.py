@@ -1,7 +1,9 @@
 from ....shared.services.ai_client import Factory as AiClientFactory
 from ..marketing_pool import Factory as MarketingPoolFactory
+from ..marketing_pool.latest_scoring_loader import LatestScoringLoader
 from .pool_protector import PoolProtector
-from .pool_remover import PoolRemover
+from .rotation_applier import RotationApplier
+from .rotation_planner import RotationPlanner
 from .service import PoolRotationService
 
 
@@ -9,6 +11,10 @@ class Factory:
     @staticmethod
     def create(env) -> PoolRotationService:
         marketing_pool = MarketingPoolFactory.create(env, AiClientFactory.create(env))
-        pool_protector = PoolProtector(env)
-        pool_remover = PoolRemover()
-        return PoolRotationService(marketing_pool, pool_protector, pool_remover, env)
+        planner = RotationPlanner(
+            marketing_pool=marketing_pool,
+            pool_protector=PoolProtector(env),
+            scoring_loader=LatestScoringLoader(env),
+            env=env,
+        )
+        return PoolRotationService(marketing_pool, planner, RotationApplier(env), env)
@@ -1,5 +1,13 @@
+from .i_latest_scoring_loader import ILatestScoringLoader
 from .i_marketing_pool import IMarketingPool
 from .i_pool_protector import IPoolProtector
-from .i_pool_remover import IPoolRemover
+from .i_rotation_applier import IRotationApplier
+from .i_rotation_planner import IRotationPlanner
 
-__all__ = ["IMarketingPool", "IPoolProtector", "IPoolRemover"]
+__all__ = [
+    "ILatestScoringLoader",
+    "IMarketingPool",
+    "IPoolProtector",
+    "IRotationApplier",
+    "IRotationPlanner",
+]
@@ -0,0 +1,3 @@
+from ...marketing_pool.protocols import ILatestScoringLoader
+
+__all__ = ["ILatestScoringLoader"]
@@ -0,0 +1,7 @@
+from typing import Protocol
+
+from ..rotation_plan import RotationPlan
+
+
+class IRotationApplier(Protocol):
+    def apply(self, plan: RotationPlan, pool_tag) -> None: ...
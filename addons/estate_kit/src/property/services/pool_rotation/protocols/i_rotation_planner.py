@@ -0,0 +1,7 @@
+from typing import Protocol
+
+from ..rotation_plan import RotationPlan
+
+
+class IRotationPlanner(Protocol):
+    def plan(self, pool_tag) -> RotationPlan: ...
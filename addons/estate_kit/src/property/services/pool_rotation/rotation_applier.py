@@ -0,0 +1,110 @@
+import logging
+
+from dateutil.relativedelta import relativedelta
+from odoo import fields
+
+from ..marketing_pool.mps_dirty_marker import MpsDirtyMarker
+
+_logger = logging.getLogger(__name__)
+
+_ACTIVE_PLACEMENT_STATES = ("draft", "active", "paused")
+
+
+class RotationApplier:
+    def __init__(self, env) -> None:
+        self._env = env
+
+    def apply(self, plan, pool_tag) -> None:
+        removed_ids = [item.property_id for item in plan.to_remove]
+        added_ids = [item.property_id for item in plan.to_add]
+
+        self._update_pool_tag(pool_tag, removed_ids, added_ids)
+
+        if removed_ids:
+            self._env["estate.property.placement"].search([
+                ("property_id", "in", removed_ids),
+                ("state", "in", list(_ACTIVE_PLACEMENT_STATES)),
+            ]).write({"state": "removed"})
+
+        self._post_notes(
+            [(item.property_id, "Выведен из маркетингового пула: %s" % item.reason) for item in plan.to_remove]
+            + [(item.property_id, "Включён в маркетинговый пул (MPS: %.1f)" % item.mps) for item in plan.to_add]
+        )
+        self._schedule_protection_activities(plan)
+
+        _logger.info(
+            "Pool rotation applied: %d removed, %d protected, %d added",
+            len(plan.to_remove),
+            len(plan.to_protect),
+            len(plan.to_add),
+        )
+
+    def _update_pool_tag(self, pool_tag, removed_ids: list[int], added_ids: list[int]) -> None:
+        if not removed_ids and not added_ids:
+            return
+
+        Property = self._env["estate.property"]
+        field = Property._fields["tag_ids"]
+        Property.flush_model(["tag_ids"])
+
+        if removed_ids:
+            self._env.cr.execute(
+                'DELETE FROM "{rel}" WHERE "{col1}" = ANY(%s) AND "{col2}" = %s'.format(
+                    rel=field.relation, col1=field.column1, col2=field.column2,
+                ),
+                [removed_ids, pool_tag.id],
+            )
+        if added_ids:
+            self._env.cr.execute(
+                'INSERT INTO "{rel}" ("{col1}", "{col2}") '
+                'SELECT unnest(%s::int[]), %s ON CONFLICT DO NOTHING'.format(
+                    rel=field.relation, col1=field.column1, col2=field.column2,
+                ),
+                [added_ids, pool_tag.id],
+            )
+        # SQL мимо ORM: сбрасываем кэш, пересчитываем зависящие от тегов поля и, как write(), помечаем MPS
+        changed = Property.browse(removed_ids + added_ids)
+        changed.invalidate_recordset(["tag_ids"])
+        changed.modified(["tag_ids"])
+        MpsDirtyMarker(self._env).mark_properties(changed.ids)
+
+    def _post_notes(self, notes: list[tuple[int, str]]) -> None:
+        if not notes:
+            return
+        subtype_id = self._env["ir.model.data"]._xmlid_to_res_id("mail.mt_note")
+        author_id = self._env.user.partner_id.id
+        self._env["mail.message"].create([
+            {
+                "model": "estate.property",
+                "res_id": property_id,
+                "body": body,
+                "message_type": "comment",
+                "subtype_id": subtype_id,
+                "author_id": author_id,
+            }
+            for property_id, body in notes
+        ])
+
+    def _schedule_protection_activities(self, plan) -> None:
+        if not plan.to_protect:
+            return
+        activity_type = self._env.ref("mail.mail_activity_data_todo")
+        model_id = self._env["ir.model"]._get_id("estate.property")
+        # Те же срок и исполнитель, что у activity_schedule(): задержка и ответственный из типа активности
+        date_deadline = fields.Date.context_today(activity_type) + relativedelta(
+            **{activity_type.delay_unit: activity_type.delay_count}
+        )
+        user_id = activity_type.default_user_id.id or self._env.uid
+        self._env["mail.activity"].create([
+            {
+                "activity_type_id": activity_type.id,
+                "summary": "MPS ниже порога — проверьте",
+                "note": "Marketing Pool Score: %.1f (порог: %.1f). "
+                        "Объект защищён от исключения." % (item.mps, plan.t_exclude),
+                "res_model_id": model_id,
+                "res_id": item.property_id,
+                "date_deadline": date_deadline,
+                "user_id": user_id,
+            }
+            for item in plan.to_protect
+        ])
@@ -0,0 +1,46 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class PlannedRemoval:
+    property_id: int
+    name: str
+    reason: str
+
+
+@dataclass(frozen=True)
+class PlannedProtection:
+    property_id: int
+    name: str
+    mps: float
+
+
+@dataclass(frozen=True)
+class PlannedAddition:
+    property_id: int
+    name: str
+    mps: float
+
+
+@dataclass
+class RotationPlan:
+    t_exclude: float
+    to_remove: list[PlannedRemoval] = field(default_factory=list)
+    to_protect: list[PlannedProtection] = field(default_factory=list)
+    to_add: list[PlannedAddition] = field(default_factory=list)
+
+    def as_report(self) -> dict:
+        return {
+            "to_remove": [
+                {"property_id": item.property_id, "name": item.name, "reason": item.reason}
+                for item in self.to_remove
+            ],
+            "to_protect": [
+                {"property_id": item.property_id, "name": item.name, "mps": item.mps}
+                for item in self.to_protect
+            ],
+            "to_add": [
+                {"property_id": item.property_id, "name": item.name, "mps": item.mps}
+                for item in self.to_add
+            ],
+        }
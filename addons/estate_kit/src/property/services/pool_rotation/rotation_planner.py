@@ -0,0 +1,78 @@
+from .protocols import ILatestScoringLoader, IMarketingPool, IPoolProtector
+from .rotation_plan import PlannedAddition, PlannedProtection, PlannedRemoval, RotationPlan
+
+POOL_ELIGIBLE_STATES = ("active", "published")
+
+
+class RotationPlanner:
+    def __init__(
+        self,
+        marketing_pool: IMarketingPool,
+        pool_protector: IPoolProtector,
+        scoring_loader: ILatestScoringLoader,
+        env,
+    ) -> None:
+        self._marketing_pool = marketing_pool
+        self._pool_protector = pool_protector
+        self._scoring_loader = scoring_loader
+        self._env = env
+
+    def plan(self, pool_tag) -> RotationPlan:
+        get_param = self._env["ir.config_parameter"].sudo().get_param
+        min_price = int(get_param("estate_kit.pool_min_price_score", "3"))
+        min_quality = int(get_param("estate_kit.pool_min_quality_score", "3"))
+        min_listing = int(get_param("estate_kit.pool_min_listing_score", "3"))
+        t_include = float(get_param("estate_kit.pool_inclusion_threshold", "7.0"))
+        t_exclude = float(get_param("estate_kit.pool_exclusion_threshold", "4.0"))
+        pool_max = int(get_param("estate_kit.pool_max_size", "100"))
+
+        plan = RotationPlan(t_exclude=t_exclude)
+        Property = self._env["estate.property"]
+
+        pool_properties = Property.search([("tag_ids", "in", pool_tag.id)])
+        latest_by_property = self._scoring_loader.load(pool_properties.ids)
+        for prop in pool_properties:
+            if prop.state not in POOL_ELIGIBLE_STATES:
+                plan.to_remove.append(PlannedRemoval(
+                    prop.id, prop.name, "Объект в статусе «%s»" % prop.state,
+                ))
+                continue
+
+            latest = latest_by_property.get(prop.id)
+            if latest and self._marketing_pool.scores_below_threshold(latest, min_price, min_quality, min_listing):
+                plan.to_remove.append(PlannedRemoval(
+                    prop.id, prop.name,
+                    "AI-скоринг ниже порога: price=%d quality=%d listing=%d"
+                    % (latest.price_score, latest.quality_score, latest.listing_score),
+                ))
+                continue
+
+            mps = prop.marketing_pool_score
+            if mps < t_exclude:
+                if self._pool_protector.is_pool_protected(prop):
+                    plan.to_protect.append(PlannedProtection(prop.id, prop.name, mps))
+                else:
+                    plan.to_remove.append(PlannedRemoval(
+                        prop.id, prop.name, "MPS %.1f ниже порога %.1f" % (mps, t_exclude),
+                    ))
+
+        free_slots = pool_max - (len(pool_properties) - len(plan.to_remove))
+        if free_slots <= 0:
+            return plan
+
+        candidates = Property.search([
+            ("tag_ids", "not in", pool_tag.ids),
+            ("state", "in", list(POOL_ELIGIBLE_STATES)),
+            ("marketing_pool_score", ">=", t_include),
+        ], order="marketing_pool_score desc", limit=free_slots)
+
+        latest_by_candidate = self._scoring_loader.load(candidates.ids)
+        for prop in candidates:
+            latest = latest_by_candidate.get(prop.id)
+            if not latest:
+                continue
+            if self._marketing_pool.scores_below_threshold(latest, min_price, min_quality, min_listing):
+                continue
+            plan.to_add.append(PlannedAddition(prop.id, prop.name, prop.marketing_pool_score))
+
+        return plan
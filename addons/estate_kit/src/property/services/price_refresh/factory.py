@@ -0,0 +1,30 @@
+from ....market_snapshot.services.benchmark_resolver import (
+    Factory as BenchmarkResolverFactory,
+)
+from ....shared.services.ai_client import Factory as AiClientFactory
+from ..marketing_pool import Factory as MarketingPoolFactory
+from ..marketing_pool.active_properties_loader import ActivePropertiesLoader
+from ..marketing_pool.latest_scoring_loader import LatestScoringLoader
+from ..marketing_pool.price_block_builder import (
+    Factory as PriceBlockBuilderFactory,
+)
+from ..marketing_pool.price_score_calculator import (
+    Factory as PriceScoreCalculatorFactory,
+)
+from .price_score_writer import PriceScoreWriter
+from .service import PriceRefreshService
+
+
+class Factory:
+    @staticmethod
+    def create(env) -> PriceRefreshService:
+        return PriceRefreshService(
+            loader=ActivePropertiesLoader(env),
+            scoring_loader=LatestScoringLoader(env),
+            benchmark_resolver=BenchmarkResolverFactory.create(env),
+            price_score_calculator=PriceScoreCalculatorFactory.create(env),
+            price_score_writer=PriceScoreWriter(env),
+            price_block_builder=PriceBlockBuilderFactory.create(env),
+            marketing_pool=MarketingPoolFactory.create(env, AiClientFactory.create(env)),
+            env=env,
+        )
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PriceScoreRow:
+    scoring_id: int
+    price_score: int
+    rationale: str
+    benchmark_snapshot_id: int
+    benchmark_median_per_sqm: float
@@ -0,0 +1,39 @@
+from .price_score_row import PriceScoreRow
+
+
+class PriceScoreWriter:
+    def __init__(self, env):
+        self._env = env
+
+    def write(self, rows: list[PriceScoreRow]) -> None:
+        if not rows:
+            return
+        self._env["estate.property.scoring"].flush_model([
+            "price_score", "rationale", "benchmark_snapshot_id", "benchmark_median_per_sqm",
+        ])
+        self._env.cr.execute(
+            """
+            UPDATE estate_property_scoring s
+            SET price_score = v.price_score,
+                rationale = v.rationale,
+                benchmark_snapshot_id = v.benchmark_snapshot_id,
+                benchmark_median_per_sqm = v.benchmark_median_per_sqm,
+                write_uid = %s,
+                write_date = now() at time zone 'UTC'
+            FROM unnest(%s::int[], %s::int[], %s::text[], %s::int[], %s::float8[])
+                AS v(id, price_score, rationale, benchmark_snapshot_id, benchmark_median_per_sqm)
+            WHERE s.id = v.id
+            """,
+            [
+                self._env.uid,
+                [row.scoring_id for row in rows],
+                [row.price_score for row in rows],
+                [row.rationale for row in rows],
+                [row.benchmark_snapshot_id for row in rows],
+                [row.benchmark_median_per_sqm for row in rows],
+            ],
+        )
+        self._env["estate.property.scoring"].browse([row.scoring_id for row in rows]).invalidate_recordset([
+            "price_score", "price_score_color", "rationale", "benchmark_snapshot_id", "benchmark_median_per_sqm",
+            "write_uid", "write_date",
+        ])
@@ -0,0 +1,17 @@
+from .i_benchmark_resolver import IBenchmarkResolver
+from .i_latest_scoring_loader import ILatestScoringLoader
+from .i_marketing_pool import IMarketingPool
+from .i_price_block_builder import IPriceBlockBuilder
+from .i_price_score_calculator import IPriceScoreCalculator
+from .i_price_score_writer import IPriceScoreWriter
+from .i_properties_loader import IPropertiesLoader
+
+__all__ = [
+    "IBenchmarkResolver",
+    "ILatestScoringLoader",
+    "IMarketingPool",
+    "IPriceBlockBuilder",
+    "IPriceScoreCalculator",
+    "IPriceScoreWriter",
+    "IPropertiesLoader",
+]
@@ -0,0 +1,7 @@
+from typing import Protocol
+
+from .....market_snapshot.services.benchmark_resolver import MarketBenchmark
+
+
+class IBenchmarkResolver(Protocol):
+    def resolve_many(self, props) -> dict[int, MarketBenchmark]: ...
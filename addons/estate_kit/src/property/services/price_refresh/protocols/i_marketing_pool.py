@@ -0,0 +1,5 @@
+from typing import Protocol
+
+
+class IMarketingPool(Protocol):
+    def update_many(self, properties) -> None: ...
@@ -0,0 +1,3 @@
+from ...ai_scoring.protocols import IPriceBlockBuilder
+
+__all__ = ["IPriceBlockBuilder"]
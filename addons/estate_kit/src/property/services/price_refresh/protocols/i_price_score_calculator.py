@@ -0,0 +1,7 @@
+from typing import Protocol
+
+from ...marketing_pool.price_score_calculator import PriceScoreBatch, PriceScoreBatchResult
+
+
+class IPriceScoreCalculator(Protocol):
+    def calculate_batch(self, batch: PriceScoreBatch) -> PriceScoreBatchResult: ...
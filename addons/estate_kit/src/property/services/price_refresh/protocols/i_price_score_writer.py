@@ -0,0 +1,7 @@
+from typing import Protocol
+
+from ..price_score_row import PriceScoreRow
+
+
+class IPriceScoreWriter(Protocol):
+    def write(self, rows: list[PriceScoreRow]) -> None: ...
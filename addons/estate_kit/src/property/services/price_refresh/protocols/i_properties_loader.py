@@ -0,0 +1,6 @@
+from collections.abc import Iterator
+from typing import Protocol
+
+
+class IPropertiesLoader(Protocol):
+    def iter_batches(self, dirty_only: bool = False) -> Iterator: ...
@@ -0,0 +1,144 @@
+import logging
+
+from ..ai_scoring.rationale import replace_price_block
+from ..marketing_pool.price_score_calculator import PriceScoreBatch, PriceScoreResult
+from .price_score_row import PriceScoreRow
+from .protocols import (
+    IBenchmarkResolver,
+    ILatestScoringLoader,
+    IMarketingPool,
+    IPriceBlockBuilder,
+    IPriceScoreCalculator,
+    IPriceScoreWriter,
+    IPropertiesLoader,
+)
+
+_logger = logging.getLogger(__name__)
+
+_LOG_CATEGORY = "marketing_pool"
+_WATERMARK_PARAM = "estate_kit.price_refresh_snapshot_id"
+
+
+class PriceRefreshService:
+    def __init__(
+        self,
+        loader: IPropertiesLoader,
+        scoring_loader: ILatestScoringLoader,
+        benchmark_resolver: IBenchmarkResolver,
+        price_score_calculator: IPriceScoreCalculator,
+        price_score_writer: IPriceScoreWriter,
+        price_block_builder: IPriceBlockBuilder,
+        marketing_pool: IMarketingPool,
+        env,
+    ) -> None:
+        self._loader = loader
+        self._scoring_loader = scoring_loader
+        self._benchmark_resolver = benchmark_resolver
+        self._price_score_calculator = price_score_calculator
+        self._price_score_writer = price_score_writer
+        self._price_block_builder = price_block_builder
+        self._marketing_pool = marketing_pool
+        self._env = env
+
+    def refresh(self, force: bool = False) -> int:
+        latest_snapshot_id = self._latest_snapshot_id()
+        if not latest_snapshot_id:
+            return 0
+        if not force and latest_snapshot_id <= self._get_watermark():
+            return 0
+
+        checked = 0
+        changed = 0
+        for properties in self._loader.iter_batches():
+            checked += len(properties)
+            changed += self._refresh_batch(properties)
+            self._env.cr.commit()
+
+        self._set_watermark(latest_snapshot_id)
+        self._env["estate.kit.log"].log(
+            _LOG_CATEGORY,
+            "Price score пересчитан по рынку: %d объектов проверено, %d изменено"
+            % (checked, changed),
+            details="Последний снапшот рынка: %d" % latest_snapshot_id,
+        )
+        self._env.cr.commit()
+        _logger.info(
+            "Formula price score refresh: %d checked, %d changed (snapshot %d)",
+            checked, changed, latest_snapshot_id,
+        )
+        return changed
+
+    def _refresh_batch(self, properties) -> int:
+        latest_by_property = self._scoring_loader.load(properties.ids)
+
+        scored = properties.filtered(lambda prop: prop.id in latest_by_property)
+        benchmark_by_property = self._benchmark_resolver.resolve_many(scored)
+        property_ids = [property_id for property_id in scored.ids if property_id in benchmark_by_property]
+        if not property_ids:
+            return 0
+
+        batch = PriceScoreBatch.from_records(
+            self._env["estate.property"].browse(property_ids),
+            [benchmark_by_property[property_id] for property_id in property_ids],
+        )
+        result = self._price_score_calculator.calculate_batch(batch)
+
+        # Ценовой блок обоснования называет медиану и снапшот рынка, поэтому пересобирается и при
+        # смене бенчмарка с тем же баллом — иначе текст расходится с текущим рынком
+        changed: dict[int, PriceScoreResult] = {}
+        for index, property_id in enumerate(result.property_ids):
+            price_score_result = result.result(index)
+            if price_score_result is None:
+                continue
+            latest = latest_by_property[property_id]
+            benchmark = benchmark_by_property[property_id]
+            if (
+                price_score_result.score != latest.price_score
+                or benchmark.snapshot_id != latest.benchmark_snapshot_id
+                or benchmark.median_price_per_sqm != latest.benchmark_median_per_sqm
+            ):
+                changed[property_id] = price_score_result
+        if not changed:
+            return 0
+
+        scoring_ids = [latest_by_property[property_id].id for property_id in changed]
+        rationales = {
+            rec["id"]: rec["rationale"]
+            for rec in self._env["estate.property.scoring"].browse(scoring_ids).read(["rationale"])
+        }
+        rows: list[PriceScoreRow] = []
+        for prop in self._env["estate.property"].browse(list(changed)):
+            benchmark = benchmark_by_property[prop.id]
+            latest = latest_by_property[prop.id]
+            price_block = self._price_block_builder.build(prop, benchmark, changed[prop.id])
+            rows.append(PriceScoreRow(
+                scoring_id=latest.id,
+                price_score=changed[prop.id].score,
+                rationale=replace_price_block(rationales[latest.id], price_block.text),
+                benchmark_snapshot_id=benchmark.snapshot_id,
+                benchmark_median_per_sqm=benchmark.median_price_per_sqm,
+            ))
+
+        self._price_score_writer.write(rows)
+        # MPS зависит только от балла: смена одного текста блока пул не трогает
+        rescored_ids = [
+            property_id
+            for property_id, price_score_result in changed.items()
+            if price_score_result.score != latest_by_property[property_id].price_score
+        ]
+        self._marketing_pool.update_many(self._env["estate.property"].browse(rescored_ids))
+        return len(changed)
+
+    def _latest_snapshot_id(self) -> int:
+        self._env.cr.execute("SELECT max(id) FROM estate_market_snapshot")
+        return self._env.cr.fetchone()[0] or 0
+
+    def _get_watermark(self) -> int:
+        raw = self._env["ir.config_parameter"].sudo().get_param(_WATERMARK_PARAM)
+        try:
+            return int(raw or 0)
+        except (TypeError, ValueError):
+            return 0
+
+    def _set_watermark(self, snapshot_id: int) -> None:
+        self._env["ir.config_parameter"].sudo().set_param(_WATERMARK_PARAM, str(snapshot_id))
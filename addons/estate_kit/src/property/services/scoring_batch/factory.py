@@ -0,0 +1,15 @@
+from ....shared.services.ai_client import Factory as AiClientFactory
+from ..ai_scoring import Factory as AiScoringFactory
+from ..marketing_pool import Factory as MarketingPoolFactory
+from .service import ScoringBatchService
+
+
+class Factory:
+    @staticmethod
+    def create(env) -> ScoringBatchService:
+        return ScoringBatchService(
+            ai_scoring=AiScoringFactory.create(env),
+            batch_client=AiClientFactory.create_batch(env),
+            marketing_pool=MarketingPoolFactory.create(env, AiClientFactory.create(env)),
+            env=env,
+        )
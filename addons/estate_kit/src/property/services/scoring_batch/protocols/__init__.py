@@ -0,0 +1,5 @@
+from .i_ai_scoring import IAiScoring
+from .i_batch_ai_client import IBatchAiClient
+from .i_marketing_pool import IMarketingPool
+
+__all__ = ["IAiScoring", "IBatchAiClient", "IMarketingPool"]
@@ -0,0 +1,15 @@
+from typing import Protocol
+
+from ...ai_scoring.scoring_request import ScoringRequest
+
+
+class IAiScoring(Protocol):
+    def build_request(self, property_id: int) -> ScoringRequest: ...
+
+    def apply_response(
+        self,
+        property_id: int,
+        request: ScoringRequest,
+        response_text: str | None,
+        remember: bool = True,
+    ): ...
@@ -0,0 +1,3 @@
+from .....shared.services.ai_client.protocols import IBatchAiClient
+
+__all__ = ["IBatchAiClient"]
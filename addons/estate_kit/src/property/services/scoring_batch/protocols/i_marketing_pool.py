@@ -0,0 +1,7 @@
+from typing import Protocol
+
+
+class IMarketingPool(Protocol):
+    def update_many(self, properties) -> None: ...
+
+    def cached_response(self, system_prompt: str, user_message: str) -> str | None: ...
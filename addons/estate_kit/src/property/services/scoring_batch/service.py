@@ -0,0 +1,220 @@
+import logging
+from datetime import timedelta
+
+from odoo import fields
+from odoo.exceptions import UserError
+
+from ....shared.services.ai_client import BATCH_ENDED_STATUS, BATCH_NOT_FOUND_STATUS, BatchRequest
+from ..ai_scoring.scoring_request import ScoringRequest
+from .protocols import IAiScoring, IBatchAiClient, IMarketingPool
+
+_logger = logging.getLogger(__name__)
+
+_LOG_CATEGORY = "ai_scoring"
+_BATCH_ID_PARAM = "estate_kit.scoring_batch_id"
+_SUBMITTED_AT_PARAM = "estate_kit.scoring_batch_submitted_at"
+_MAX_AGE_PARAM = "estate_kit.scoring_batch_max_age_hours"
+# API держит пакет в обработке до 24 ч; всё, что дольше, считаем потерянным
+_DEFAULT_MAX_AGE_HOURS = 48
+_CUSTOM_ID_PREFIX = "property-"
+
+
+class ScoringBatchService:
+    def __init__(
+        self,
+        ai_scoring: IAiScoring,
+        batch_client: IBatchAiClient,
+        marketing_pool: IMarketingPool,
+        env,
+    ) -> None:
+        self._ai_scoring = ai_scoring
+        self._batch_client = batch_client
+        self._marketing_pool = marketing_pool
+        self._env = env
+
+    def submit(self, property_ids: list[int]) -> bool:
+        Log = self._env["estate.kit.log"]
+        pending_batch_id = self._get_batch_id()
+        if pending_batch_id:
+            Log.log(
+                _LOG_CATEGORY,
+                "Пакетный AI-скоринг уже выполняется (%s), новый пакет не отправлен" % pending_batch_id,
+                level="warning",
+            )
+            return False
+
+        batch_requests: list[BatchRequest] = []
+        submitted: dict[int, ScoringRequest] = {}
+        cached_ids: list[int] = []
+        for property_id in property_ids:
+            try:
+                request = self._ai_scoring.build_request(property_id)
+                cached = self._marketing_pool.cached_response(request.system_prompt, request.user_message)
+                if cached is not None:
+                    self._ai_scoring.apply_response(property_id, request, cached, remember=False)
+                    cached_ids.append(property_id)
+                    continue
+            except (UserError, ValueError) as exc:
+                _logger.warning("Skipping property %s in scoring batch: %s", property_id, exc)
+                continue
+            submitted[property_id] = request
+            batch_requests.append(BatchRequest(
+                custom_id="%s%d" % (_CUSTOM_ID_PREFIX, property_id),
+                system=request.system_prompt,
+                user=request.user_message,
+            ))
+
+        if cached_ids:
+            self._marketing_pool.update_many(self._env["estate.property"].browse(cached_ids))
+            self._env.cr.commit()
+            Log.log(
+                _LOG_CATEGORY,
+                "Кэш AI-скоринга: %d объектов оценено без запроса к API" % len(cached_ids),
+            )
+
+        if not batch_requests:
+            return bool(cached_ids)
+
+        batch_id = self._batch_client.create_batch(batch_requests)
+        if not batch_id:
+            Log.log(
+                _LOG_CATEGORY,
+                "Не удалось отправить пакет AI-скоринга (%d объектов)" % len(batch_requests),
+                level="error",
+            )
+            return False
+
+        self._save_requests(batch_id, submitted)
+        self._set_batch_id(batch_id)
+        self._set_submitted_at(fields.Datetime.to_string(fields.Datetime.now()))
+        self._env.cr.commit()
+        Log.log(
+            _LOG_CATEGORY,
+            "Пакет AI-скоринга отправлен: %s, %d объектов" % (batch_id, len(batch_requests)),
+        )
+        return True
+
+    def poll(self) -> None:
+        batch_id = self._get_batch_id()
+        if not batch_id:
+            return
+
+        status = self._batch_client.get_status(batch_id)
+        if status == BATCH_NOT_FOUND_STATUS:
+            self._abandon(batch_id, "пакет не найден в API")
+            return
+        if status != BATCH_ENDED_STATUS:
+            if self._is_overdue():
+                self._abandon(batch_id, "пакет не завершился за отведённое время (статус: %s)" % status)
+                return
+            _logger.info("Scoring batch %s status: %s", batch_id, status)
+            return
+
+        results = self._batch_client.get_results(batch_id)
+        if results is None:
+            if self._is_overdue():
+                self._abandon(batch_id, "результаты пакета недоступны")
+            return
+
+        requests = self._load_requests(batch_id)
+        scored_ids: list[int] = []
+        failed = 0
+        for custom_id, response_text in results.items():
+            property_id = _parse_property_id(custom_id)
+            if property_id is None:
+                continue
+            request = requests.get(property_id)
+            if request is None:
+                failed += 1
+                _logger.warning("No submitted request stored for property %s in batch %s", property_id, batch_id)
+                continue
+            try:
+                self._ai_scoring.apply_response(property_id, request, response_text)
+                scored_ids.append(property_id)
+            except (UserError, ValueError):
+                failed += 1
+                _logger.warning("Failed to apply batch scoring for property %s", property_id)
+            self._env.cr.commit()
+
+        self._clear_batch(batch_id)
+        self._marketing_pool.update_many(self._env["estate.property"].browse(scored_ids).exists())
+        self._env.cr.commit()
+
+        self._env["estate.kit.log"].log(
+            _LOG_CATEGORY,
+            "Пакет AI-скоринга %s обработан: %d рассчитано, %d ошибок"
+            % (batch_id, len(scored_ids), failed),
+            level="warning" if failed else "info",
+        )
+
+    def _abandon(self, batch_id: str, reason: str) -> None:
+        self._clear_batch(batch_id)
+        self._env.cr.commit()
+        self._env["estate.kit.log"].log(
+            _LOG_CATEGORY,
+            "Пакет AI-скоринга %s сброшен: %s" % (batch_id, reason),
+            level="error",
+        )
+
+    def _clear_batch(self, batch_id: str) -> None:
+        self._env["estate.property.scoring.batch.item"].sudo().search([("batch_id", "=", batch_id)]).unlink()
+        self._set_batch_id(False)
+        self._set_submitted_at(False)
+
+    def _is_overdue(self) -> bool:
+        config = self._env["ir.config_parameter"].sudo()
+        submitted_at = config.get_param(_SUBMITTED_AT_PARAM)
+        if not submitted_at:
+            # Пакет отправлен до появления отметки времени — отсчитываем возраст с первого опроса
+            self._set_submitted_at(fields.Datetime.to_string(fields.Datetime.now()))
+            return False
+        max_age_hours = int(config.get_param(_MAX_AGE_PARAM, _DEFAULT_MAX_AGE_HOURS) or _DEFAULT_MAX_AGE_HOURS)
+        return fields.Datetime.now() - fields.Datetime.to_datetime(submitted_at) > timedelta(hours=max_age_hours)
+
+    def _save_requests(self, batch_id: str, submitted: dict[int, ScoringRequest]) -> None:
+        self._env["estate.property.scoring.batch.item"].sudo().create([
+            {
+                "batch_id": batch_id,
+                "property_id": property_id,
+                "with_benchmark": request.with_benchmark,
+                "price_score": request.price_score or 0,
+                "price_block": request.price_block or False,
+                "system_prompt": request.system_prompt,
+                "user_message": request.user_message,
+            }
+            for property_id, request in submitted.items()
+        ])
+
+    def _load_requests(self, batch_id: str) -> dict[int, ScoringRequest]:
+        items = self._env["estate.property.scoring.batch.item"].sudo().search_read(
+            [("batch_id", "=", batch_id)],
+            ["property_id", "with_benchmark", "price_score", "price_block", "system_prompt", "user_message"],
+            load=None,
+        )
+        return {
+            item["property_id"]: ScoringRequest(
+                system_prompt=item["system_prompt"] or "",
+                user_message=item["user_message"] or "",
+                price_score=item["price_score"] if item["with_benchmark"] else None,
+                price_block=item["price_block"] or None,
+            )
+            for item in items
+        }
+
+    def _get_batch_id(self) -> str:
+        return self._env["ir.config_parameter"].sudo().get_param(_BATCH_ID_PARAM) or ""
+
+    def _set_batch_id(self, batch_id) -> None:
+        self._env["ir.config_parameter"].sudo().set_param(_BATCH_ID_PARAM, batch_id)
+
+    def _set_submitted_at(self, submitted_at) -> None:
+        self._env["ir.config_parameter"].sudo().set_param(_SUBMITTED_AT_PARAM, submitted_at)
+
+
+def _parse_property_id(custom_id: str) -> int | None:
+    if not custom_id.startswith(_CUSTOM_ID_PREFIX):
+        return None
+    try:
+        return int(custom_id[len(_CUSTOM_ID_PREFIX):])
+    except ValueError:
+        return None
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class CandidateColumns:
+    ids: list[int]
+    district_ids: list[int | None]
+    prices: list[float]
+    areas: list[float]
+    rooms: list[int]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_read(cls, rows: list[dict[str, Any]]) -> "CandidateColumns":
+        return cls(
+            ids=[row["id"] for row in rows],
+            district_ids=[row["district_id"] or None for row in rows],
+            prices=[row["price"] or 0.0 for row in rows],
+            areas=[row["area_total"] or 0.0 for row in rows],
+            rooms=[row["rooms"] or 0 for row in rows],
+        )
@@ -1,18 +1,75 @@
-from .config import ACTIVE_STATES
+import math
+
+from .candidate_columns import CandidateColumns
+from .config import ACTIVE_STATES, CANDIDATE_FIELDS, CandidateIndexConfig, ScoringConfig
+
+_KM_PER_DEGREE = 111.0
 
 
 class CandidateProvider:
-    def __init__(self, env) -> None:
+    def __init__(self, env, scoring_config: ScoringConfig, index_config: CandidateIndexConfig) -> None:
         self._env = env
+        self._scoring_config = scoring_config
+        self._index_config = index_config
 
-    def find(self, prop):
+    def find(self, prop) -> CandidateColumns:
         if not prop.city_id:
-            return self._env["estate.property"].browse()
-        return self._env["estate.property"].sudo().search(
-            [
-                ("id", "!=", prop.id),
-                ("property_type", "=", prop.property_type),
-                ("city_id", "=", prop.city_id.id),
-                ("state", "in", list(ACTIVE_STATES)),
+            return CandidateColumns.from_read([])
+        base = [
+            ("id", "!=", prop.id),
+            ("property_type", "=", prop.property_type),
+            ("city_id", "=", prop.city_id.id),
+            ("state", "in", list(ACTIVE_STATES)),
+        ]
+        # От узкого среза к городу целиком: берём первый, где кандидатов хватает для ранжирования
+        stages = [
+            self._bands_domain(prop) + self._nearby_domain(prop),
+            self._bands_domain(prop),
+            [],
+        ]
+        rows = CandidateColumns.from_read([])
+        for stage in dict.fromkeys(tuple(stage) for stage in stages):
+            rows = self._read(base + list(stage))
+            if len(rows) >= self._index_config.min_candidates:
+                break
+        return rows
+
+    def _read(self, domain: list) -> CandidateColumns:
+        records = self._env["estate.property"].sudo().search_read(domain, CANDIDATE_FIELDS, load=None)
+        return CandidateColumns.from_read(records)
+
+    def _bands_domain(self, prop) -> list:
+        cfg = self._scoring_config
+        domain: list = []
+        if prop.price:
+            domain += [
+                ("price", ">=", prop.price * (1 - cfg.price_tolerance)),
+                ("price", "<=", prop.price * (1 + cfg.price_tolerance)),
             ]
-        )
+        if prop.area_total:
+            domain += [
+                ("area_total", ">=", prop.area_total * (1 - cfg.area_tolerance)),
+                ("area_total", "<=", prop.area_total * (1 + cfg.area_tolerance)),
+            ]
+        return domain
+
+    def _nearby_domain(self, prop) -> list:
+        # Соседство районов в справочнике не хранится — «соседний район» ищем по bbox вокруг координат
+        bbox = self._bbox_domain(prop)
+        if prop.district_id and bbox:
+            return ["|", ("district_id", "=", prop.district_id.id), "&", "&", "&", *bbox]
+        if prop.district_id:
+            return [("district_id", "=", prop.district_id.id)]
+        return bbox
+
+    def _bbox_domain(self, prop) -> list:
+        if not prop.latitude or not prop.longitude:
+            return []
+        lat_delta = self._index_config.radius_km / _KM_PER_DEGREE
+        lon_delta = lat_delta / max(math.cos(math.radians(prop.latitude)), 0.01)
+        return [
+            ("latitude", ">=", prop.latitude - lat_delta),
+            ("latitude", "<=", prop.latitude + lat_delta),
+            ("longitude", ">=", prop.longitude - lon_delta),
+            ("longitude", "<=", prop.longitude + lon_delta),
+        ]
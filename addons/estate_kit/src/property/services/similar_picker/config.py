@@ -12,8 +12,32 @@ class ScoringConfig:
     rooms_tolerance: int = 1
 
 
+@dataclass(frozen=True)
+class CandidateIndexConfig:
+    radius_km: float = 3.0
+    min_candidates: int = 12
+
+
 ACTIVE_STATES = ("active", "published", "mls_listed")
 
 RESIDENTIAL_TYPES = ("apartment", "house", "townhouse")
 
+SIMILAR_TRIGGER_FIELDS = frozenset((
+    "price",
+    "area_total",
+    "rooms",
+    "district_id",
+    "city_id",
+    "property_type",
+    "state",
+    "latitude",
+    "longitude",
+))
+
+STORED_NEIGHBOURS = 12
+
+CANDIDATE_FIELDS = ["district_id", "price", "area_total", "rooms"]
+
 DEFAULT_CONFIG = ScoringConfig()
+
+DEFAULT_INDEX_CONFIG = CandidateIndexConfig()
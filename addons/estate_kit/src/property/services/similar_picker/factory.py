@@ -1,8 +1,9 @@
 from .candidate_provider import CandidateProvider
-from .config import DEFAULT_CONFIG
+from .config import DEFAULT_CONFIG, DEFAULT_INDEX_CONFIG
 from .proximity_calculator import ProximityCalculator
 from .ranker import Ranker
 from .service import SimilarPickerService
+from .similar_store import SimilarStore
 from .similarity_scorer import SimilarityScorer
 
 
@@ -11,6 +12,8 @@ class Factory:
     def create(env) -> SimilarPickerService:
         scorer = SimilarityScorer(DEFAULT_CONFIG, ProximityCalculator())
         return SimilarPickerService(
-            candidate_provider=CandidateProvider(env),
+            candidate_provider=CandidateProvider(env, DEFAULT_CONFIG, DEFAULT_INDEX_CONFIG),
             ranker=Ranker(scorer),
+            store=SimilarStore(env, DEFAULT_CONFIG),
+            env=env,
         )
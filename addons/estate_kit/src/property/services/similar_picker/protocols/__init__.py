@@ -1,11 +1,13 @@
 from .i_candidate_provider import ICandidateProvider
 from .i_proximity_calculator import IProximityCalculator
 from .i_ranker import IRanker
+from .i_similar_store import ISimilarStore
 from .i_similarity_scorer import ISimilarityScorer
 
 __all__ = [
     "ICandidateProvider",
     "IProximityCalculator",
     "IRanker",
+    "ISimilarStore",
     "ISimilarityScorer",
 ]
@@ -1,5 +1,7 @@
 from typing import Protocol
 
+from ..candidate_columns import CandidateColumns
+
 
 class ICandidateProvider(Protocol):
-    def find(self, prop): ...
+    def find(self, prop) -> CandidateColumns: ...
@@ -5,3 +5,7 @@ class IProximityCalculator(Protocol):
     def calculate(
         self, base: float, value: float, tolerance: float, weight: float
     ) -> float: ...
+
+    def calculate_many(
+        self, base: float, values: list[float], tolerance: float, weight: float
+    ) -> list[float]: ...
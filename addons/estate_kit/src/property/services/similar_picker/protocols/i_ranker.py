@@ -1,5 +1,7 @@
 from typing import Protocol
 
+from ..candidate_columns import CandidateColumns
+
 
 class IRanker(Protocol):
-    def rank(self, prop, candidates, limit: int): ...
+    def rank(self, prop, candidates: CandidateColumns, limit: int) -> list[int]: ...
@@ -0,0 +1,13 @@
+from typing import Protocol
+
+
+class ISimilarStore(Protocol):
+    def read(self, property_id: int, limit: int) -> list[int]: ...
+
+    def lock_dirty(self, after_id: int, limit: int) -> list[int]: ...
+
+    def replace(self, neighbours: dict[int, list[int]]) -> None: ...
+
+    def mark_dirty(self, property_ids: list[int]) -> None: ...
+
+    def expand_corridors(self, limit: int) -> int: ...
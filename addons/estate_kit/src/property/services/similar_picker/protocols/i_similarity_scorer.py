@@ -1,5 +1,7 @@
 from typing import Protocol
 
+from ..candidate_columns import CandidateColumns
+
 
 class ISimilarityScorer(Protocol):
-    def score(self, prop, candidate) -> float: ...
+    def score_many(self, prop, candidates: CandidateColumns) -> list[float]: ...
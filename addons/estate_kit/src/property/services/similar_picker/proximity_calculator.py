@@ -8,3 +8,17 @@ class ProximityCalculator:
         if deviation <= tolerance:
             return weight * (1 - deviation / tolerance)
         return -weight
+
+    def calculate_many(
+        self, base: float, values: list[float], tolerance: float, weight: float
+    ) -> list[float]:
+        if not base:
+            return [0.0] * len(values)
+        result: list[float] = []
+        for value in values:
+            if not value:
+                result.append(0.0)
+                continue
+            deviation = abs(value - base) / base
+            result.append(weight * (1 - deviation / tolerance) if deviation <= tolerance else -weight)
+        return result
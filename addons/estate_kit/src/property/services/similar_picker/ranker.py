@@ -1,3 +1,6 @@
+import heapq
+
+from .candidate_columns import CandidateColumns
 from .protocols import ISimilarityScorer
 
 
@@ -5,13 +8,10 @@ class Ranker:
     def __init__(self, similarity_scorer: ISimilarityScorer) -> None:
         self._similarity_scorer = similarity_scorer
 
-    def rank(self, prop, candidates, limit: int):
-        if not candidates:
-            return candidates
-        scored = sorted(
-            candidates,
-            key=lambda candidate: self._similarity_scorer.score(prop, candidate),
-            reverse=True,
-        )
-        top = scored[:limit]
-        return candidates.browse([record.id for record in top])
+    def rank(self, prop, candidates: CandidateColumns, limit: int) -> list[int]:
+        if not len(candidates):
+            return []
+        scores = self._similarity_scorer.score_many(prop, candidates)
+        # nlargest — частичный отбор top-k; при равных очках порядок как у стабильной сортировки
+        top = heapq.nlargest(limit, range(len(scores)), key=scores.__getitem__)
+        return [candidates.ids[i] for i in top]
@@ -1,13 +1,27 @@
-from .protocols import ICandidateProvider, IRanker
+from .config import STORED_NEIGHBOURS
+from .protocols import ICandidateProvider, IRanker, ISimilarStore
 
 
 class SimilarPickerService:
     def __init__(
-        self, candidate_provider: ICandidateProvider, ranker: IRanker
+        self,
+        candidate_provider: ICandidateProvider,
+        ranker: IRanker,
+        store: ISimilarStore,
+        env,
     ) -> None:
         self._candidate_provider = candidate_provider
         self._ranker = ranker
+        self._store = store
+        self._env = env
 
     def pick(self, prop, limit: int = 6):
+        if prop.similar_dirty:
+            ids = self.compute(prop, limit)
+        else:
+            ids = self._store.read(prop.id, limit)
+        return self._env["estate.property"].sudo().browse(ids)
+
+    def compute(self, prop, limit: int = STORED_NEIGHBOURS) -> list[int]:
         candidates = self._candidate_provider.find(prop)
         return self._ranker.rank(prop, candidates, limit)
@@ -0,0 +1,164 @@
+from .config import ACTIVE_STATES, ScoringConfig
+
+
+class SimilarStore:
+    def __init__(self, env, config: ScoringConfig) -> None:
+        self._env = env
+        self._config = config
+
+    def read(self, property_id: int, limit: int) -> list[int]:
+        # Сосед мог уйти из продажи после пересчёта — такие строки отсекаем на чтении
+        self._env.cr.execute(
+            """
+            SELECT s.similar_id
+            FROM estate_property_similar s
+            JOIN estate_property p ON p.id = s.similar_id
+            WHERE s.property_id = %s
+              AND p.state = ANY(%s)
+              AND p.active
+            ORDER BY s.rank
+            LIMIT %s
+            """,
+            [property_id, list(ACTIVE_STATES), limit],
+        )
+        return [row[0] for row in self._env.cr.fetchall()]
+
+    def lock_dirty(self, after_id: int, limit: int) -> list[int]:
+        # Блокировка строк до коммита пачки: конкурентный write() либо ждёт её и снова ставит флаг,
+        # либо уже держит строку — тогда объект пропускается и остаётся грязным до следующего прохода
+        self._env.cr.execute(
+            """
+            SELECT id
+            FROM estate_property
+            WHERE similar_dirty
+              AND active
+              AND state = ANY(%s)
+              AND id > %s
+            ORDER BY id
+            LIMIT %s
+            FOR UPDATE SKIP LOCKED
+            """,
+            [list(ACTIVE_STATES), after_id, limit],
+        )
+        return [row[0] for row in self._env.cr.fetchall()]
+
+    def replace(self, neighbours: dict[int, list[int]]) -> None:
+        # Флаг снимается безусловно, поэтому строки должны быть заблокированы через lock_dirty()
+        if not neighbours:
+            return
+        property_ids = list(neighbours)
+        self._env.cr.execute(
+            "DELETE FROM estate_property_similar WHERE property_id = ANY(%s)",
+            [property_ids],
+        )
+        rows = [
+            (property_id, similar_id, rank)
+            for property_id, similar_ids in neighbours.items()
+            for rank, similar_id in enumerate(similar_ids, start=1)
+        ]
+        if rows:
+            self._env.cr.execute(
+                """
+                INSERT INTO estate_property_similar
+                    (property_id, similar_id, rank, create_uid, create_date, write_uid, write_date)
+                SELECT v.property_id, v.similar_id, v.rank,
+                       %s, now() at time zone 'UTC', %s, now() at time zone 'UTC'
+                FROM unnest(%s::int[], %s::int[], %s::int[]) AS v(property_id, similar_id, rank)
+                """,
+                [
+                    self._env.uid,
+                    self._env.uid,
+                    [row[0] for row in rows],
+                    [row[1] for row in rows],
+                    [row[2] for row in rows],
+                ],
+            )
+        self._env.cr.execute(
+            "UPDATE estate_property SET similar_dirty = false WHERE id = ANY(%s)",
+            [property_ids],
+        )
+        self._env["estate.property.similar"].invalidate_model()
+        self._env["estate.property"].browse(property_ids).invalidate_recordset(["similar_dirty"])
+
+    def mark_dirty(self, property_ids: list[int]) -> None:
+        if not property_ids:
+            return
+        self._env["estate.property"].flush_model(["similar_dirty", "similar_corridor_dirty"])
+        # Сам объект и все, у кого он в соседях (может выпасть из их топа). Коридор — объекты,
+        # в чей топ он может войти, — размечает cron через expand_corridors(), вне транзакции пользователя
+        self._env.cr.execute(
+            """
+            UPDATE estate_property
+            SET similar_dirty = true, similar_corridor_dirty = true
+            WHERE id = ANY(%s)
+              AND (similar_dirty IS NOT TRUE OR similar_corridor_dirty IS NOT TRUE)
+            """,
+            [list(property_ids)],
+        )
+        self._env.cr.execute(
+            """
+            UPDATE estate_property
+            SET similar_dirty = true
+            WHERE id IN (
+                    SELECT property_id
+                    FROM estate_property_similar
+                    WHERE similar_id = ANY(%s)
+                )
+              AND similar_dirty IS NOT TRUE
+            """,
+            [list(property_ids)],
+        )
+        self._env["estate.property"].invalidate_model(["similar_dirty", "similar_corridor_dirty"], flush=False)
+
+    def expand_corridors(self, limit: int) -> int:
+        # Флаг коридора снимается в том же запросе, что читает цену и площадь: объект, который сейчас
+        # пишет пользователь, пропускается и попадёт в следующий проход уже с новыми значениями
+        self._env.cr.execute(
+            """
+            WITH changed AS (
+                UPDATE estate_property
+                SET similar_corridor_dirty = false
+                WHERE id IN (
+                    SELECT id
+                    FROM estate_property
+                    WHERE similar_corridor_dirty
+                    ORDER BY id
+                    LIMIT %(limit)s
+                    FOR UPDATE SKIP LOCKED
+                )
+                RETURNING id, city_id, property_type, price, area_total
+            ),
+            corridor AS (
+                UPDATE estate_property p
+                SET similar_dirty = true
+                WHERE p.similar_dirty IS NOT TRUE
+                  AND p.id NOT IN (SELECT id FROM changed)
+                  AND p.id IN (
+                    SELECT o.id
+                    FROM changed c
+                    JOIN estate_property o
+                      ON o.city_id = c.city_id
+                     AND o.property_type = c.property_type
+                    WHERE o.active
+                      AND o.state = ANY(%(states)s)
+                      AND (COALESCE(o.price, 0) = 0
+                           OR c.price BETWEEN o.price * (1 - %(price_tolerance)s)
+                                          AND o.price * (1 + %(price_tolerance)s))
+                      AND (COALESCE(o.area_total, 0) = 0
+                           OR c.area_total BETWEEN o.area_total * (1 - %(area_tolerance)s)
+                                               AND o.area_total * (1 + %(area_tolerance)s))
+                  )
+                RETURNING p.id
+            )
+            SELECT count(*) FROM changed
+            """,
+            {
+                "limit": limit,
+                "states": list(ACTIVE_STATES),
+                "price_tolerance": self._config.price_tolerance,
+                "area_tolerance": self._config.area_tolerance,
+            },
+        )
+        expanded = self._env.cr.fetchone()[0]
+        self._env["estate.property"].invalidate_model(["similar_dirty", "similar_corridor_dirty"], flush=False)
+        return expanded
@@ -1,3 +1,4 @@
+from .candidate_columns import CandidateColumns
 from .config import RESIDENTIAL_TYPES, ScoringConfig
 from .protocols import IProximityCalculator
 
@@ -9,25 +10,31 @@ class SimilarityScorer:
         self._config = config
         self._proximity_calculator = proximity_calculator
 
-    def score(self, prop, candidate) -> float:
+    def score_many(self, prop, candidates: CandidateColumns) -> list[float]:
         cfg = self._config
-        total = 0.0
-
-        if prop.district_id and candidate.district_id == prop.district_id:
-            total += cfg.same_district_weight
-
-        total += self._proximity_calculator.calculate(
-            prop.price, candidate.price, cfg.price_tolerance, cfg.price_weight
+        # Порядок сложения тот же, что был у поштучного score — суммы совпадают побитово
+        district_id = prop.district_id.id
+        totals = [
+            cfg.same_district_weight if district_id and candidate_district == district_id else 0.0
+            for candidate_district in candidates.district_ids
+        ]
+        price_scores = self._proximity_calculator.calculate_many(
+            prop.price, candidates.prices, cfg.price_tolerance, cfg.price_weight
         )
-        total += self._proximity_calculator.calculate(
-            prop.area_total, candidate.area_total, cfg.area_tolerance, cfg.area_weight
+        area_scores = self._proximity_calculator.calculate_many(
+            prop.area_total, candidates.areas, cfg.area_tolerance, cfg.area_weight
         )
+        totals = [total + price + area for total, price, area in zip(totals, price_scores, area_scores)]
 
         if prop.property_type in RESIDENTIAL_TYPES and prop.rooms:
-            diff = abs((candidate.rooms or 0) - prop.rooms)
-            if diff <= cfg.rooms_tolerance:
-                total += cfg.rooms_weight * (1 - diff / (cfg.rooms_tolerance + 1))
-            else:
-                total -= cfg.rooms_weight
+            totals = [
+                total + self._rooms_score(abs(rooms - prop.rooms))
+                for total, rooms in zip(totals, candidates.rooms)
+            ]
+        return totals
 
-        return total
+    def _rooms_score(self, diff: int) -> float:
+        cfg = self._config
+        if diff <= cfg.rooms_tolerance:
+            return cfg.rooms_weight * (1 - diff / (cfg.rooms_tolerance + 1))
+        return -cfg.rooms_weight
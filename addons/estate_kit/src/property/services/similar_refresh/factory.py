@@ -0,0 +1,14 @@
+from ..similar_picker import Factory as SimilarPickerFactory
+from ..similar_picker.config import DEFAULT_CONFIG
+from ..similar_picker.similar_store import SimilarStore
+from .service import SimilarRefreshService
+
+
+class Factory:
+    @staticmethod
+    def create(env) -> SimilarRefreshService:
+        return SimilarRefreshService(
+            picker=SimilarPickerFactory.create(env),
+            store=SimilarStore(env, DEFAULT_CONFIG),
+            env=env,
+        )
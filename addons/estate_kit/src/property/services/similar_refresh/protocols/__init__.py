@@ -0,0 +1,4 @@
+from .i_similar_picker import ISimilarPicker
+from .i_similar_store import ISimilarStore
+
+__all__ = ["ISimilarPicker", "ISimilarStore"]
@@ -0,0 +1,5 @@
+from typing import Protocol
+
+
+class ISimilarPicker(Protocol):
+    def compute(self, prop, limit: int = ...) -> list[int]: ...
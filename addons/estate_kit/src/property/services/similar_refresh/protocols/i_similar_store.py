@@ -0,0 +1,3 @@
+from ...similar_picker.protocols import ISimilarStore
+
+__all__ = ["ISimilarStore"]
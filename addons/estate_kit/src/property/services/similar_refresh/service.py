@@ -0,0 +1,49 @@
+import logging
+
+from ..similar_picker.config import ACTIVE_STATES, STORED_NEIGHBOURS
+from .protocols import ISimilarPicker, ISimilarStore
+
+_logger = logging.getLogger(__name__)
+
+_BATCH_SIZE = 200
+
+
+class SimilarRefreshService:
+    def __init__(self, picker: ISimilarPicker, store: ISimilarStore, env) -> None:
+        self._picker = picker
+        self._store = store
+        self._env = env
+
+    def refresh(self, full: bool = False) -> int:
+        if full:
+            self._mark_all_active()
+        while self._store.expand_corridors(_BATCH_SIZE):
+            self._env.cr.commit()
+        refreshed = 0
+        last_id = 0
+        while True:
+            property_ids = self._store.lock_dirty(last_id, _BATCH_SIZE)
+            if not property_ids:
+                break
+            last_id = property_ids[-1]
+            properties = self._env["estate.property"].sudo().browse(property_ids)
+            self._store.replace({prop.id: self._picker.compute(prop, STORED_NEIGHBOURS) for prop in properties})
+            refreshed += len(property_ids)
+            self._env.cr.commit()
+            self._env.invalidate_all()
+
+        if refreshed:
+            _logger.info("Похожие объекты пересчитаны: %d объектов%s", refreshed, " (полный)" if full else "")
+        return refreshed
+
+    def _mark_all_active(self) -> None:
+        # Полный проход ловит объекты, которые сами вошли в чужой топ: точечная разметка их не видит
+        self._env.cr.execute(
+            """
+            UPDATE estate_property
+            SET similar_dirty = true
+            WHERE active AND state = ANY(%s) AND similar_dirty IS NOT TRUE
+            """,
+            [list(ACTIVE_STATES)],
+        )
+        self._env["estate.property"].invalidate_model(["similar_dirty"])
@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class UnifiedSearchConfig:
+    local_timeout_seconds: float = 10.0
+    mls_timeout_seconds: float = 5.0
+    mls_cache_ttl_seconds: float = 30.0
+    image_strategy: str = "window"
+    image_base_url: str = ""
+
+    @classmethod
+    def from_env(cls, env: Any) -> "UnifiedSearchConfig":
+        get_param = env["ir.config_parameter"].sudo().get_param
+        return cls(
+            local_timeout_seconds=float(get_param("estate_kit.search_local_timeout_seconds", "10")),
+            mls_timeout_seconds=float(get_param("estate_kit.search_mls_timeout_seconds", "5")),
+            mls_cache_ttl_seconds=float(get_param("estate_kit.search_mls_cache_ttl_seconds", "30")),
+            image_strategy=get_param("estate_kit.search_image_strategy", "window"),
+            # Выдачу читают бот и XML-RPC-интеграции — ссылкам на фото нужен хост, а не путь от корня сайта
+            image_base_url=(
+                get_param("estate_kit.search_image_base_url") or get_param("web.base.url") or ""
+            ).rstrip("/"),
+        )
@@ -1,13 +1,29 @@
 from ....shared.services.api_client import EstateKitApiClient
+from .config import UnifiedSearchConfig
+from .local_budget import LocalBudget
 from .local_property_searcher import LocalPropertySearcher
+from .mls_fanout import MlsFanout
+from .mls_page_cache import shared_mls_page_cache
 from .mls_property_searcher import MlsPropertySearcher
+from .property_image_loader import PropertyImageLoader
+from .property_text_search import PropertyTextSearch
 from .service import UnifiedSearchService
 
 
 class Factory:
     @staticmethod
     def create(env) -> UnifiedSearchService:
+        config = UnifiedSearchConfig.from_env(env)
         api_client = EstateKitApiClient(env)
-        local_searcher = LocalPropertySearcher(env)
-        mls_searcher = MlsPropertySearcher(api_client)
-        return UnifiedSearchService(local_searcher, mls_searcher)
+        local_searcher = LocalPropertySearcher(
+            env,
+            PropertyImageLoader(env, strategy=config.image_strategy),
+            PropertyTextSearch(env),
+            config.image_base_url,
+        )
+        mls_fanout = MlsFanout(
+            MlsPropertySearcher(api_client, config.mls_timeout_seconds),
+            shared_mls_page_cache(env.cr.dbname, config.mls_cache_ttl_seconds),
+            config.mls_timeout_seconds,
+        )
+        return UnifiedSearchService(local_searcher, mls_fanout, LocalBudget(env, config.local_timeout_seconds))
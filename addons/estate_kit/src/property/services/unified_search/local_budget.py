@@ -0,0 +1,33 @@
+import logging
+from collections.abc import Callable
+from typing import TypeVar
+
+from psycopg2.errors import QueryCanceled
+
+from .source_status import SOURCE_OK, SOURCE_TIMEOUT
+
+_logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class LocalBudget:
+    def __init__(self, env, timeout_seconds: float) -> None:
+        self._env = env
+        self._timeout_ms = int(timeout_seconds * 1000)
+
+    def run(self, search: Callable[[], T], empty: T) -> tuple[T, str]:
+        if self._timeout_ms <= 0:
+            return search(), SOURCE_OK
+        cr = self._env.cr
+        try:
+            # SET LOCAL внутри savepoint: при отмене запроса откатывается вместе с ним
+            with cr.savepoint():
+                cr.execute("SET LOCAL statement_timeout = %s", [self._timeout_ms])
+                results = search()
+                cr.execute("SET LOCAL statement_timeout = DEFAULT")
+        except QueryCanceled:
+            _logger.warning("Local search exceeded %d ms, returning partial results", self._timeout_ms)
+            self._env.invalidate_all()
+            return empty, SOURCE_TIMEOUT
+        return results, SOURCE_OK
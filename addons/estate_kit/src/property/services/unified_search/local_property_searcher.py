@@ -1,8 +1,90 @@
+from datetime import datetime
+
+from .mls_property_searcher import MLS_CRITERIA_KEYS
+from .protocols import IPropertyImageLoader, IPropertyTextSearch
+
+_IMAGE_PATH = "/estate_kit/image/"
+
+_FIELDS = [
+    "id", "external_id", "property_type", "deal_type",
+    "city_id", "district_id", "street_id", "house_number",
+    "rooms", "area_total", "floor", "floors_total",
+    "price", "description", "create_date",
+]
+
+
 class LocalPropertySearcher:
-    def __init__(self, env) -> None:
+    def __init__(
+        self,
+        env,
+        image_loader: IPropertyImageLoader,
+        text_search: IPropertyTextSearch,
+        image_base_url: str,
+    ) -> None:
         self._env = env
+        self._image_loader = image_loader
+        self._text_search = text_search
+        self._image_url_prefix = image_base_url + _IMAGE_PATH
+
+    def search_local(
+        self,
+        criteria: dict,
+        limit: int,
+        offset: int,
+        after: tuple[datetime, int] | None = None,
+    ) -> list:
+        domain = self._domain(criteria)
+        text = _text(criteria)
+        if text:
+            # Курсор с текстом отклоняет сервис: keyset по дате не совпадает с порядком по релевантности
+            return self._search_ranked(domain, text, limit, offset)
+
+        order = "create_date desc"
+        if after is not None:
+            # Keyset: строго после последней выданной пары (create_date, id) — глубина страницы не важна
+            created_at, last_id = after
+            domain += [
+                "|",
+                ("create_date", "<", created_at),
+                "&", ("create_date", "=", created_at), ("id", "<", last_id),
+            ]
+            order = "create_date desc, id desc"
+            offset = 0
+
+        records = self._env["estate.property"].search_read(
+            domain, fields=_FIELDS, limit=limit, offset=offset, order=order,
+        )
+        return self._to_results(records)
+
+    def count_local(self, criteria: dict) -> int:
+        text = _text(criteria)
+        if text:
+            return self._text_search.count(self._domain(criteria), text)
+        return self._env["estate.property"].search_count(self._domain(criteria))
 
-    def search_local(self, criteria: dict, limit: int, offset: int) -> list:
+    def count_synced(self, criteria: dict) -> int:
+        # Вычитается из total MLS, поэтому фильтры — ровно те, что MLS применил к своему total
+        mls_criteria = {key: criteria[key] for key in MLS_CRITERIA_KEYS if criteria.get(key)}
+        return self._env["estate.property"].search_count(self._domain(mls_criteria) + [("external_id", "!=", 0)])
+
+    def existing_mls_ids(self, mls_ids: list[int]) -> set[int]:
+        if not mls_ids:
+            return set()
+        records = self._env["estate.property"].search_read(
+            [("active", "=", True), ("external_id", "in", mls_ids)], ["external_id"],
+        )
+        return {rec["external_id"] for rec in records}
+
+    def _search_ranked(self, domain: list, text: str, limit: int, offset: int) -> list:
+        page_ids = self._text_search.search(domain, text, limit, offset)
+        records = {
+            rec["id"]: rec
+            for rec in self._env["estate.property"].search_read([("id", "in", page_ids)], fields=_FIELDS)
+        }
+        return self._to_results([records[record_id] for record_id in page_ids if record_id in records])
+
+    @staticmethod
+    def _domain(criteria: dict) -> list:
         domain = [("active", "=", True)]
 
         if criteria.get("deal_type"):
@@ -28,18 +110,10 @@ class LocalPropertySearcher:
         if criteria.get("floor_max"):
             domain.append(("floor", "<=", criteria["floor_max"]))
 
-        records = self._env["estate.property"].search_read(
-            domain,
-            fields=[
-                "id", "external_id", "property_type", "deal_type",
-                "city_id", "district_id", "street_id", "house_number",
-                "rooms", "area_total", "floor", "floors_total",
-                "price", "description", "create_date",
-            ],
-            limit=limit,
-            offset=offset,
-            order="create_date desc",
-        )
+        return domain
+
+    def _to_results(self, records: list[dict]) -> list:
+        images_by_property = self._image_loader.load([rec["id"] for rec in records])
 
         results = []
         for rec in records:
@@ -48,18 +122,11 @@ class LocalPropertySearcher:
             street_name = rec["street_id"][1] if rec.get("street_id") else ""
             address_parts = [p for p in [city_name, district_name, street_name, rec.get("house_number") or ""] if p]
 
-            photo_urls = []
+            images = images_by_property.get(rec["id"], [])
+            photo_urls = [self._image_url_prefix + image_key for image_key, _ in images]
             thumbnail_url = ""
-            images = self._env["estate.property.image"].search_read(
-                [("property_id", "=", rec["id"])],
-                fields=["image_url"],
-                limit=10,
-            )
-            for img in images:
-                if img.get("image_url"):
-                    photo_urls.append(img["image_url"])
-            if photo_urls:
-                thumbnail_url = photo_urls[0]
+            if images:
+                thumbnail_url = self._image_url_prefix + (images[0][1] or images[0][0])
 
             results.append({
                 "id": rec["id"],
@@ -82,3 +149,7 @@ class LocalPropertySearcher:
             })
 
         return results
+
+
+def _text(criteria: dict) -> str:
+    return (criteria.get("text") or "").strip()
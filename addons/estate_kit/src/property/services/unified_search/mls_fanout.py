@@ -0,0 +1,58 @@
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from .protocols import IMlsPageCache, IMlsPropertySearcher, MlsPage
+from .protocols.i_mls_page_cache import MlsPageKey
+from .source_status import SOURCE_DISABLED, SOURCE_ERROR, SOURCE_OK, SOURCE_TIMEOUT
+
+_logger = logging.getLogger(__name__)
+
+# Общий пул на процесс: запрос, не уложившийся в бюджет, дорабатывает в фоне и не держит поиск
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="estate_kit_mls")
+
+
+class PendingMlsPage:
+    def __init__(self, future: Future | None, page: MlsPage, status: str, deadline: float) -> None:
+        self._future = future
+        self._page = page
+        self._status = status
+        self._deadline = deadline
+
+    def wait(self) -> tuple[MlsPage, str]:
+        if self._future is None:
+            return self._page, self._status
+        try:
+            return self._future.result(timeout=max(self._deadline - time.monotonic(), 0)), SOURCE_OK
+        except FutureTimeoutError:
+            # Ещё не начатый запрос снимаем с очереди, чтобы он не занимал поток пула зря
+            self._future.cancel()
+            _logger.warning("MLS search exceeded latency budget, returning partial results")
+            return MlsPage(), SOURCE_TIMEOUT
+        except Exception:
+            _logger.warning("MLS search failed, returning partial results", exc_info=True)
+            return MlsPage(), SOURCE_ERROR
+
+
+class MlsFanout:
+    def __init__(self, searcher: IMlsPropertySearcher, cache: IMlsPageCache, timeout_seconds: float) -> None:
+        self._searcher = searcher
+        self._cache = cache
+        self._timeout_seconds = timeout_seconds
+
+    def start(self, criteria: dict, limit: int, offset: int) -> PendingMlsPage:
+        deadline = time.monotonic() + self._timeout_seconds
+        if not self._searcher.is_enabled or not self._searcher.supports(criteria):
+            return PendingMlsPage(None, MlsPage(), SOURCE_DISABLED, deadline)
+        key = self._cache.key(criteria, limit, offset)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return PendingMlsPage(None, cached, SOURCE_OK, deadline)
+        future = _EXECUTOR.submit(self._fetch, key, criteria, limit, offset)
+        return PendingMlsPage(future, MlsPage(), SOURCE_OK, deadline)
+
+    def _fetch(self, key: MlsPageKey, criteria: dict, limit: int, offset: int) -> MlsPage:
+        page = self._searcher.search_mls(criteria, limit, offset)
+        self._cache.put(key, page)
+        return page
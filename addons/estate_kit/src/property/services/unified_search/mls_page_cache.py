@@ -0,0 +1,56 @@
+import json
+import threading
+import time
+
+from .protocols.i_mls_page_cache import MlsPageKey
+from .protocols.i_mls_property_searcher import MlsPage
+
+
+class MlsPageCache:
+    def __init__(self, ttl_seconds: float) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._entries: dict[MlsPageKey, tuple[float, MlsPage]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def ttl_seconds(self) -> float:
+        return self._ttl_seconds
+
+    @staticmethod
+    def key(criteria: dict, limit: int, offset: int) -> MlsPageKey:
+        return json.dumps(criteria, sort_keys=True, default=str), limit, offset
+
+    def get(self, key: MlsPageKey) -> MlsPage | None:
+        if self._ttl_seconds <= 0:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return None
+            return entry[1]
+
+    def put(self, key: MlsPageKey, page: MlsPage) -> None:
+        if self._ttl_seconds <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            # Страниц немного и живут они секунды — чистим просроченные при записи
+            for stale in [k for k, (expires_at, _) in self._entries.items() if expires_at < now]:
+                del self._entries[stale]
+            self._entries[key] = (now + self._ttl_seconds, page)
+
+
+_caches: dict[str, MlsPageCache] = {}
+_caches_lock = threading.Lock()
+
+
+def shared_mls_page_cache(dbname: str, ttl_seconds: float) -> MlsPageCache:
+    with _caches_lock:
+        cache = _caches.get(dbname)
+        if cache is None or cache.ttl_seconds != ttl_seconds:
+            cache = MlsPageCache(ttl_seconds)
+            _caches[dbname] = cache
+        return cache
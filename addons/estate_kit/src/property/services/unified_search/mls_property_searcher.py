@@ -1,9 +1,5 @@
-import logging
-
 from ....shared.services.api_mapper.importer import API_DEAL_TYPE_MAP, API_PROPERTY_TYPE_MAP
-from .protocols import IApiClient
-
-_logger = logging.getLogger(__name__)
+from .protocols import IApiClient, MlsPage
 
 _PROPERTY_TYPE_TO_API_ID = {v: k for k, v in {
     1: "apartment", 2: "house", 3: "townhouse", 4: "commercial", 5: "land",
@@ -12,16 +8,35 @@ _DEAL_TYPE_TO_API_ID = {v: k for k, v in {
     1: "sale", 2: "rent_long", 3: "rent_daily",
 }.items()}
 
+# Критерии, которые MLS API умеет фильтровать; остальные (комнаты, площадь, этаж, район) — только локально
+MLS_CRITERIA_KEYS = ("property_type", "deal_type", "city_id", "min_price", "max_price")
+
+# Слияние с локальной выдачей и курсор рассчитаны на ленту по убыванию created_at
+_MLS_SORT = "-created_at"
+
+
+class MlsUnavailableError(Exception):
+    pass
+
 
 class MlsPropertySearcher:
-    def __init__(self, api_client: IApiClient) -> None:
+    def __init__(self, api_client: IApiClient, timeout_seconds: float) -> None:
         self._api_client = api_client
+        self._timeout_seconds = timeout_seconds
 
-    def search_mls(self, criteria: dict, limit: int, offset: int) -> list:
+    @property
+    def is_enabled(self) -> bool:
+        return self._api_client.is_configured
+
+    def supports(self, criteria: dict) -> bool:
+        # Полнотекстового поиска в MLS API нет — без фильтра выдача была бы нерелевантной
+        return not criteria.get("text")
+
+    def search_mls(self, criteria: dict, limit: int, offset: int) -> MlsPage:
         if not self._api_client.is_configured:
-            return []
+            return MlsPage()
 
-        params: dict = {"limit": limit, "offset": offset}
+        params: dict = {"limit": limit, "offset": offset, "sort": _MLS_SORT}
         if criteria.get("property_type"):
             api_id = _PROPERTY_TYPE_TO_API_ID.get(criteria["property_type"])
             if api_id:
@@ -37,14 +52,14 @@ class MlsPropertySearcher:
         if criteria.get("max_price"):
             params["max_price"] = criteria["max_price"]
 
-        try:
-            data = self._api_client.get("/mls/properties", params=params)
-        except Exception:
-            _logger.warning("MLS API unavailable, returning empty MLS results", exc_info=True)
-            return []
-
-        if not data or not isinstance(data, dict):
-            return []
+        # Интерактивный поиск: один запрос в пределах бюджета, без повторов — брошенный вызов не держит пул
+        data = self._api_client.get(
+            "/mls/properties", params=params, timeout=self._timeout_seconds, max_retries=1,
+        )
+        if data is None:
+            raise MlsUnavailableError("MLS API unavailable")
+        if not isinstance(data, dict):
+            return MlsPage()
 
         items = data.get("items", [])
         results = []
@@ -78,4 +93,11 @@ class MlsPropertySearcher:
                 "created_at": item.get("created_at") or "",
             })
 
-        return results
+        return MlsPage(items=results, total=_parse_total(data.get("total")))
+
+
+def _parse_total(value) -> int | None:
+    try:
+        return max(int(value), 0)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,94 @@
+import base64
+import binascii
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from odoo.exceptions import UserError
+
+# Ключ сортировки выдачи: (created_at в naive UTC, id) — по убыванию
+SortKey = tuple[datetime, int]
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def normalize_created_at(value) -> datetime:
+    if isinstance(value, datetime):
+        created_at = value
+    elif value:
+        try:
+            created_at = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            return _EPOCH
+    else:
+        return _EPOCH
+    if created_at.tzinfo is not None:
+        created_at = created_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return created_at
+
+
+def criteria_digest(criteria: dict) -> str:
+    payload = json.dumps(criteria, sort_keys=True, default=str).encode()
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    criteria_digest: str
+    local_after: SortKey | None = None
+    local_done: bool = False
+    mls_after: SortKey | None = None
+    mls_offset: int = 0
+    mls_done: bool = False
+
+    @property
+    def exhausted(self) -> bool:
+        return self.local_done and self.mls_done
+
+    def encode(self) -> str:
+        payload = {
+            "q": self.criteria_digest,
+            "l": _dump_key(self.local_after),
+            "ld": int(self.local_done),
+            "m": _dump_key(self.mls_after),
+            "mo": self.mls_offset,
+            "md": int(self.mls_done),
+        }
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+    @classmethod
+    def decode(cls, token: str, criteria: dict) -> "PageCursor":
+        digest = criteria_digest(criteria)
+        if not token:
+            return cls(criteria_digest=digest)
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            payload = json.loads(raw)
+            cursor = cls(
+                criteria_digest=payload["q"],
+                local_after=_load_key(payload.get("l")),
+                local_done=bool(payload.get("ld")),
+                mls_after=_load_key(payload.get("m")),
+                mls_offset=max(int(payload.get("mo") or 0), 0),
+                mls_done=bool(payload.get("md")),
+            )
+        except (binascii.Error, ValueError, TypeError, KeyError, AttributeError) as exc:
+            raise UserError("Некорректный курсор пагинации") from exc
+        if cursor.criteria_digest != digest:
+            raise UserError("Курсор пагинации выдан для других условий поиска")
+        return cursor
+
+
+def _dump_key(key: SortKey | None) -> list | None:
+    if key is None:
+        return None
+    return [key[0].isoformat(), key[1]]
+
+
+def _load_key(value) -> SortKey | None:
+    if value is None:
+        return None
+    created_at, record_id = value
+    return datetime.fromisoformat(created_at), int(record_id)
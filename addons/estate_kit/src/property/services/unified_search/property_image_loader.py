@@ -0,0 +1,46 @@
+from collections import defaultdict
+
+_ORDER = "is_main IS TRUE DESC, sequence, id"
+
+_FILTER = "image_key IS NOT NULL AND image_key != '' AND COALESCE(media_type, 'image') = 'image'"
+
+_WINDOW_QUERY = f"""
+    SELECT property_id, image_key, thumbnail_key
+    FROM (
+        SELECT property_id, image_key, thumbnail_key,
+               row_number() OVER (PARTITION BY property_id ORDER BY {_ORDER}) AS position
+        FROM estate_property_image
+        WHERE property_id = ANY(%s) AND {_FILTER}
+    ) ranked
+    WHERE position <= %s
+    ORDER BY property_id, position
+"""
+
+_LATERAL_QUERY = f"""
+    SELECT p.id, i.image_key, i.thumbnail_key
+    FROM unnest(%s::int[]) AS p(id)
+    CROSS JOIN LATERAL (
+        SELECT image_key, thumbnail_key
+        FROM estate_property_image
+        WHERE property_id = p.id AND {_FILTER}
+        ORDER BY {_ORDER}
+        LIMIT %s
+    ) i
+"""
+
+
+class PropertyImageLoader:
+    def __init__(self, env, per_property: int = 10, strategy: str = "window") -> None:
+        self._env = env
+        self._per_property = per_property
+        # window — один проход по индексу property_id; lateral — выгоднее, когда у объектов сотни фото
+        self._query = _LATERAL_QUERY if strategy == "lateral" else _WINDOW_QUERY
+
+    def load(self, property_ids: list[int]) -> dict[int, list[tuple[str, str | None]]]:
+        if not property_ids:
+            return {}
+        self._env.cr.execute(self._query, [list(property_ids), self._per_property])
+        images: dict[int, list[tuple[str, str | None]]] = defaultdict(list)
+        for property_id, image_key, thumbnail_key in self._env.cr.fetchall():
+            images[property_id].append((image_key, thumbnail_key))
+        return images
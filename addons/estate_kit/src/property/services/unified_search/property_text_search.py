@@ -0,0 +1,57 @@
+from odoo.tools import SQL
+
+# Выражения должны совпадать с индексами из estate.property.init() символ в символ — иначе планировщик их не возьмёт
+TEXT_DOCUMENT_SQL = (
+    "to_tsvector('russian'::regconfig, "
+    "coalesce(name, '') || ' ' || coalesce(geo_address, '') || ' ' || coalesce(description, ''))"
+)
+TRIGRAM_DOCUMENT_SQL = "(coalesce(name, '') || ' ' || coalesce(geo_address, ''))"
+
+
+class PropertyTextSearch:
+    def __init__(self, env) -> None:
+        self._env = env
+
+    def search(self, domain: list, text: str, limit: int, offset: int) -> list[int]:
+        # Фильтры домена, релевантность и страница — одним запросом: ORDER BY по рангу и LIMIT делает Postgres
+        rank, match = self._rank_and_match(text)
+        rows = self._execute(SQL(
+            """
+            SELECT id
+            FROM estate_property, websearch_to_tsquery('russian', %s) query
+            WHERE active AND id IN %s AND %s
+            ORDER BY %s DESC, id DESC
+            LIMIT %s OFFSET %s
+            """,
+            text, self._subselect(domain), match, rank, limit, offset,
+        ))
+        return [row[0] for row in rows]
+
+    def count(self, domain: list, text: str) -> int:
+        _, match = self._rank_and_match(text)
+        rows = self._execute(SQL(
+            """
+            SELECT count(*)
+            FROM estate_property, websearch_to_tsquery('russian', %s) query
+            WHERE active AND id IN %s AND %s
+            """,
+            text, self._subselect(domain), match,
+        ))
+        return rows[0][0]
+
+    def _rank_and_match(self, text: str) -> tuple[SQL, SQL]:
+        if self._env.registry.has_trigram:
+            # Триграммы ловят опечатки и части слов в названии и адресе, tsvector — словоформы в описании
+            return (
+                SQL(f"ts_rank_cd({TEXT_DOCUMENT_SQL}, query) + word_similarity(%s, {TRIGRAM_DOCUMENT_SQL})", text),
+                SQL(f"({TEXT_DOCUMENT_SQL} @@ query OR %s <%% {TRIGRAM_DOCUMENT_SQL})", text),
+            )
+        return SQL(f"ts_rank_cd({TEXT_DOCUMENT_SQL}, query)"), SQL(f"{TEXT_DOCUMENT_SQL} @@ query")
+
+    def _subselect(self, domain: list) -> SQL:
+        return self._env["estate.property"]._search(domain).subselect()
+
+    def _execute(self, query: SQL) -> list[tuple]:
+        self._env["estate.property"].flush_model(["name", "geo_address", "description", "active"])
+        # execute_query сбрасывает и поля из домена подзапроса
+        return self._env.execute_query(query)
@@ -1,5 +1,21 @@
 from .i_api_client import IApiClient
+from .i_local_budget import ILocalBudget
 from .i_local_property_searcher import ILocalPropertySearcher
-from .i_mls_property_searcher import IMlsPropertySearcher
+from .i_mls_fanout import IMlsFanout, IPendingMlsPage
+from .i_mls_page_cache import IMlsPageCache
+from .i_mls_property_searcher import IMlsPropertySearcher, MlsPage
+from .i_property_image_loader import IPropertyImageLoader
+from .i_property_text_search import IPropertyTextSearch
 
-__all__ = ["IApiClient", "ILocalPropertySearcher", "IMlsPropertySearcher"]
+__all__ = [
+    "IApiClient",
+    "ILocalBudget",
+    "ILocalPropertySearcher",
+    "IMlsFanout",
+    "IMlsPageCache",
+    "IMlsPropertySearcher",
+    "IPendingMlsPage",
+    "IPropertyImageLoader",
+    "IPropertyTextSearch",
+    "MlsPage",
+]
@@ -5,4 +5,10 @@ class IApiClient(Protocol):
     @property
     def is_configured(self) -> bool: ...
 
-    def get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any] | None: ...
+    def get(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        timeout: float = ...,
+        max_retries: int = ...,
+    ) -> dict[str, Any] | None: ...
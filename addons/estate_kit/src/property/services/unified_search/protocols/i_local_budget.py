@@ -0,0 +1,8 @@
+from collections.abc import Callable
+from typing import Protocol, TypeVar
+
+T = TypeVar("T")
+
+
+class ILocalBudget(Protocol):
+    def run(self, search: Callable[[], T], empty: T) -> tuple[T, str]: ...
@@ -1,5 +1,18 @@
+from datetime import datetime
 from typing import Protocol
 
 
 class ILocalPropertySearcher(Protocol):
-    def search_local(self, criteria: dict, limit: int, offset: int) -> list: ...
+    def search_local(
+        self,
+        criteria: dict,
+        limit: int,
+        offset: int,
+        after: tuple[datetime, int] | None = None,
+    ) -> list: ...
+
+    def count_local(self, criteria: dict) -> int: ...
+
+    def count_synced(self, criteria: dict) -> int: ...
+
+    def existing_mls_ids(self, mls_ids: list[int]) -> set[int]: ...
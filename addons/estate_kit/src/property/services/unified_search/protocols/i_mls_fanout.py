@@ -0,0 +1,11 @@
+from typing import Protocol
+
+from .i_mls_property_searcher import MlsPage
+
+
+class IPendingMlsPage(Protocol):
+    def wait(self) -> tuple[MlsPage, str]: ...
+
+
+class IMlsFanout(Protocol):
+    def start(self, criteria: dict, limit: int, offset: int) -> IPendingMlsPage: ...
@@ -0,0 +1,14 @@
+from typing import Protocol
+
+from .i_mls_property_searcher import MlsPage
+
+# (критерии в каноническом JSON, limit, offset)
+MlsPageKey = tuple[str, int, int]
+
+
+class IMlsPageCache(Protocol):
+    def key(self, criteria: dict, limit: int, offset: int) -> MlsPageKey: ...
+
+    def get(self, key: MlsPageKey) -> MlsPage | None: ...
+
+    def put(self, key: MlsPageKey, page: MlsPage) -> None: ...
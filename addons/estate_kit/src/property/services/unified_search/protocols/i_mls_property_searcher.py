@@ -1,5 +1,18 @@
+from dataclasses import dataclass, field
 from typing import Protocol
 
 
+@dataclass(frozen=True)
+class MlsPage:
+    items: list = field(default_factory=list)
+    # Всего объектов по фильтру на стороне MLS; None — API не вернул total
+    total: int | None = None
+
+
 class IMlsPropertySearcher(Protocol):
-    def search_mls(self, criteria: dict, limit: int, offset: int) -> list: ...
+    @property
+    def is_enabled(self) -> bool: ...
+
+    def supports(self, criteria: dict) -> bool: ...
+
+    def search_mls(self, criteria: dict, limit: int, offset: int) -> MlsPage: ...
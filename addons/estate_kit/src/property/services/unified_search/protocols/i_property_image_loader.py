@@ -0,0 +1,5 @@
+from typing import Protocol
+
+
+class IPropertyImageLoader(Protocol):
+    def load(self, property_ids: list[int]) -> dict[int, list[tuple[str, str | None]]]: ...
@@ -0,0 +1,7 @@
+from typing import Protocol
+
+
+class IPropertyTextSearch(Protocol):
+    def search(self, domain: list, text: str, limit: int, offset: int) -> list[int]: ...
+
+    def count(self, domain: list, text: str) -> int: ...
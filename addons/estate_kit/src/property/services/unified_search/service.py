@@ -1,27 +1,153 @@
-from .protocols import ILocalPropertySearcher, IMlsPropertySearcher
+from odoo.exceptions import UserError
+
+from .pagination_cursor import PageCursor, SortKey, normalize_created_at
+from .protocols import ILocalBudget, ILocalPropertySearcher, IMlsFanout, MlsPage
+from .source_status import SOURCE_DISABLED, SOURCE_OK
+
+# При равном created_at локальный объект идёт раньше MLS — порядок не зависит от страницы
+_SOURCE_RANK = {"local": 1, "mls": 0}
+
+
+def _sort_key(item: dict) -> SortKey:
+    return normalize_created_at(item.get("created_at")), item.get("id") or 0
+
+
+def _merge_key(item: dict) -> tuple:
+    created_at, record_id = _sort_key(item)
+    return created_at, _SOURCE_RANK[item["source"]], record_id
 
 
 class UnifiedSearchService:
     def __init__(
         self,
         local_searcher: ILocalPropertySearcher,
-        mls_searcher: IMlsPropertySearcher,
+        mls_fanout: IMlsFanout,
+        local_budget: ILocalBudget,
     ) -> None:
         self._local_searcher = local_searcher
-        self._mls_searcher = mls_searcher
+        self._mls_fanout = mls_fanout
+        self._local_budget = local_budget
 
-    def search_unified(self, criteria: dict, limit: int = 50, offset: int = 0, count: bool = False) -> list | int:
+    def search_unified(
+        self,
+        criteria: dict,
+        limit: int = 50,
+        offset: int = 0,
+        count: bool = False,
+        with_status: bool = False,
+        cursor: str | None = None,
+    ) -> list | int | dict:
         criteria = criteria or {}
-        local_results = self._local_searcher.search_local(criteria, limit, offset)
-        mls_results = self._mls_searcher.search_mls(criteria, limit, offset)
+        if count:
+            return self._count(criteria, with_status)
+        if cursor is not None:
+            if (criteria.get("text") or "").strip():
+                # Курсор хранит позицию по дате, а текстовая выдача упорядочена по релевантности
+                raise UserError("Текстовый поиск не поддерживает курсор — используйте offset")
+            return self._search_page(criteria, limit, PageCursor.decode(cursor, criteria))
+
+        # MLS уходит в фоновый поток сразу, локальный поиск идёт параллельно в текущем (ему нужен курсор)
+        pending_mls = self._mls_fanout.start(criteria, limit, offset)
+        local_results, local_status = self._local_budget.run(
+            lambda: self._local_searcher.search_local(criteria, limit, offset), [],
+        )
+        mls_page, mls_status = pending_mls.wait()
 
         local_mls_ids = {r["mls_id"] for r in local_results if r.get("mls_id")}
         merged = list(local_results)
-        for item in mls_results:
+        for item in mls_page.items:
             if item.get("mls_id") and item["mls_id"] not in local_mls_ids:
                 merged.append(item)
 
-        if count:
-            return len(merged)
+        result = merged[:limit]
+        if not with_status:
+            return result
+        return {
+            "items": result,
+            "sources_status": {"local": local_status, "mls": mls_status},
+        }
+
+    def _count(self, criteria: dict, with_status: bool) -> int | dict:
+        # Страница из одного объекта: от MLS нужен только total
+        pending_mls = self._mls_fanout.start(criteria, 1, 0)
+        (local_total, local_synced), local_status = self._local_budget.run(
+            lambda: (self._local_searcher.count_local(criteria), self._local_searcher.count_synced(criteria)),
+            (0, 0),
+        )
+        mls_page, mls_status = pending_mls.wait()
+        mls_total = mls_page.total if mls_page.total is not None else len(mls_page.items)
+
+        # Синхронизированные объекты MLS выдаются только как локальные: из total MLS вычитаются все,
+        # что подходят под фильтры MLS, даже если локальные критерии их отсекли
+        total = local_total + max(mls_total - local_synced, 0)
+        if not with_status:
+            return total
+        return {
+            "count": total,
+            "sources_status": {"local": local_status, "mls": mls_status},
+        }
+
+    def _search_page(self, criteria: dict, limit: int, cursor: PageCursor) -> dict:
+        pending_mls = None if cursor.mls_done else self._mls_fanout.start(criteria, limit, cursor.mls_offset)
+        local_results, local_status = [], SOURCE_OK
+        if not cursor.local_done:
+            local_results, local_status = self._local_budget.run(
+                lambda: self._local_searcher.search_local(criteria, limit, 0, after=cursor.local_after), [],
+            )
+        mls_page, mls_status = pending_mls.wait() if pending_mls else (MlsPage(), SOURCE_OK)
+
+        # Курсор и слияние опираются на порядок по убыванию (created_at, id); буфер MLS упорядочиваем сами
+        mls_items = sorted(mls_page.items, key=_sort_key, reverse=True)
+        known_mls_ids = self._local_searcher.existing_mls_ids([i["mls_id"] for i in mls_items if i.get("mls_id")])
+
+        def mls_eligible(item: dict) -> bool:
+            if not item.get("mls_id") or item["mls_id"] in known_mls_ids:
+                return False
+            # MLS листается по offset: сдвиг ленты не должен повторять уже выданные объекты
+            return cursor.mls_after is None or _sort_key(item) < cursor.mls_after
+
+        # Полная страница означает, что у источника могут быть ещё объекты за пределами буфера
+        local_more = local_status == SOURCE_OK and len(local_results) == limit
+        mls_more = mls_status == SOURCE_OK and len(mls_items) == limit
+
+        items: list[dict] = []
+        local_pos = mls_pos = 0
+        local_after, mls_after = cursor.local_after, cursor.mls_after
+        while len(items) < limit:
+            while mls_pos < len(mls_items) and not mls_eligible(mls_items[mls_pos]):
+                mls_pos += 1
+            local_item = local_results[local_pos] if local_pos < len(local_results) else None
+            mls_item = mls_items[mls_pos] if mls_pos < len(mls_items) else None
+            # Буфер источника кончился раньше страницы — дальше слияние без него нарушило бы порядок
+            if (local_item is None and local_more) or (mls_item is None and mls_more):
+                break
+            if local_item is None and mls_item is None:
+                break
+            if mls_item is None or (local_item is not None and _merge_key(local_item) > _merge_key(mls_item)):
+                items.append(local_item)
+                local_after = _sort_key(local_item)
+                local_pos += 1
+            else:
+                items.append(mls_item)
+                mls_after = _sort_key(mls_item)
+                mls_pos += 1
+        while mls_pos < len(mls_items) and not mls_eligible(mls_items[mls_pos]):
+            mls_pos += 1
 
-        return merged[:limit]
+        next_cursor = PageCursor(
+            criteria_digest=cursor.criteria_digest,
+            local_after=local_after,
+            local_done=cursor.local_done or (
+                local_status == SOURCE_OK and not local_more and local_pos == len(local_results)
+            ),
+            mls_after=mls_after,
+            mls_offset=cursor.mls_offset + mls_pos,
+            mls_done=cursor.mls_done or mls_status == SOURCE_DISABLED or (
+                mls_status == SOURCE_OK and not mls_more and mls_pos == len(mls_items)
+            ),
+        )
+        return {
+            "items": items,
+            "next_cursor": None if next_cursor.exhausted else next_cursor.encode(),
+            "sources_status": {"local": local_status, "mls": mls_status},
+        }
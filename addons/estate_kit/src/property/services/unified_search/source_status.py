@@ -0,0 +1,4 @@
+SOURCE_OK = "ok"
+SOURCE_TIMEOUT = "timeout"
+SOURCE_ERROR = "error"
+SOURCE_DISABLED = "disabled"
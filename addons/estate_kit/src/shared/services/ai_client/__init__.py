@@ -1,4 +1,6 @@
+from .anthropic_batch_client import BATCH_ENDED_STATUS, BATCH_NOT_FOUND_STATUS
+from .batch_request import BatchRequest
 from .factory import Factory
-from .protocols import IAiClient
+from .protocols import IAiClient, IBatchAiClient
 
-__all__ = ["Factory", "IAiClient"]
+__all__ = ["BATCH_ENDED_STATUS", "BATCH_NOT_FOUND_STATUS", "BatchRequest", "Factory", "IAiClient", "IBatchAiClient"]
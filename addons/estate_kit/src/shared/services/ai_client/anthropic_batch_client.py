@@ -0,0 +1,156 @@
+import json
+import logging
+from typing import Any
+
+import requests
+
+from .anthropic_client import ANTHROPIC_BASE_URL, ANTHROPIC_VERSION, DEFAULT_MODEL, REQUEST_TIMEOUT
+from .batch_request import BatchRequest
+
+_logger = logging.getLogger(__name__)
+
+BATCHES_PATH = "/v1/messages/batches"
+BATCH_ENDED_STATUS = "ended"
+# Пакет удалён или истёк срок хранения — ждать его дальше бессмысленно
+BATCH_NOT_FOUND_STATUS = "not_found"
+
+
+class AnthropicBatchClient:
+    def __init__(self, env: Any):
+        config = env["ir.config_parameter"].sudo()
+        self.api_key = config.get_param("estate_kit.anthropic_api_key") or ""
+        self.model = config.get_param("estate_kit.anthropic_model") or DEFAULT_MODEL
+        base_url = config.get_param("estate_kit.anthropic_base_url") or ANTHROPIC_BASE_URL
+        self._batches_url = base_url.rstrip("/") + BATCHES_PATH
+
+    @property
+    def is_configured(self) -> bool:
+        return bool(self.api_key)
+
+    def create_batch(self, batch_requests: list[BatchRequest]) -> str | None:
+        if not self.is_configured:
+            _logger.warning("Anthropic API key is not configured")
+            return None
+        if not batch_requests:
+            return None
+
+        payload = {
+            "requests": [
+                {
+                    "custom_id": request.custom_id,
+                    "params": {
+                        "model": self.model,
+                        "max_tokens": 1024,
+                        "messages": [
+                            {"role": "user", "content": request.user},
+                        ],
+                        "system": request.system,
+                    },
+                }
+                for request in batch_requests
+            ],
+        }
+        data = self._request("post", self._batches_url, json=payload)
+        if data is None:
+            return None
+        batch_id = data.get("id")
+        if not batch_id:
+            _logger.error("Anthropic batch response has no id: %s", str(data)[:500])
+            return None
+        return batch_id
+
+    def get_status(self, batch_id: str) -> str | None:
+        response = self._send("get", "%s/%s" % (self._batches_url, batch_id))
+        if response is None:
+            return None
+        if response.status_code == 404:
+            _logger.error("Anthropic batch %s not found", batch_id)
+            return BATCH_NOT_FOUND_STATUS
+        data = self._parse(response)
+        if data is None:
+            return None
+        return data.get("processing_status")
+
+    def get_results(self, batch_id: str) -> dict[str, str | None] | None:
+        data = self._request("get", "%s/%s" % (self._batches_url, batch_id))
+        if data is None:
+            return None
+        if data.get("processing_status") != BATCH_ENDED_STATUS:
+            return None
+        results_url = data.get("results_url") or "%s/%s/results" % (self._batches_url, batch_id)
+
+        try:
+            response = requests.get(results_url, headers=self._headers(), timeout=REQUEST_TIMEOUT)
+        except requests.RequestException as exc:
+            _logger.error("Anthropic batch results request failed: %s", exc)
+            return None
+        if response.status_code != 200:
+            _logger.error(
+                "Anthropic batch results returned %d: %s",
+                response.status_code,
+                response.text[:500],
+            )
+            return None
+
+        results: dict[str, str | None] = {}
+        for line in response.text.splitlines():
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                _logger.error("Malformed Anthropic batch result line: %s", line[:200])
+                continue
+            custom_id = entry.get("custom_id")
+            if not custom_id:
+                continue
+            results[custom_id] = _extract_text(entry.get("result") or {})
+        return results
+
+    def _request(self, method: str, url: str, **kwargs) -> dict | None:
+        response = self._send(method, url, **kwargs)
+        if response is None:
+            return None
+        return self._parse(response)
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response | None:
+        try:
+            return requests.request(
+                method, url, headers=self._headers(), timeout=REQUEST_TIMEOUT, **kwargs,
+            )
+        except requests.RequestException as exc:
+            _logger.error("Anthropic batch request failed: %s", exc)
+            return None
+
+    def _parse(self, response: requests.Response) -> dict | None:
+        if response.status_code != 200:
+            _logger.error(
+                "Anthropic batch API returned %d: %s",
+                response.status_code,
+                response.text[:500],
+            )
+            return None
+
+        try:
+            return response.json()
+        except ValueError as exc:
+            _logger.error("Unexpected Anthropic batch API response format: %s", exc)
+            return None
+
+    def _headers(self) -> dict[str, str]:
+        return {
+            "x-api-key": self.api_key,
+            "anthropic-version": ANTHROPIC_VERSION,
+            "content-type": "application/json",
+        }
+
+
+def _extract_text(result: dict) -> str | None:
+    if result.get("type") != "succeeded":
+        _logger.warning("Anthropic batch item not succeeded: %s", result.get("type"))
+        return None
+    try:
+        return result["message"]["content"][0]["text"]
+    except (KeyError, IndexError, TypeError) as exc:
+        _logger.error("Unexpected Anthropic batch item format: %s", exc)
+        return None
@@ -3,19 +3,26 @@ from typing import Any
 
 import requests
 
+from .protocols import IRateLimiter
+
 _logger = logging.getLogger(__name__)
 
-ANTHROPIC_API_URL = "https://api.anthropic.com/v1/messages"
+ANTHROPIC_BASE_URL = "https://api.anthropic.com"
+MESSAGES_PATH = "/v1/messages"
 ANTHROPIC_VERSION = "2023-06-01"
 DEFAULT_MODEL = "claude-sonnet-4-5-20250514"
 REQUEST_TIMEOUT = 60
+RATE_LIMIT_RETRIES = 3
 
 
 class AnthropicClient:
-    def __init__(self, env: Any):
+    def __init__(self, env: Any, rate_limiter: IRateLimiter | None = None):
         config = env["ir.config_parameter"].sudo()
         self.api_key = config.get_param("estate_kit.anthropic_api_key") or ""
         self.model = config.get_param("estate_kit.anthropic_model") or DEFAULT_MODEL
+        base_url = config.get_param("estate_kit.anthropic_base_url") or ANTHROPIC_BASE_URL
+        self._messages_url = base_url.rstrip("/") + MESSAGES_PATH
+        self._rate_limiter = rate_limiter
 
     @property
     def is_configured(self) -> bool:
@@ -26,27 +33,36 @@ class AnthropicClient:
             _logger.warning("Anthropic API key is not configured")
             return None
 
-        try:
-            response = requests.post(
-                ANTHROPIC_API_URL,
-                headers={
-                    "x-api-key": self.api_key,
-                    "anthropic-version": ANTHROPIC_VERSION,
-                    "content-type": "application/json",
-                },
-                json={
-                    "model": self.model,
-                    "max_tokens": 1024,
-                    "messages": [
-                        {"role": "user", "content": user},
-                    ],
-                    "system": system,
-                },
-                timeout=REQUEST_TIMEOUT,
-            )
-        except requests.RequestException as exc:
-            _logger.error("Anthropic API request failed: %s", exc)
-            return None
+        for _attempt in range(RATE_LIMIT_RETRIES + 1):
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire()
+            try:
+                response = requests.post(
+                    self._messages_url,
+                    headers={
+                        "x-api-key": self.api_key,
+                        "anthropic-version": ANTHROPIC_VERSION,
+                        "content-type": "application/json",
+                    },
+                    json={
+                        "model": self.model,
+                        "max_tokens": 1024,
+                        "messages": [
+                            {"role": "user", "content": user},
+                        ],
+                        "system": system,
+                    },
+                    timeout=REQUEST_TIMEOUT,
+                )
+            except requests.RequestException as exc:
+                _logger.error("Anthropic API request failed: %s", exc)
+                return None
+
+            if self._rate_limiter is not None:
+                self._rate_limiter.observe(response.status_code, response.headers)
+            if response.status_code != 429 or self._rate_limiter is None:
+                break
+            _logger.warning("Anthropic API rate limit hit, waiting before retry")
 
         if response.status_code != 200:
             _logger.error(
@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class BatchRequest:
+    custom_id: str
+    system: str
+    user: str
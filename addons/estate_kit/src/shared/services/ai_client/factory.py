@@ -1,7 +1,16 @@
+from .anthropic_batch_client import AnthropicBatchClient
 from .anthropic_client import AnthropicClient
+from .rate_limiter import shared_rate_limiter
 
 
 class Factory:
     @staticmethod
     def create(env) -> AnthropicClient:
-        return AnthropicClient(env)
+        get_param = env["ir.config_parameter"].sudo().get_param
+        api_key = get_param("estate_kit.anthropic_api_key") or ""
+        requests_per_minute = int(get_param("estate_kit.anthropic_requests_per_minute", "50") or 50)
+        return AnthropicClient(env, shared_rate_limiter(api_key, requests_per_minute))
+
+    @staticmethod
+    def create_batch(env) -> AnthropicBatchClient:
+        return AnthropicBatchClient(env)
@@ -1,3 +1,5 @@
 from .i_ai_client import IAiClient
+from .i_batch_ai_client import IBatchAiClient
+from .i_rate_limiter import IRateLimiter
 
-__all__ = ["IAiClient"]
+__all__ = ["IAiClient", "IBatchAiClient", "IRateLimiter"]
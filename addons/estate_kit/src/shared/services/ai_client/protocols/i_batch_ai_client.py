@@ -0,0 +1,14 @@
+from typing import Protocol
+
+from ..batch_request import BatchRequest
+
+
+class IBatchAiClient(Protocol):
+    @property
+    def is_configured(self) -> bool: ...
+
+    def create_batch(self, batch_requests: list[BatchRequest]) -> str | None: ...
+
+    def get_status(self, batch_id: str) -> str | None: ...
+
+    def get_results(self, batch_id: str) -> dict[str, str | None] | None: ...
@@ -0,0 +1,7 @@
+from typing import Mapping, Protocol
+
+
+class IRateLimiter(Protocol):
+    def acquire(self) -> None: ...
+
+    def observe(self, status_code: int, headers: Mapping[str, str]) -> None: ...
@@ -0,0 +1,86 @@
+import threading
+import time
+from datetime import datetime
+from typing import Mapping
+
+_REQUESTS_REMAINING_HEADER = "anthropic-ratelimit-requests-remaining"
+_REQUESTS_RESET_HEADER = "anthropic-ratelimit-requests-reset"
+_RETRY_AFTER_HEADER = "retry-after"
+
+
+class TokenBucketRateLimiter:
+    def __init__(self, requests_per_minute: int) -> None:
+        self._capacity = float(max(requests_per_minute, 1))
+        self._refill_per_second = self._capacity / 60.0
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self._blocked_until and self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = max(
+                    self._blocked_until - now,
+                    (1.0 - self._tokens) / self._refill_per_second,
+                )
+            time.sleep(max(wait, 0.05))
+
+    def observe(self, status_code: int, headers: Mapping[str, str]) -> None:
+        with self._lock:
+            now = time.monotonic()
+            remaining = _parse_int(headers.get(_REQUESTS_REMAINING_HEADER))
+            if remaining is not None:
+                self._tokens = min(self._tokens, float(remaining))
+                if remaining == 0:
+                    reset_in = _seconds_until(headers.get(_REQUESTS_RESET_HEADER))
+                    if reset_in is not None:
+                        self._block(now + reset_in)
+            if status_code == 429:
+                retry_after = _parse_int(headers.get(_RETRY_AFTER_HEADER))
+                self._tokens = 0.0
+                self._block(now + (retry_after if retry_after is not None else 60))
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._refill_per_second)
+        self._updated_at = now
+
+    def _block(self, until: float) -> None:
+        self._blocked_until = max(self._blocked_until, until)
+
+
+_limiters: dict[tuple[str, int], TokenBucketRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def shared_rate_limiter(api_key: str, requests_per_minute: int) -> TokenBucketRateLimiter:
+    key = (api_key, requests_per_minute)
+    with _limiters_lock:
+        if key not in _limiters:
+            _limiters[key] = TokenBucketRateLimiter(requests_per_minute)
+        return _limiters[key]
+
+
+def _parse_int(value: str | None) -> int | None:
+    if value is None:
+        return None
+    try:
+        return int(float(value))
+    except ValueError:
+        return None
+
+
+def _seconds_until(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        reset_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return max((reset_at - datetime.now(reset_at.tzinfo)).total_seconds(), 0.0)
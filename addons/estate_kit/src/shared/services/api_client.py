@@ -36,22 +36,23 @@ class EstateKitApiClient:
         self,
         method: str,
         url: str,
+        max_retries: int = MAX_RETRIES,
         **kwargs: Any,
     ) -> requests.Response | None:
         kwargs.setdefault("timeout", REQUEST_TIMEOUT)
         last_exception: Exception | None = None
 
-        for attempt in range(1, MAX_RETRIES + 1):
+        for attempt in range(1, max_retries + 1):
             try:
-                _logger.info("API %s %s (attempt %d/%d)", method.upper(), url, attempt, MAX_RETRIES)
+                _logger.info("API %s %s (attempt %d/%d)", method.upper(), url, attempt, max_retries)
                 response = requests.request(method, url, **kwargs)
 
                 if response.status_code in RETRYABLE_STATUS_CODES:
                     _logger.warning(
                         "API %s %s returned %d (attempt %d/%d)",
-                        method.upper(), url, response.status_code, attempt, MAX_RETRIES,
+                        method.upper(), url, response.status_code, attempt, max_retries,
                     )
-                    if attempt < MAX_RETRIES:
+                    if attempt < max_retries:
                         delay = RETRY_BASE_DELAY * (2 ** (attempt - 1))
                         time.sleep(delay)
                         continue
@@ -61,9 +62,9 @@ class EstateKitApiClient:
                 last_exception = exc
                 _logger.warning(
                     "API %s %s failed (attempt %d/%d): %s",
-                    method.upper(), url, attempt, MAX_RETRIES, exc,
+                    method.upper(), url, attempt, max_retries, exc,
                 )
-                if attempt < MAX_RETRIES:
+                if attempt < max_retries:
                     delay = RETRY_BASE_DELAY * (2 ** (attempt - 1))
                     time.sleep(delay)
                     continue
@@ -74,7 +75,7 @@ class EstateKitApiClient:
 
         _logger.error(
             "API %s %s failed after %d attempts: %s",
-            method.upper(), url, MAX_RETRIES, last_exception,
+            method.upper(), url, max_retries, last_exception,
         )
         return None
 
@@ -105,9 +106,15 @@ class EstateKitApiClient:
 
         return response.json()
 
-    def get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any] | None:
+    def get(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        timeout: float = REQUEST_TIMEOUT,
+        max_retries: int = MAX_RETRIES,
+    ) -> dict[str, Any] | None:
         url = self._build_url(endpoint)
-        return self._request_with_retry("GET", url, params=params)
+        return self._request_with_retry("GET", url, params=params, timeout=timeout, max_retries=max_retries)
 
     def post(self, endpoint: str, data: dict[str, Any]) -> dict[str, Any] | None:
         url = self._build_url(endpoint)
@@ -0,0 +1 @@
+from . import test_benchmark_percentiles, test_scoring_batch, test_similar_ranker, test_slice_crawler
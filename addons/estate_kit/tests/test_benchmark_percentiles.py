@@ -0,0 +1,81 @@
+import random
+from unittest.mock import patch
+
+from odoo.addons.estate_kit.src.market_snapshot.services.benchmark_resolver.benchmark_materializer import (
+    BenchmarkMaterializer,
+)
+from odoo.addons.estate_kit.src.market_snapshot.services.benchmark_resolver.config import BenchmarkResolverConfig
+from odoo.addons.estate_kit.src.market_snapshot.services.benchmark_resolver.factory import Factory
+from odoo.addons.estate_kit.src.market_snapshot.services.benchmark_resolver.sample_aggregator import SampleAggregator
+from odoo.addons.estate_kit.src.market_snapshot.services.benchmark_resolver.snapshot_lookup import SnapshotLookup
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged("post_install", "-at_install")
+class TestBenchmarkPercentiles(TransactionCase):
+    def _summarize(self, groups: list[list[float]]):
+        city = self.env["estate.city"].create({"name": "Тестовый город"})
+        for samples in groups:
+            snapshot = self.env["estate.market.snapshot"].create({
+                "city_id": city.id,
+                "property_type": "apartment",
+                "rooms": 0,
+                "sample_size": len(samples),
+                "median_price_per_sqm": 1,
+                "p25_price_per_sqm": 1,
+                "p75_price_per_sqm": 1,
+            })
+            snapshot.flush_recordset()
+            self.env.cr.execute(
+                "UPDATE estate_market_snapshot SET samples_per_sqm = %s WHERE id = %s",
+                [samples, snapshot.id],
+            )
+        return SnapshotLookup(self.env).summarize_recent_samples(
+            city_id=city.id,
+            district_id=None,
+            property_type="apartment",
+            rooms=None,
+            max_age_days=30,
+            limit=10,
+        )
+
+    def _assert_sql_matches_python(self, groups: list[list[float]]):
+        summary = self._summarize(groups)
+        expected = SampleAggregator(min_sample_size=1).aggregate(groups)
+        self.assertIsNotNone(summary)
+        self.assertEqual(summary.stats, expected)
+
+    def test_single_sample(self):
+        self._assert_sql_matches_python([[412345.67]])
+
+    def test_odd_sample_size(self):
+        self._assert_sql_matches_python([[510000.1, 320000.7, 450000.3, 610000.9, 380000.5]])
+
+    def test_even_sample_size(self):
+        self._assert_sql_matches_python([[510000.1, 320000.7, 450000.3, 610000.9, 380000.5, 401000.2]])
+
+    def test_duplicates(self):
+        self._assert_sql_matches_python([[400000.0, 400000.0, 400000.0, 450000.5, 450000.5, 300000.3, 400000.0]])
+
+    def test_samples_across_snapshots(self):
+        rng = random.Random(13)
+        groups = [[rng.uniform(150000, 900000) for _ in range(size)] for size in (37, 64, 1, 2)]
+        self._assert_sql_matches_python(groups)
+
+    def test_default_config_materializes_in_sql(self):
+        config = BenchmarkResolverConfig.from_env(self.env)
+        self.assertEqual(config.sample_storage, "raw")
+        self.assertTrue(config.sql_percentiles)
+
+        materializer = Factory.create_materializer(self.env)
+        key = (self.env["estate.city"].create({"name": "Тестовый город"}).id, None, "apartment", None)
+        rows = {key: (None, None)}
+        with (
+            patch.object(BenchmarkMaterializer, "_aggregate_in_sql", autospec=True, return_value=rows) as sql,
+            patch.object(BenchmarkMaterializer, "_aggregate_in_python", autospec=True) as python,
+            patch.object(BenchmarkMaterializer, "_aggregate_sketches", autospec=True) as sketches,
+        ):
+            materializer.materialize_many([key])
+        sql.assert_called_once_with(materializer, [key])
+        python.assert_not_called()
+        sketches.assert_not_called()
@@ -0,0 +1,147 @@
+import json
+import threading
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from odoo import fields
+from odoo.addons.estate_kit.src.property.services.ai_scoring.scoring_request import ScoringRequest
+from odoo.addons.estate_kit.src.property.services.scoring_batch.service import ScoringBatchService
+from odoo.addons.estate_kit.src.shared.services.ai_client import Factory as AiClientFactory
+from odoo.tests import TransactionCase, tagged
+
+_BATCHES_PATH = "/v1/messages/batches"
+
+
+class _FakeBatchApi(BaseHTTPRequestHandler):
+    """Эмулирует create/status/results эндпоинты Message Batches API."""
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        batch_id = "msgbatch_%d" % (len(self.server.batches) + 1)
+        self.server.batches[batch_id] = {
+            "status": "in_progress",
+            "custom_ids": [request["custom_id"] for request in payload["requests"]],
+        }
+        self._reply(200, {"id": batch_id, "processing_status": "in_progress"})
+
+    def do_GET(self):
+        path = self.path[len(_BATCHES_PATH) + 1:]
+        batch_id, _, tail = path.partition("/")
+        batch = self.server.batches.get(batch_id)
+        if batch is None:
+            self._reply(404, {"type": "error", "error": {"type": "not_found_error"}})
+        elif tail == "results":
+            lines = [
+                json.dumps({
+                    "custom_id": custom_id,
+                    "result": {"type": "succeeded", "message": {"content": [{"text": "ответ %s" % custom_id}]}},
+                })
+                for custom_id in batch["custom_ids"]
+            ]
+            self._send(200, "\n".join(lines).encode())
+        else:
+            self._reply(200, {"id": batch_id, "processing_status": batch["status"]})
+
+    def _reply(self, status: int, data: dict) -> None:
+        self._send(status, json.dumps(data).encode())
+
+    def _send(self, status: int, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _FakeAiScoring:
+    def __init__(self):
+        self.applied: dict[int, str | None] = {}
+
+    def build_request(self, property_id: int) -> ScoringRequest:
+        return ScoringRequest(system_prompt="system", user_message="объект %d" % property_id)
+
+    def apply_response(self, property_id, request, response_text, remember=True):
+        self.applied[property_id] = response_text
+
+
+class _FakeMarketingPool:
+    def update_many(self, properties) -> None:
+        pass
+
+    def cached_response(self, system_prompt: str, user_message: str) -> str | None:
+        return None
+
+
+@tagged("post_install", "-at_install")
+class TestScoringBatch(TransactionCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeBatchApi)
+        cls.server.batches = {}
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.addClassCleanup(cls.server.server_close)
+        cls.addClassCleanup(cls.server.shutdown)
+
+    def setUp(self):
+        super().setUp()
+        self.server.batches.clear()
+        self.patch(self.env.cr, "commit", lambda: None)
+        config = self.env["ir.config_parameter"].sudo()
+        config.set_param("estate_kit.anthropic_api_key", "test-key")
+        config.set_param("estate_kit.anthropic_base_url", "http://127.0.0.1:%d" % self.server.server_port)
+        self.ai_scoring = _FakeAiScoring()
+        self.service = ScoringBatchService(
+            ai_scoring=self.ai_scoring,
+            batch_client=AiClientFactory.create_batch(self.env),
+            marketing_pool=_FakeMarketingPool(),
+            env=self.env,
+        )
+        self.property = self.env["estate.property"].create({"name": "Квартира для пакета"})
+        self.assertTrue(self.service.submit([self.property.id]))
+        self.batch_id = self._param("estate_kit.scoring_batch_id")
+
+    def _param(self, key: str) -> str:
+        return self.env["ir.config_parameter"].sudo().get_param(key) or ""
+
+    def _items(self):
+        return self.env["estate.property.scoring.batch.item"].sudo().search([("batch_id", "=", self.batch_id)])
+
+    def _assert_batch_cleared(self):
+        self.assertFalse(self._param("estate_kit.scoring_batch_id"))
+        self.assertFalse(self._param("estate_kit.scoring_batch_submitted_at"))
+        self.assertFalse(self._items())
+
+    def test_submit_records_batch(self):
+        self.assertIn(self.batch_id, self.server.batches)
+        self.assertTrue(self._param("estate_kit.scoring_batch_submitted_at"))
+        self.assertEqual(self._items().property_id, self.property)
+
+    def test_poll_keeps_batch_in_progress(self):
+        self.service.poll()
+        self.assertEqual(self._param("estate_kit.scoring_batch_id"), self.batch_id)
+        self.assertTrue(self._items())
+        self.assertFalse(self.ai_scoring.applied)
+
+    def test_poll_applies_ended_batch(self):
+        self.server.batches[self.batch_id]["status"] = "ended"
+        self.service.poll()
+        self.assertEqual(self.ai_scoring.applied, {self.property.id: "ответ property-%d" % self.property.id})
+        self._assert_batch_cleared()
+
+    def test_poll_drops_deleted_batch(self):
+        del self.server.batches[self.batch_id]
+        self.service.poll()
+        self.assertFalse(self.ai_scoring.applied)
+        self._assert_batch_cleared()
+
+    def test_poll_drops_overdue_batch(self):
+        submitted_at = fields.Datetime.now() - timedelta(hours=72)
+        self.env["ir.config_parameter"].sudo().set_param(
+            "estate_kit.scoring_batch_submitted_at", fields.Datetime.to_string(submitted_at),
+        )
+        self.service.poll()
+        self.assertFalse(self.ai_scoring.applied)
+        self._assert_batch_cleared()
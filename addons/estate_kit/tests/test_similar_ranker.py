@@ -0,0 +1,107 @@
+import random
+from types import SimpleNamespace
+
+from odoo.addons.estate_kit.src.property.services.similar_picker.candidate_columns import CandidateColumns
+from odoo.addons.estate_kit.src.property.services.similar_picker.config import DEFAULT_CONFIG, RESIDENTIAL_TYPES
+from odoo.addons.estate_kit.src.property.services.similar_picker.proximity_calculator import ProximityCalculator
+from odoo.addons.estate_kit.src.property.services.similar_picker.ranker import Ranker
+from odoo.addons.estate_kit.src.property.services.similar_picker.similarity_scorer import SimilarityScorer
+from odoo.tests import BaseCase, tagged
+
+
+def _scalar_score(prop, row: dict) -> float:
+    """Поштучный score до перехода на колонки — эталон для сравнения."""
+    cfg = DEFAULT_CONFIG
+    proximity = ProximityCalculator()
+    total = 0.0
+    if prop.district_id and row["district_id"] == prop.district_id.id:
+        total += cfg.same_district_weight
+    total += proximity.calculate(prop.price, row["price"], cfg.price_tolerance, cfg.price_weight)
+    total += proximity.calculate(prop.area_total, row["area_total"], cfg.area_tolerance, cfg.area_weight)
+    if prop.property_type in RESIDENTIAL_TYPES and prop.rooms:
+        diff = abs(row["rooms"] - prop.rooms)
+        if diff <= cfg.rooms_tolerance:
+            total += cfg.rooms_weight * (1 - diff / (cfg.rooms_tolerance + 1))
+        else:
+            total -= cfg.rooms_weight
+    return total
+
+
+def _scalar_rank(prop, rows: list[dict], limit: int) -> list[int]:
+    scored = sorted(rows, key=lambda row: _scalar_score(prop, row), reverse=True)
+    return [row["id"] for row in scored[:limit]]
+
+
+def _normalized(row: dict) -> dict:
+    # search_read отдаёт False для пустых полей; CandidateRow.from_read приводил их так же
+    return {
+        "district_id": row["district_id"] or None,
+        "price": row["price"] or 0.0,
+        "area_total": row["area_total"] or 0.0,
+        "rooms": row["rooms"] or 0,
+    }
+
+
+@tagged("post_install", "-at_install")
+class TestSimilarRanker(BaseCase):
+    def setUp(self):
+        super().setUp()
+        self.ranker = Ranker(SimilarityScorer(DEFAULT_CONFIG, ProximityCalculator()))
+        self.rng = random.Random(20260101)
+
+    def _prop(self, **values):
+        district_id = values.pop("district_id", None)
+        return SimpleNamespace(district_id=SimpleNamespace(id=district_id or False), **values)
+
+    def _random_prop(self):
+        return self._prop(
+            district_id=self.rng.choice([None, 1, 2]),
+            price=self.rng.choice([0.0, 20_000_000.0, 35_000_000.0]),
+            area_total=self.rng.choice([0.0, 45.0, 70.0]),
+            property_type=self.rng.choice(["apartment", "house", "commercial"]),
+            rooms=self.rng.choice([0, 1, 2, 3]),
+        )
+
+    def _random_rows(self, count: int) -> list[dict]:
+        # Значения из коротких списков дают много равных очков — проверяется и порядок при ничьих
+        return [
+            {
+                "id": record_id,
+                "district_id": self.rng.choice([False, 1, 2, 3]),
+                "price": self.rng.choice([False, 0.0, 18_000_000.0, 20_000_000.0, 25_000_000.0, 35_000_000.0]),
+                "area_total": self.rng.choice([False, 0.0, 40.0, 45.0, 60.0, 70.0]),
+                "rooms": self.rng.choice([False, 0, 1, 2, 3, 5]),
+            }
+            for record_id in self.rng.sample(range(1, 10_000), count)
+        ]
+
+    def _assert_same_ranking(self, prop, rows: list[dict], limit: int):
+        expected = _scalar_rank(prop, [dict(row, **_normalized(row)) for row in rows], limit)
+        self.assertEqual(self.ranker.rank(prop, CandidateColumns.from_read(rows), limit), expected)
+
+    def test_matches_scalar_ranking_on_random_candidates(self):
+        for _ in range(300):
+            prop = self._random_prop()
+            rows = self._random_rows(self.rng.randint(0, 60))
+            self._assert_same_ranking(prop, rows, self.rng.choice([1, 6, 12, 100]))
+
+    def test_ties_keep_candidate_order(self):
+        prop = self._prop(district_id=1, price=20_000_000.0, area_total=45.0, property_type="apartment", rooms=2)
+        rows = [
+            {"id": record_id, "district_id": 1, "price": 20_000_000.0, "area_total": 45.0, "rooms": 2}
+            for record_id in (7, 3, 9, 1)
+        ]
+
+        self.assertEqual(self.ranker.rank(prop, CandidateColumns.from_read(rows), 3), [7, 3, 9])
+        self._assert_same_ranking(prop, rows, 3)
+
+    def test_zero_price_and_area_score_neutral(self):
+        prop = self._prop(price=0.0, area_total=0.0, property_type="land", rooms=0)
+        rows = [
+            {"id": 1, "district_id": False, "price": 10_000_000.0, "area_total": 0.0, "rooms": 0},
+            {"id": 2, "district_id": False, "price": 0.0, "area_total": 600.0, "rooms": 0},
+        ]
+
+        self.assertEqual(self.ranker.rank(prop, CandidateColumns.from_read(rows), 12), [1, 2])
+        self._assert_same_ranking(prop, rows, 12)
+
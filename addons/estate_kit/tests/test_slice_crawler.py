@@ -0,0 +1,101 @@
+from pathlib import Path
+
+import requests
+from odoo.addons.estate_kit.src.market_snapshot.services.snapshot_collector.listing_url_builder import (
+    ListingUrlBuilder,
+)
+from odoo.addons.estate_kit.src.market_snapshot.services.snapshot_collector.slice_crawler import SliceCrawler
+from odoo.addons.estate_kit.src.market_snapshot.services.snapshot_collector.slice_target import SliceTarget
+from odoo.addons.estate_kit.src.property.services.krisha_scraping import (
+    HtmlFallbackParser,
+    ListingPageParser,
+    PriceParser,
+    RoomsExtractor,
+)
+from odoo.tests import BaseCase, tagged
+
+_LISTING_PAGE = (Path(__file__).parent / "fixtures" / "krisha_listing_page.html").read_text(encoding="utf-8")
+
+
+class _FixtureSession:
+    """Отдаёт сохранённую страницу выдачи вместо похода на krisha.kz."""
+
+    def __init__(self, pages: list[str | Exception]) -> None:
+        self._pages = pages
+        self.urls: list[str] = []
+
+    def get_text(self, url: str) -> str:
+        self.urls.append(url)
+        page = self._pages[min(len(self.urls), len(self._pages)) - 1]
+        if isinstance(page, Exception):
+            raise page
+        return page
+
+    def get_bytes(self, url: str) -> bytes:
+        return self.get_text(url).encode()
+
+
+def _target(district_krisha_name: str | None = "Алмалинский р-н", rooms: int = 2) -> SliceTarget:
+    return SliceTarget(
+        config_id=1,
+        city_id=1,
+        city_code="almaty",
+        district_id=1 if district_krisha_name else None,
+        district_krisha_name=district_krisha_name,
+        property_type="apartment",
+        rooms=rooms,
+        max_pages=3,
+    )
+
+
+@tagged("post_install", "-at_install")
+class TestSliceCrawler(BaseCase):
+    def setUp(self):
+        super().setUp()
+        self.parser = ListingPageParser(HtmlFallbackParser(RoomsExtractor(), PriceParser()))
+
+    def _crawl(self, session: _FixtureSession, target: SliceTarget):
+        return SliceCrawler(lambda: session, self.parser, ListingUrlBuilder()).crawl(target)
+
+    def test_parser_reads_listing_cards(self):
+        items = {item["krisha_id"]: item for item in self.parser.parse(_LISTING_PAGE)}
+
+        self.assertEqual(sorted(items), [1001, 1002, 1003, 1004, 1005])
+        self.assertEqual(items[1001]["price"], 30_000_000)
+        self.assertEqual(items[1001]["area"], 60.0)
+        self.assertEqual(items[1001]["rooms"], 2)
+        self.assertEqual(items[1001]["address_title"], "Алмалинский р-н, Абая 10")
+        self.assertEqual(items[1001]["url"], "https://krisha.kz/a/show/1001")
+        self.assertEqual(items[1002]["area"], 50.5)
+        self.assertEqual(items[1003]["rooms"], 3)
+        self.assertEqual(items[1004]["price"], 0)
+
+    def test_crawl_matches_district_rooms_and_price(self):
+        session = _FixtureSession([_LISTING_PAGE])
+        result = self._crawl(session, _target())
+
+        # 1002 — другой район, 1003 — 3 комнаты, 1004 — без цены; район сравнивается без учёта регистра
+        self.assertIsNone(result.error)
+        self.assertEqual(result.listings_seen, 5)
+        self.assertEqual(result.samples_per_sqm, [500_000.0, 500_000.0])
+        # Вторая страница повторяет первую — обход останавливается, не доходя до max_pages
+        self.assertEqual(len(session.urls), 2)
+        self.assertIn("page=2", session.urls[1])
+
+    def test_crawl_without_district_keeps_all_districts(self):
+        result = self._crawl(_FixtureSession([_LISTING_PAGE]), _target(district_krisha_name=None))
+
+        self.assertEqual(result.samples_per_sqm, [500_000.0, 500_000.0, 500_000.0])
+
+    def test_network_error_marks_slice_failed(self):
+        session = _FixtureSession([_LISTING_PAGE, requests.ConnectionError("connection reset")])
+        result = self._crawl(session, _target())
+
+        self.assertEqual(result.error, "connection reset")
+        self.assertEqual(result.samples_per_sqm, [500_000.0, 500_000.0])
+
+    def test_programming_error_is_not_swallowed(self):
+        session = _FixtureSession([RuntimeError("bug")])
+
+        with self.assertRaises(RuntimeError):
+            self._crawl(session, _target())